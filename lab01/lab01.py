@@ -3,6 +3,33 @@ import time
 import random
 import matplotlib.pyplot as plt
 import math
+import multiprocessing
+import os
+import socket
+import tempfile
+import json
+import functools
+import numpy as np
+
+from static_index import StaticSortedIndex
+from mmap_search import MmapSortedArray, write_sorted_keys, drop_page_cache, fence_path
+from learned_index import LearnedIndex
+import set_operations
+from lookup_server import LookupClient, run_server
+from parallel_search import ParallelScanner
+
+# Размеры массивов для тестирования
+SIZES = [1000, 2000, 5000, 10000, 20000, 50000, 100000, 200000, 500000, 1000000]
+
+# Целочисленные типы ключей: int Python и целые скаляры NumPy
+INTEGER_TYPES = (int, np.integer)
+
+# Файл с порогами переключения методов поиска, откалиброванными на этой машине
+THRESHOLDS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'search_thresholds.json')
+_thresholds = None
+# Последнее решение search(): (ключ массива, функция поиска). Сам массив
+# не хранится, чтобы кэш не удерживал его в памяти
+_last_dispatch = (None, None)
 
 
 def linear_search(arr, target):
@@ -47,6 +74,514 @@ def binary_search(arr, target):
     # Общая сложность: O(log n)
 
 
+def interpolation_search(arr, target):
+    """
+    Интерполяционный поиск в отсортированном массиве чисел.
+    Позиция пробы оценивается линейной интерполяцией между границами.
+    Если два интерполяционных шага подряд сузили диапазон меньше чем вдвое,
+    следующий шаг делается делением пополам - это защищает от деградации
+    до O(n) на неравномерных данных.
+    Возвращает индекс target или -1, если не найден.
+    Сложность: O(log log n) для равномерно распределённых ключей,
+    O(log n) в худшем случае.
+    """
+    left = 0
+    right = len(arr) - 1
+    slow_steps = 0
+    while left <= right:
+        width = right - left
+        left_value = arr[left]
+        right_value = arr[right]
+        # O(1) - цель вне диапазона [arr[left], arr[right]]
+        if target < left_value or target > right_value:
+            return -1
+        if left_value == right_value:
+            return left if left_value == target else -1
+        if slow_steps >= 2:
+            # O(1) - страховочный шаг бинарного поиска
+            pos = (left + right) // 2
+            slow_steps = 0
+        else:
+            # O(1) - оценка позиции по линейной модели распределения.
+            # Целые ключи переводятся в int Python (без переполнения int64),
+            # для дробных позиция округляется вниз; результат - в [left, right]
+            if isinstance(left_value, INTEGER_TYPES) and isinstance(target, INTEGER_TYPES):
+                pos = left + (int(target) - int(left_value)) * width // (int(right_value) - int(left_value))
+            else:
+                pos = left + int((target - left_value) * width / (right_value - left_value))
+            pos = min(max(pos, left), right)
+        value = arr[pos]
+        if value == target:
+            return pos
+        elif value < target:
+            left = pos + 1
+        else:
+            right = pos - 1
+        slow_steps = slow_steps + 1 if (right - left) * 2 > width else 0
+    return -1
+    # Общая сложность: O(log log n) в среднем, O(log n) в худшем случае
+
+
+def exponential_search(arr, target):
+    """
+    Экспоненциальный (галопирующий) поиск в отсортированном массиве.
+    Граница диапазона удваивается от начала массива, затем выполняется
+    бинарный поиск внутри найденного диапазона.
+    Возвращает индекс target или -1, если не найден.
+    Сложность: O(log i), где i - позиция target (выгодно для элементов в начале).
+    """
+    n = len(arr)
+    if n == 0:
+        return -1
+    if arr[0] == target:
+        return 0
+    # O(log i) - удвоение границы, пока arr[bound] < target
+    bound = 1
+    while bound < n and arr[bound] < target:
+        bound *= 2
+    # O(log i) - бинарный поиск в диапазоне (bound // 2, min(bound, n - 1)]
+    left = bound // 2 + 1
+    right = min(bound, n - 1)
+    while left <= right:
+        mid = (left + right) // 2
+        if arr[mid] == target:
+            return mid
+        elif arr[mid] > target:
+            right = mid - 1
+        else:
+            left = mid + 1
+    return -1
+    # Общая сложность: O(log i)
+
+
+def choose_search_mode(arr, sample_size=16, tolerance=0.05):
+    """
+    Выбор режима поиска по небольшой выборке из отсортированного массива.
+    Выборка берётся в равноотстоящих позициях и сравнивается с прямой
+    между arr[0] и arr[-1]: если отклонение не больше tolerance от диапазона
+    значений, ключи считаются равномерными и выбирается 'interpolation',
+    иначе - 'binary'.
+    Сложность: O(sample_size).
+    """
+    n = len(arr)
+    if n < 2 * sample_size:
+        return 'binary'
+    first = arr[0]
+    span = arr[n - 1] - first
+    if span <= 0:
+        return 'binary'
+    # O(k) - отклонения выборки от линейной модели, нормированные на диапазон
+    deviations = []
+    for i in range(1, sample_size):
+        pos = i * (n - 1) // sample_size
+        expected = first + span * pos / (n - 1)
+        deviations.append((arr[pos] - expected) / span)
+    if max(abs(d) for d in deviations) <= tolerance:
+        return 'interpolation'
+    return 'binary'
+
+
+SEARCH_MODES = {
+    'binary': binary_search,
+    'interpolation': interpolation_search,
+    'exponential': exponential_search,
+}
+
+
+def adaptive_search(arr, target, mode=None, front_fraction=16):
+    """
+    Поиск с автоматическим выбором режима (см. choose_search_mode).
+    Для многократного поиска по одному массиву режим лучше выбрать один раз
+    и передать через mode, чтобы не повторять выборку.
+    Если режим не интерполяционный и target не больше элемента на позиции
+    n // front_fraction, используется экспоненциальный поиск: цель лежит
+    в начале массива, и O(log i) выгоднее O(log n).
+    Возвращает индекс target или -1, если не найден.
+    """
+    if mode is None:
+        mode = choose_search_mode(arr)
+    n = len(arr)
+    if mode != 'interpolation' and n > 0 and target <= arr[n // front_fraction]:
+        return exponential_search(arr, target)
+    return SEARCH_MODES[mode](arr, target)
+
+
+class CountingArray:
+    """
+    Обёртка над последовательностью, считающая обращения по индексу.
+    Используется для подсчёта числа проб (чтений элементов) при поиске.
+    """
+
+    def __init__(self, data):
+        self.data = data
+        self.probes = 0
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, index):
+        self.probes += 1
+        return self.data[index]
+
+
+def lower_bound(arr, target):
+    """
+    Индекс первого элемента, не меньшего target (len(arr), если такого нет).
+    В массиве с повторами указывает на первое вхождение target.
+    Сложность: O(log n).
+    """
+    left = 0
+    right = len(arr)
+    while left < right:
+        mid = (left + right) // 2
+        if arr[mid] < target:
+            left = mid + 1
+        else:
+            right = mid
+    return left
+
+
+def upper_bound(arr, target):
+    """
+    Индекс первого элемента, строго большего target (len(arr), если такого нет).
+    Сложность: O(log n).
+    """
+    left = 0
+    right = len(arr)
+    while left < right:
+        mid = (left + right) // 2
+        if arr[mid] <= target:
+            left = mid + 1
+        else:
+            right = mid
+    return left
+
+
+def equal_range(arr, target):
+    """
+    Полуинтервал [first, last) всех вхождений target в отсортированный массив.
+    Если target отсутствует, first == last - позиция для вставки.
+    Сложность: O(log n).
+    """
+    return lower_bound(arr, target), upper_bound(arr, target)
+
+
+def count_in_range(arr, lo, hi):
+    """
+    Количество элементов x отсортированного массива с lo <= x < hi.
+    Сложность: O(log n) - без просмотра самих элементов диапазона.
+    """
+    return max(0, lower_bound(arr, hi) - lower_bound(arr, lo))
+
+
+def iter_range(arr, lo, hi):
+    """
+    Генератор элементов x отсортированного массива с lo <= x < hi.
+    Срез не создаётся: элементы отдаются по одному по мере обхода.
+    Сложность: O(log n + k), где k - число элементов в диапазоне.
+    """
+    start = lower_bound(arr, lo)
+    n = len(arr)
+    while start < n:
+        value = arr[start]
+        if value >= hi:
+            return
+        yield value
+        start += 1
+
+
+def batch_equal_range(sorted_arr, targets):
+    """
+    Пакетный equal_range для массива целей.
+    Возвращает: (firsts, lasts) - два np.ndarray границ полуинтервалов.
+    Сложность: O(m log n) внутри NumPy.
+    """
+    sorted_arr = np.asarray(sorted_arr)
+    targets = np.asarray(targets)
+    return (np.searchsorted(sorted_arr, targets, side='left'),
+            np.searchsorted(sorted_arr, targets, side='right'))
+
+
+def batch_count_in_range(sorted_arr, los, his):
+    """
+    Пакетный count_in_range: количество элементов в каждом [los[i], his[i]).
+    Возвращает: np.ndarray int64 длины m.
+    Сложность: O(m log n) внутри NumPy.
+    """
+    sorted_arr = np.asarray(sorted_arr)
+    starts = np.searchsorted(sorted_arr, np.asarray(los), side='left')
+    ends = np.searchsorted(sorted_arr, np.asarray(his), side='left')
+    return np.maximum(ends - starts, 0).astype(np.int64, copy=False)
+
+
+def batch_binary_search(sorted_arr, targets):
+    """
+    Пакетный бинарный поиск сразу для массива целевых значений.
+    sorted_arr - отсортированный массив (NumPy или последовательность),
+    targets - массив искомых значений.
+    Возвращает: np.ndarray индексов (int64), -1 для отсутствующих значений.
+    Сложность: O(m log n), где m - число целей, n - длина массива;
+    весь цикл выполняется внутри NumPy (np.searchsorted).
+    """
+    sorted_arr = np.asarray(sorted_arr)
+    targets = np.asarray(targets)
+    n = sorted_arr.size
+    if n == 0:
+        return np.full(targets.shape, -1, dtype=np.int64)
+    # O(m log n) - позиции левой границы для всех целей за один вызов
+    idx = np.searchsorted(sorted_arr, targets, side='left')
+    # O(m) - индекс n заменяется на n - 1, чтобы обращение не вышло за границу
+    safe_idx = np.minimum(idx, n - 1)
+    found = (idx < n) & (sorted_arr[safe_idx] == targets)
+    return np.where(found, idx, -1).astype(np.int64, copy=False)
+    # Общая сложность: O(m log n)
+
+
+def batch_membership(arr, targets):
+    """
+    Векторизованная проверка принадлежности для неотсортированного массива.
+    Возвращает: np.ndarray bool - маска, True для целей, присутствующих в arr.
+    Сложность: O((n + m) log(n + m)) - сортировка внутри np.isin.
+    """
+    # O((n + m) log(n + m)) - np.isin сортирует объединение массивов
+    return np.isin(np.asarray(targets), np.asarray(arr))
+
+
+def vectorized_search(arr, target):
+    """
+    Линейный поиск одним векторизованным сравнением NumPy.
+    Возвращает индекс первого вхождения target или -1.
+    Сложность: O(n), но без накладных расходов интерпретатора на элемент.
+    """
+    hits = np.flatnonzero(np.asarray(arr) == target)
+    return int(hits[0]) if hits.size else -1
+
+
+def vectorized_sorted_search(arr, target):
+    """
+    Поиск в отсортированном массиве NumPy через np.searchsorted.
+    Возвращает индекс первого вхождения target или -1.
+    Сложность: O(log n).
+    """
+    index = int(np.searchsorted(arr, target))
+    if index < len(arr) and arr[index] == target:
+        return index
+    return -1
+
+
+def _looks_uniform(arr, tolerance=0.05):
+    """
+    Быстрая проверка равномерности для search(): три квартиля массива
+    сравниваются с прямой между arr[0] и arr[-1]. Дешевле choose_search_mode,
+    поэтому выполняется при каждом вызове; ошибка оценки не опасна, так как
+    interpolation_search не деградирует хуже O(log n).
+    Сложность: O(1).
+    """
+    n = len(arr)
+    if n < 8:
+        return False
+    first = arr[0]
+    span = arr[n - 1] - first
+    if span <= 0:
+        return False
+    limit = tolerance * span
+    for pos in (n // 4, n // 2, 3 * n // 4):
+        if abs(arr[pos] - first - span * pos / (n - 1)) > limit:
+            return False
+    return True
+
+
+def _mean_search_time(search_func, arr, targets, repeat=3, **kwargs):
+    """
+    Среднее время одного поиска по списку целей (в секундах),
+    лучшее из repeat прогонов - для устойчивости к шуму.
+    kwargs передаются в search_func напрямую, без обёртки.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        if kwargs:
+            for target in targets:
+                search_func(arr, target, **kwargs)
+        else:
+            for target in targets:
+                search_func(arr, target)
+        best = min(best, time.perf_counter() - start_time)
+    return best / len(targets)
+
+
+def _find_crossover(small_func, large_func, make_array, sizes, rng, num_targets=200):
+    """
+    Наименьший размер из sizes, начиная с которого large_func быстрее
+    small_func. Если такого нет - удвоенный наибольший размер.
+    """
+    for size in sizes:
+        arr = make_array(size)
+        targets = rng.integers(0, 2 * size, size=num_targets).tolist()
+        if _mean_search_time(large_func, arr, targets) < _mean_search_time(small_func, arr, targets):
+            return size
+    return 2 * sizes[-1]
+
+
+def _ordered_thresholds(thresholds):
+    """
+    Согласование порогов: на списках меньше list_binary_min используется
+    линейный поиск, поэтому list_interpolation_min не может быть меньше.
+    """
+    thresholds = dict(thresholds)
+    thresholds['list_interpolation_min'] = max(thresholds['list_interpolation_min'],
+                                               thresholds['list_binary_min'])
+    return thresholds
+
+
+def calibrate_thresholds(path=THRESHOLDS_FILE, seed=0):
+    """
+    Калибровка порогов для search() микро-замерами на этой машине.
+    Массивы содержат чётные числа, половина целей отсутствует.
+    Пороги:
+    - list_binary_min - с какого размера отсортированного списка
+      binary_search быстрее linear_search;
+    - list_interpolation_min - с какого размера равномерного списка
+      интерполяционный поиск быстрее бинарного (проверка равномерности
+      в search() кэшируется и в замер не входит);
+    - array_searchsorted_min - с какого размера отсортированного ndarray
+      np.searchsorted быстрее binary_search;
+    - array_scan_min - с какого размера неотсортированного ndarray
+      векторизованный просмотр быстрее linear_search.
+    Порог интерполяционного поиска не меньше порога бинарного: интерполяция
+    заменяет бинарный поиск, а не линейный.
+    Результат сохраняется в JSON-файл path (если path не None).
+    Возвращает: dict порогов.
+    """
+    rng = np.random.default_rng(seed)
+    sizes = [2 ** k for k in range(2, 17)]
+
+    def sorted_list(size):
+        return list(range(0, 2 * size, 2))
+
+    def sorted_array(size):
+        return np.arange(0, 2 * size, 2)
+
+    def unsorted_array(size):
+        return rng.permutation(sorted_array(size))
+
+    thresholds = {
+        'list_binary_min': _find_crossover(linear_search, binary_search,
+                                           sorted_list, sizes, rng),
+        'list_interpolation_min': _find_crossover(binary_search, interpolation_search,
+                                                  sorted_list, sizes, rng),
+        'array_searchsorted_min': _find_crossover(binary_search, vectorized_sorted_search,
+                                                  sorted_array, sizes, rng),
+        'array_scan_min': _find_crossover(linear_search, vectorized_search,
+                                          unsorted_array, sizes, rng),
+    }
+    thresholds = _ordered_thresholds(thresholds)
+    if path is not None:
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(thresholds, f, indent=2)
+        except OSError:
+            # Каталог только для чтения: пороги останутся в памяти процесса
+            pass
+    return thresholds
+
+
+def get_thresholds(path=THRESHOLDS_FILE):
+    """
+    Пороги для search(): из памяти, из кэша path или новой калибровкой.
+    Калибровка выполняется один раз, результат кэшируется в файл.
+    """
+    global _thresholds
+    if _thresholds is None:
+        try:
+            with open(path, encoding='utf-8') as f:
+                loaded = json.load(f)
+            if set(loaded) >= {'list_binary_min', 'list_interpolation_min',
+                               'array_searchsorted_min', 'array_scan_min'}:
+                _thresholds = _ordered_thresholds(loaded)
+        except (OSError, ValueError):
+            pass
+        if _thresholds is None:
+            _thresholds = calibrate_thresholds(path)
+    return _thresholds
+
+
+def choose_search(arr, sorted=None):
+    """
+    Выбор метода поиска для массива по его размеру, типу (список или
+    ndarray) и упорядоченности. Пороги переключения берутся из get_thresholds().
+    sorted=True разрешает логарифмические методы. При sorted=None массив
+    считается неотсортированным: проверка упорядоченности стоит O(n), столько
+    же, сколько сам линейный поиск.
+    - ndarray: binary_search или np.searchsorted (отсортированный),
+      linear_search или векторизованный просмотр (неотсортированный);
+    - список: linear_search для малых и неотсортированных, interpolation_search
+      для больших списков чисел с равномерным распределением, иначе binary_search.
+    Возвращает: функцию поиска f(arr, target).
+    Сложность: O(1).
+    """
+    thresholds = _thresholds or get_thresholds()
+    n = len(arr)
+    if isinstance(arr, np.ndarray):
+        if sorted:
+            if n >= thresholds['array_searchsorted_min']:
+                return vectorized_sorted_search
+            return binary_search
+        if n >= thresholds['array_scan_min']:
+            return vectorized_search
+        return linear_search
+    if not sorted or n < thresholds['list_binary_min']:
+        return linear_search
+    if (n >= thresholds['list_interpolation_min'] and isinstance(arr[0], (int, float))
+            and _looks_uniform(arr)):
+        return interpolation_search
+    return binary_search
+
+
+def bind_search(arr, sorted=None):
+    """
+    Метод поиска, выбранный один раз и привязанный к массиву:
+    bind_search(arr, sorted=True)(target). Основной (быстрый) путь для
+    многих поисков в одном массиве: вызов не тратит время на выбор метода
+    и отличается от прямого вызова лучшего метода только functools.partial.
+    Проверяется run_dispatcher_comparison.
+    """
+    return functools.partial(choose_search(arr, sorted), arr)
+
+
+def _dispatch_key(arr, sorted):
+    # Всё, от чего зависит корректность выбранного метода: тип контейнера,
+    # тип элементов (dtype), длина и флаг sorted. id(arr) отличает массивы,
+    # но без ссылки на объект: при повторном использовании id другим
+    # массивом с тем же ключом решение остаётся корректным
+    if isinstance(arr, np.ndarray):
+        item_type = arr.dtype
+    else:
+        item_type = type(arr[0]) if len(arr) else None
+    return id(arr), type(arr), item_type, len(arr), sorted
+
+
+def search(arr, target, sorted=None):
+    """
+    Поиск с автоматическим выбором метода (см. choose_search).
+    Решение для последнего массива запоминается по ключу (id, тип, тип
+    элементов, длина, sorted) без ссылки на сам массив: повторный вызов
+    с тем же ключом сразу вызывает выбранный метод. Если массив изменён на
+    месте без изменения длины, устаревшее решение влияет только на
+    скорость: все методы дают верный ответ.
+    Каждый вызов всё же тратит время на построение ключа - для многих
+    поисков в одном массиве используйте bind_search.
+    Возвращает индекс target или -1, если не найден.
+    """
+    global _last_dispatch
+    key = _dispatch_key(arr, sorted)
+    last_key, func = _last_dispatch
+    if key != last_key:
+        func = choose_search(arr, sorted)
+        _last_dispatch = (key, func)
+    return func(arr, target)
+
+
 def measure_time(search_func, arr, target, number_of_calls=10):
     """
     Замеряет среднее время выполнения функции поиска.
@@ -68,8 +603,7 @@ def run_comparison():
     """
     Основная функция для проведения сравнительного анализа.
     """
-    # Определение размеров массивов для тестирования
-    sizes = [1000, 2000, 5000, 10000, 20000, 50000, 100000, 200000, 500000, 1000000]
+    sizes = SIZES
     
     # Списки для хранения результатов
     linear_times_best = []
@@ -141,6 +675,611 @@ def run_comparison():
     plt.savefig('search_complexity_analysis.png')
     plt.show()
 
+    run_batch_comparison()
+    run_distribution_comparison()
+    run_static_index_comparison()
+    run_mmap_comparison()
+    run_range_comparison()
+    run_learned_index_comparison()
+    run_set_operations_comparison()
+    run_lookup_server_comparison()
+    run_parallel_search_comparison()
+    run_dispatcher_comparison()
+
+
+def run_batch_comparison(sizes=(10**6, 10**7, 10**8), num_targets=10000, seed=0):
+    """
+    Сравнение поиска по одной цели в цикле с пакетным поиском.
+    Для каждого размера строится отсортированный NumPy-массив, половина целей
+    присутствует в массиве, половина - нет.
+    Возвращает: list[dict] - результаты замеров по каждому размеру.
+    """
+    rng = np.random.default_rng(seed)
+    results = []
+
+    print("Размер\t\tЦикл binary_search\tbatch_binary_search\tbatch_membership")
+    for size in sizes:
+        # O(n) - чётные числа, чтобы нечётные цели гарантированно отсутствовали
+        arr = np.arange(0, 2 * size, 2, dtype=np.int64)
+        targets = rng.integers(0, 2 * size, size=num_targets, dtype=np.int64)
+        target_list = targets.tolist()
+
+        # O(m log n) с накладными расходами интерпретатора на каждый шаг
+        start_time = time.perf_counter()
+        loop_result = [binary_search(arr, target) for target in target_list]
+        loop_time = time.perf_counter() - start_time
+
+        # O(m log n) внутри NumPy
+        start_time = time.perf_counter()
+        batch_result = batch_binary_search(arr, targets)
+        batch_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        batch_membership(arr, targets)
+        membership_time = time.perf_counter() - start_time
+
+        # Проверка совпадения результатов обоих способов
+        assert batch_result.tolist() == loop_result
+
+        results.append({
+            'size': size,
+            'loop_time': loop_time,
+            'batch_time': batch_time,
+            'membership_time': membership_time,
+        })
+        print(f"{size}\t{loop_time:.6f}\t\t{batch_time:.6f}\t\t{membership_time:.6f}")
+
+        del arr, targets
+
+    return results
+
+
+def generate_distribution(kind, size, rng):
+    """
+    Генерация отсортированного массива целых ключей заданного распределения:
+    'uniform' - равномерное, 'clustered' - несколько плотных кластеров,
+    'zipf' - распределение Ципфа (много малых ключей, длинный хвост),
+    'lognormal' - логнормальное (плотное начало, растянутый хвост).
+    Возвращает: np.ndarray int64.
+    """
+    if kind == 'uniform':
+        keys = rng.integers(0, 10 * size, size=size)
+    elif kind == 'clustered':
+        centers = rng.integers(0, 10 * size, size=8)
+        keys = rng.normal(rng.choice(centers, size=size), size / 1000).astype(np.int64)
+    elif kind == 'zipf':
+        keys = rng.zipf(1.5, size=size)
+    elif kind == 'lognormal':
+        keys = (rng.lognormal(0.0, 2.0, size=size) * size).astype(np.int64)
+    else:
+        raise ValueError(f"unknown distribution: {kind}")
+    keys.sort()
+    return keys
+
+
+def run_distribution_comparison(size=1000000, num_targets=2000, seed=0):
+    """
+    Сравнение режимов поиска (binary, interpolation, exponential, adaptive)
+    на равномерном, кластеризованном и Ципф-распределённом массивах.
+    Выводит среднее число проб и среднее время на один поиск.
+    Возвращает: dict {распределение: {режим: (пробы, время)}}.
+    """
+    rng = np.random.default_rng(seed)
+    results = {}
+
+    for kind in ('uniform', 'clustered', 'zipf'):
+        arr = generate_distribution(kind, size, rng).tolist()
+        # Цели - случайные элементы массива (лучший случай для поиска)
+        targets = [arr[i] for i in rng.integers(0, size, size=num_targets)]
+        mode = choose_search_mode(arr)
+        funcs = dict(SEARCH_MODES)
+        funcs['adaptive'] = lambda a, t: adaptive_search(a, t, mode)
+
+        print(f"\nРаспределение: {kind} (n={size}, adaptive -> {mode})")
+        print("Режим\t\tСредние пробы\tСреднее время (с)")
+        results[kind] = {}
+        for name, func in funcs.items():
+            counting = CountingArray(arr)
+            for target in targets:
+                func(counting, target)
+            avg_probes = counting.probes / num_targets
+
+            start_time = time.perf_counter()
+            for target in targets:
+                func(arr, target)
+            avg_time = (time.perf_counter() - start_time) / num_targets
+
+            results[kind][name] = (avg_probes, avg_time)
+            print(f"{name:<14}\t{avg_probes:.2f}\t\t{avg_time:.8f}")
+
+    return results
+
+
+def run_static_index_comparison(sizes=(10**5, 10**6, 10**7, 10**8), num_targets=10000,
+                                block_size=16, seed=0):
+    """
+    Сравнение binary_search со статическим индексом StaticSortedIndex
+    (Eytzinger-раскладка и блочная раскладка по block_size ключей).
+    Поиск по одной цели выполняется через memoryview буфера, чтобы все
+    варианты читали одни и те же числа без копирования в список.
+    Выводит среднее время одного поиска для скалярных и пакетных вариантов.
+    Возвращает: list[dict] - результаты замеров по каждому размеру.
+    """
+    rng = np.random.default_rng(seed)
+    results = []
+
+    print("\nРазмер\t\tbinary\t\teytzinger\tblocked\t\tsearchsorted\teytz. batch\tblocked batch")
+    for size in sizes:
+        arr = np.arange(0, 2 * size, 2, dtype=np.int64)
+        targets = rng.integers(0, 2 * size, size=num_targets, dtype=np.int64)
+        target_list = targets.tolist()
+        eytzinger = StaticSortedIndex(arr)
+        blocked = StaticSortedIndex(arr, block_size=block_size)
+        view = memoryview(arr)
+
+        timings = {}
+        for name, func in (('binary', lambda t: binary_search(view, t)),
+                           ('eytzinger', eytzinger.search),
+                           ('blocked', blocked.search)):
+            start_time = time.perf_counter()
+            for target in target_list:
+                func(target)
+            timings[name] = (time.perf_counter() - start_time) / num_targets
+
+        for name, func in (('searchsorted', lambda t: batch_binary_search(arr, t)),
+                           ('eytzinger_batch', eytzinger.search_many),
+                           ('blocked_batch', blocked.search_many)):
+            start_time = time.perf_counter()
+            func(targets)
+            timings[name] = (time.perf_counter() - start_time) / num_targets
+
+        results.append({'size': size, **timings})
+        print(f"{size}\t" + "\t".join(f"{value:.3e}" for value in timings.values()))
+
+        del arr, eytzinger, blocked, view
+
+    return results
+
+
+def measure_latencies(search_func, targets):
+    """
+    Замер времени каждого отдельного поиска.
+    Возвращает: (медиана, среднее) времени одного поиска в секундах.
+    """
+    latencies = []
+    for target in targets:
+        start_time = time.perf_counter()
+        search_func(target)
+        latencies.append(time.perf_counter() - start_time)
+    latencies.sort()
+    return latencies[len(latencies) // 2], sum(latencies) / len(latencies)
+
+
+def run_mmap_comparison(sizes=(10**6, 10**7, 10**8), num_targets=1000,
+                        chunk_size=10**6, directory=None, seed=0):
+    """
+    Поиск в отсортированном файле ключей через mmap: binary_search по всему
+    отображению против поиска с разреженным индексом MmapSortedArray.
+    Файл записывается частями по chunk_size ключей, массив целиком в память
+    не загружается. Перед "холодным" замером отображение закрывается,
+    страницы файла вытесняются из кэша ОС (если платформа это поддерживает)
+    и файл открывается заново; "тёплый" замер повторяет те же поиски. Выводит медиану и среднее время одного поиска.
+    Возвращает: list[dict] - результаты замеров по каждому размеру.
+    """
+    rng = np.random.default_rng(seed)
+    results = []
+
+    print("\nРазмер\t\tРежим\t\tХолодный кэш (медиана / среднее)\tТёплый кэш (медиана / среднее)")
+    with tempfile.TemporaryDirectory(dir=directory) as tmp_dir:
+        for size in sizes:
+            path = os.path.join(tmp_dir, f"keys_{size}.bin")
+            # O(n) - запись чётных ключей частями, чтобы нечётные цели отсутствовали
+            write_sorted_keys(path, (np.arange(2 * start, 2 * min(start + chunk_size, size), 2)
+                                     for start in range(0, size, chunk_size)))
+            targets = rng.integers(0, 2 * size, size=num_targets).tolist()
+
+            for name in ('binary_search', 'sparse index'):
+                # Страницы вытесняются, пока файл не отображён в память: отображённые
+                # страницы posix_fadvise не вытесняет. Индекс читается из файла-спутника,
+                # поэтому открытие не возвращает страницы файла ключей в кэш
+                cold_supported = drop_page_cache(path)
+                with MmapSortedArray(path) as keys:
+                    if name == 'binary_search':
+                        func = lambda t: binary_search(keys.view, t)
+                    else:
+                        func = keys.search
+                    cold = measure_latencies(func, targets)
+                    warm = measure_latencies(func, targets)
+                results.append({'size': size, 'mode': name, 'cold': cold,
+                                'warm': warm, 'cold_supported': cold_supported})
+                print(f"{size}\t{name:<14}\t{cold[0]:.3e} / {cold[1]:.3e}\t\t\t"
+                      f"{warm[0]:.3e} / {warm[1]:.3e}")
+            os.remove(path)
+            os.remove(fence_path(path))
+
+    return results
+
+
+def linear_count_in_range(arr, lo, hi):
+    """
+    Подсчёт элементов с lo <= x < hi линейным просмотром (для сравнения).
+    Сложность: O(n).
+    """
+    count = 0
+    for value in arr:
+        if lo <= value < hi:
+            count += 1
+    return count
+
+
+def run_range_comparison(sizes=SIZES, num_ranges=20, seed=0):
+    """
+    Сравнение запросов по диапазону с линейным просмотром.
+    Массив содержит повторы (значения из [0, n / 4)), диапазоны случайные.
+    Выводит среднее время одного запроса для линейного подсчёта,
+    count_in_range, полного обхода iter_range и пакетного batch_count_in_range.
+    Возвращает: list[dict] - результаты замеров по каждому размеру.
+    """
+    rng = np.random.default_rng(seed)
+    results = []
+
+    print("\nРазмер\t\tлинейный\tcount_in_range\titer_range\tbatch_count_in_range")
+    for size in sizes:
+        keys = np.sort(rng.integers(0, max(size // 4, 1), size=size))
+        arr = keys.tolist()
+        bounds = np.sort(rng.integers(0, max(size // 4, 1), size=(num_ranges, 2)), axis=1)
+        ranges = bounds.tolist()
+
+        timings = {}
+        counts = {}
+        for name, func in (('linear', linear_count_in_range),
+                           ('count_in_range', count_in_range),
+                           ('iter_range', lambda a, lo, hi: sum(1 for _ in iter_range(a, lo, hi)))):
+            start_time = time.perf_counter()
+            counts[name] = [func(arr, lo, hi) for lo, hi in ranges]
+            timings[name] = (time.perf_counter() - start_time) / num_ranges
+
+        start_time = time.perf_counter()
+        batch_counts = batch_count_in_range(keys, bounds[:, 0], bounds[:, 1])
+        timings['batch'] = (time.perf_counter() - start_time) / num_ranges
+
+        # Все способы должны давать одинаковые ответы
+        assert counts['linear'] == counts['count_in_range'] == counts['iter_range'] == batch_counts.tolist()
+
+        results.append({'size': size, **timings})
+        print(f"{size}\t\t" + "\t".join(f"{value:.3e}" for value in timings.values()))
+
+    return results
+
+
+def run_learned_index_comparison(size=10**7, num_targets=10000, segment_size=1024,
+                                 max_error=64, seed=0):
+    """
+    Сравнение LearnedIndex с binary_search и Eytzinger-раскладкой
+    StaticSortedIndex на равномерном, логнормальном и кластеризованном
+    распределениях ключей.
+    Выводит время построения, число сегментов и размер модели, максимальную
+    ошибку предсказания и среднее время одного поиска (по одному и пакетом).
+    Возвращает: dict {распределение: dict с характеристиками и замерами}.
+    """
+    rng = np.random.default_rng(seed)
+    results = {}
+
+    for kind in ('uniform', 'lognormal', 'clustered'):
+        keys = generate_distribution(kind, size, rng)
+        targets = keys[rng.integers(0, size, size=num_targets)]
+        target_list = targets.tolist()
+
+        start_time = time.perf_counter()
+        learned = LearnedIndex(keys, segment_size=segment_size, max_error=max_error)
+        build_time = time.perf_counter() - start_time
+        eytzinger = StaticSortedIndex(keys)
+        view = memoryview(keys)
+
+        timings = {}
+        for name, func in (('binary', lambda t: binary_search(view, t)),
+                           ('eytzinger', eytzinger.search),
+                           ('learned', learned.search)):
+            start_time = time.perf_counter()
+            for target in target_list:
+                func(target)
+            timings[name] = (time.perf_counter() - start_time) / num_targets
+
+        for name, func in (('searchsorted', lambda t: batch_binary_search(keys, t)),
+                           ('eytzinger_batch', eytzinger.search_many),
+                           ('learned_batch', learned.search_many)):
+            start_time = time.perf_counter()
+            func(targets)
+            timings[name] = (time.perf_counter() - start_time) / num_targets
+
+        results[kind] = {
+            'build_time': build_time,
+            'segments': learned.num_segments,
+            'model_bytes': learned.model_bytes,
+            'max_error': learned.max_error,
+            **timings,
+        }
+        print(f"\nРаспределение: {kind} (n={size})")
+        print(f"LearnedIndex: построение {build_time:.3f} с, сегментов {learned.num_segments}, "
+              f"модель {learned.model_bytes / 1024:.1f} KiB, макс. ошибка {learned.max_error}")
+        for name, value in timings.items():
+            print(f"{name:<16}\t{value:.3e} с на поиск")
+
+        del keys, learned, eytzinger, view
+
+    return results
+
+
+def run_set_operations_comparison(large_size=10**6, ratios=(1, 10, 100, 1000, 10**4),
+                                  num_lists=3, seed=0):
+    """
+    Сравнение способов пересечения и объединения отсортированных списков
+    идентификаторов при отношении длин от 1:1 до 1:10^4.
+    Самый короткий список имеет длину large_size / ratio, остальные
+    num_lists - 1 списков - длину large_size; идентификаторы выбираются
+    из диапазона [0, 4 * large_size).
+    Выводит время пересечения (merge, gallop, numpy, auto) и объединения
+    (merge, numpy).
+    Возвращает: list[dict] - результаты замеров по каждому отношению.
+    """
+    rng = np.random.default_rng(seed)
+    universe = 4 * large_size
+    results = []
+
+    def sorted_ids(size):
+        return np.unique(rng.integers(0, universe, size=size))
+
+    print("\nОтношение\tmerge\t\tgallop\t\tnumpy\t\tauto\t\tunion merge\tunion numpy")
+    for ratio in ratios:
+        arrays = [sorted_ids(max(large_size // ratio, 1))]
+        arrays += [sorted_ids(large_size) for _ in range(num_lists - 1)]
+        lists = [arr.tolist() for arr in arrays]
+
+        timings = {}
+        answers = []
+        for name, inputs, kwargs in (('merge', lists, {'method': 'merge'}),
+                                     ('gallop', lists, {'method': 'gallop'}),
+                                     ('numpy', arrays, {'method': 'numpy'}),
+                                     ('auto', arrays, {})):
+            start_time = time.perf_counter()
+            answer = set_operations.intersect(inputs, **kwargs)
+            timings[name] = time.perf_counter() - start_time
+            answers.append(list(answer))
+        assert all(answer == answers[0] for answer in answers)
+
+        for name, inputs in (('union_merge', lists), ('union_numpy', arrays)):
+            start_time = time.perf_counter()
+            set_operations.union(inputs, method=name.split('_')[1])
+            timings[name] = time.perf_counter() - start_time
+
+        results.append({'ratio': ratio, **timings})
+        print(f"1:{ratio}\t\t" + "\t".join(f"{value:.3e}" for value in timings.values()))
+
+    return results
+
+
+def _lookup_server_worker(socket_path, targets):
+    """
+    Рабочий процесс нагрузочного теста: поиск каждого ключа отдельным
+    запросом к LookupServer.
+    Возвращает: (задержки запросов, время начала, время окончания).
+    """
+    latencies = []
+    with LookupClient(socket_path) as client:
+        started = time.time()
+        for target in targets:
+            start_time = time.perf_counter()
+            client.lookup(target)
+            latencies.append(time.perf_counter() - start_time)
+        finished = time.time()
+    return latencies, started, finished
+
+
+def _in_memory_worker(keys_path, targets):
+    """
+    Базовый вариант: процесс загружает собственную копию массива
+    и ищет ключи функцией binary_search.
+    Возвращает: (задержки запросов, время начала, время окончания).
+    """
+    keys = np.fromfile(keys_path, dtype='<i8')
+    view = memoryview(keys)
+    latencies = []
+    started = time.time()
+    for target in targets:
+        start_time = time.perf_counter()
+        binary_search(view, target)
+        latencies.append(time.perf_counter() - start_time)
+    finished = time.time()
+    return latencies, started, finished
+
+
+def run_lookup_server_comparison(size=10**7, num_workers=4, requests_per_worker=2000,
+                                 window=0.0005, max_batch=4096, seed=0):
+    """
+    Нагрузочный тест LookupServer: num_workers процессов одновременно
+    отправляют одиночные запросы, сервер объединяет их в пакеты.
+    Базовый вариант - те же процессы с собственной копией массива в памяти.
+    Выводит p50/p99 задержки одного запроса и общую пропускную способность.
+    Требуется поддержка Unix-сокетов.
+    Возвращает: dict {вариант: (p50, p99, запросов в секунду)}.
+    """
+    if not hasattr(socket, 'AF_UNIX'):
+        print("\nUnix-сокеты не поддерживаются на этой платформе, тест сервера пропущен")
+        return {}
+    rng = np.random.default_rng(seed)
+    results = {}
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        keys_path = os.path.join(tmp_dir, "keys.bin")
+        socket_path = os.path.join(tmp_dir, "lookup.sock")
+        write_sorted_keys(keys_path, np.arange(0, 2 * size, 2, dtype=np.int64))
+        workloads = [rng.integers(0, 2 * size, size=requests_per_worker).tolist()
+                     for _ in range(num_workers)]
+
+        ready = multiprocessing.Event()
+        server = multiprocessing.Process(target=run_server,
+                                         args=(keys_path, socket_path, window, max_batch, ready))
+        server.start()
+        try:
+            if not ready.wait(30):
+                raise RuntimeError("lookup server did not start")
+            with multiprocessing.Pool(num_workers) as pool:
+                for name, worker, resource in (('server', _lookup_server_worker, socket_path),
+                                               ('in-memory', _in_memory_worker, keys_path)):
+                    outputs = pool.starmap(worker, [(resource, targets) for targets in workloads])
+                    latencies = np.concatenate([output[0] for output in outputs])
+                    wall_time = max(output[2] for output in outputs) - min(output[1] for output in outputs)
+                    results[name] = (np.percentile(latencies, 50), np.percentile(latencies, 99),
+                                     latencies.size / wall_time)
+        finally:
+            server.terminate()
+            server.join()
+
+    print(f"\nLookupServer: n={size}, процессов {num_workers}, окно {window * 1e3:.2f} мс")
+    print("Вариант\t\tp50 (с)\t\tp99 (с)\t\tзапросов/с")
+    for name, (p50, p99, throughput) in results.items():
+        print(f"{name:<10}\t{p50:.3e}\t{p99:.3e}\t{throughput:.0f}")
+    return results
+
+
+def run_parallel_search_comparison(size=10**8, worker_counts=None, seed=0):
+    """
+    Масштабирование параллельного линейного поиска ParallelScanner от 1 до
+    N процессов в сравнении с linear_search (чистый Python) и однопоточным
+    поиском NumPy. Массив - случайная перестановка, цель стоит в последней
+    десятой части массива (близко к худшему случаю).
+    Выводит время find_first, find_all и count.
+    Возвращает: dict {вариант: dict времён}.
+    """
+    if worker_counts is None:
+        cpu_count = os.cpu_count() or 1
+        worker_counts = sorted({n for n in (1, 2, 4, 8, 16, 32) if n < cpu_count} | {cpu_count})
+    rng = np.random.default_rng(seed)
+    arr = rng.permutation(size).astype(np.int64)
+    target = int(arr[size - size // 10])
+    results = {}
+
+    start_time = time.perf_counter()
+    expected = linear_search(memoryview(arr), target)
+    results['python'] = {'find_first': time.perf_counter() - start_time}
+
+    start_time = time.perf_counter()
+    assert int(np.flatnonzero(arr == target)[0]) == expected
+    find_time = time.perf_counter() - start_time
+    start_time = time.perf_counter()
+    int(np.count_nonzero(arr == target))
+    results['numpy'] = {'find_first': find_time, 'count': time.perf_counter() - start_time}
+
+    for workers in worker_counts:
+        with ParallelScanner(arr, workers=workers) as scanner:
+            # Прогрев: запуск процессов пула не входит в замеры
+            scanner.count(target)
+            timings = {}
+            for name, func in (('find_first', scanner.find_first),
+                               ('find_all', scanner.find_all),
+                               ('count', scanner.count)):
+                start_time = time.perf_counter()
+                answer = func(target)
+                timings[name] = time.perf_counter() - start_time
+                if name == 'find_first':
+                    assert answer == expected
+            results[f'parallel x{workers}'] = timings
+
+    print(f"\nПараллельный линейный поиск: n={size}")
+    print("Вариант\t\tfind_first\tfind_all\tcount")
+    for name, timings in results.items():
+        row = "\t".join(f"{timings[key]:.3e}" if key in timings else "-\t"
+                        for key in ('find_first', 'find_all', 'count'))
+        print(f"{name:<14}\t{row}")
+    return results
+
+
+def _interleaved_call_times(calls, targets, repeat=15):
+    """
+    Время одного вызова f(target) для каждой функции из calls (в секундах).
+    Прогоны функций чередуются, и для каждой берётся лучший из repeat:
+    медленный дрейф частоты и кэшей одинаково влияет на все варианты.
+    Возвращает: dict {имя: время}.
+    """
+    best = dict.fromkeys(calls, float('inf'))
+    for _ in range(repeat):
+        for name, func in calls.items():
+            start_time = time.perf_counter()
+            for target in targets:
+                func(target)
+            best[name] = min(best[name], time.perf_counter() - start_time)
+    return {name: elapsed / len(targets) for name, elapsed in best.items()}
+
+
+def run_dispatcher_comparison(sizes=(8, 64, 512, 4096, 32768, 262144, 1000000),
+                              num_targets=100, linear_limit=10**5, repeat=15, seed=1,
+                              rel_margin=0.10, abs_margin_us=0.1, search_overhead_us=2.0,
+                              search_rel_margin=0.25):
+    """
+    Проверка диспетчера: для каждого сценария (отсортированный и
+    неотсортированный список и ndarray) и размера метод, выбранный
+    bind_search, сравнивается с лучшим из отдельных методов. Методы O(n) на
+    чистом Python замеряются только до linear_limit элементов - дальше они
+    заведомо не лучшие. Все варианты вызываются одинаково, как f(target)
+    через functools.partial, и замеряются вперемежку.
+    bind_search(arr)(target) - это functools.partial(выбранный метод, arr),
+    поэтому его время - время выбранного метода в том же замере.
+    Критерии (PASS/FAIL):
+    - bind_search - быстрый путь: выбранный метод не медленнее лучшего
+      более чем на rel_margin (доля) или на abs_margin_us мкс на вызов;
+    - search() - разовые вызовы: накладные расходы выбора метода сверх
+      bind_search не больше search_overhead_us мкс или search_rel_margin
+      (доля; на O(n) поисках разброс замера больше самих расходов).
+    Возвращает: dict {(сценарий, размер): (bind_search / лучший,
+    накладные расходы search() в мкс, пройдена ли проверка)}.
+    """
+    rng = np.random.default_rng(seed)
+    get_thresholds()
+    scenarios = {
+        'sorted list': (True, lambda size: list(range(0, 2 * size, 2)),
+                        {'linear': linear_search, 'binary': binary_search,
+                         'interpolation': interpolation_search}),
+        'sorted ndarray': (True, lambda size: np.arange(0, 2 * size, 2),
+                           {'linear': linear_search, 'binary': binary_search,
+                            'vectorized': vectorized_sorted_search}),
+        'unsorted list': (False, lambda size: rng.permutation(2 * size)[:size].tolist(),
+                          {'linear': linear_search}),
+        'unsorted ndarray': (False, lambda size: rng.permutation(2 * size)[:size],
+                             {'linear': linear_search, 'vectorized': vectorized_search}),
+    }
+    results = {}
+
+    print(f"\nДопуск bind_search: +{rel_margin:.0%} или +{abs_margin_us} мкс к лучшему методу; "
+          f"накладные расходы search(): не больше {search_overhead_us} мкс или +{search_rel_margin:.0%}")
+    print("Сценарий\t\tРазмер\t\tЛучший метод\tВыбранный\tbind_search / лучший\tsearch() сверх bind (мкс)\tИтог")
+    for name, (is_sorted, make_array, methods) in scenarios.items():
+        for size in sizes:
+            arr = make_array(size)
+            targets = rng.integers(0, 2 * size, size=num_targets).tolist()
+            calls = {method_name: functools.partial(func, arr) for method_name, func in methods.items()
+                     if not (method_name == 'linear' and size > linear_limit and len(methods) > 1)}
+            bound = bind_search(arr, is_sorted)
+            chosen = next((method_name for method_name, func in methods.items()
+                           if func is bound.func and method_name in calls), 'bind_search')
+            calls.setdefault(chosen, bound)
+            calls['search'] = functools.partial(search, arr, sorted=is_sorted)
+            timings = _interleaved_call_times(calls, targets, repeat)
+            search_time = timings.pop('search')
+            bound_time = timings.pop(chosen) if chosen == 'bind_search' else timings[chosen]
+            best = min(timings, key=timings.get)
+            ratio = bound_time / timings[best]
+            overhead_us = (search_time - bound_time) * 1e6
+            passed = ((ratio <= 1 + rel_margin or (bound_time - timings[best]) * 1e6 <= abs_margin_us)
+                      and (overhead_us <= search_overhead_us or search_time <= bound_time * (1 + search_rel_margin)))
+            results[(name, size)] = (ratio, overhead_us, passed)
+            print(f"{name:<16}\t{size:<10}\t{best:<12}\t{chosen:<12}\t{ratio:.2f}\t\t\t{overhead_us:+.2f}\t\t\t\t"
+                  f"{'PASS' if passed else 'FAIL'}")
+
+    failed = [key for key, (_, _, passed) in results.items() if not passed]
+    print(f"Наихудшее отношение bind_search к лучшему методу: {max(r[0] for r in results.values()):.2f}; "
+          f"медианные накладные расходы search(): {np.median([r[1] for r in results.values()]):.2f} мкс")
+    print("Итог: PASS" if not failed else f"Итог: FAIL ({len(failed)} из {len(results)}): {failed}")
+    return results
 
 if __name__ == "__main__":
     run_comparison()
@@ -0,0 +1,155 @@
+from bisect import bisect_left
+
+import numpy as np
+
+
+class LearnedIndex:
+    """
+    Экспериментальный "обученный" индекс для больших отсортированных
+    массивов целых чисел.
+
+    Позиция ключа предсказывается кусочно-линейной моделью ключ -> индекс:
+    массив делится на сегменты, на каждом сегменте модель - прямая через
+    его первый и последний ключ. Для каждого сегмента при построении
+    вычисляется точная максимальная ошибка предсказания err, поэтому поиск -
+    одно предсказание и бинарный поиск в окне [pred - err, pred + err].
+
+    Если задан max_error, сегменты с большей ошибкой делятся пополам,
+    пока ошибка каждого сегмента не станет не больше max_error.
+
+    Сложность: построение - O(n) за несколько векторизованных проходов,
+    поиск - O(log(n / segment_size) + log err).
+    """
+
+    def __init__(self, sorted_keys, segment_size=1024, max_error=None):
+        keys = np.ascontiguousarray(sorted_keys, dtype=np.int64)
+        if keys.ndim != 1:
+            raise ValueError("sorted_keys must be one-dimensional")
+        if segment_size < 2:
+            raise ValueError("segment_size must be >= 2")
+        self.keys = keys
+        self.size = keys.size
+        starts = np.arange(0, self.size, segment_size, dtype=np.int64)
+        while True:
+            self._fit(starts)
+            if max_error is None:
+                break
+            # O(s) - середины сегментов, нарушающих ограничение на ошибку
+            lengths = self._ends - self._starts
+            bad = (self._errors > max_error) & (lengths > 1)
+            if not bad.any():
+                break
+            starts = np.union1d(starts, self._starts[bad] + lengths[bad] // 2)
+        # Представления без копирования для поиска одного значения:
+        # индексация memoryview возвращает числа Python
+        self._view = memoryview(self.keys)
+        self._first_keys_view = memoryview(self._first_keys)
+        self._segment_views = (memoryview(self._starts), memoryview(self._ends),
+                               memoryview(self._slopes), memoryview(self._errors))
+
+    def _fit(self, starts):
+        """
+        Подгонка прямых на сегментах с началами starts и подсчёт точной
+        максимальной ошибки каждого сегмента. Один векторизованный проход.
+        Сложность: O(n).
+        """
+        keys = self.keys
+        ends = np.empty_like(starts)
+        ends[:-1] = starts[1:]
+        ends[-1:] = self.size
+        first_keys = keys[starts]
+        last_keys = keys[ends - 1]
+        key_span = (last_keys - first_keys).astype(np.float64)
+        # Для сегмента из одинаковых ключей наклон равен 0
+        slopes = np.divide((ends - 1 - starts).astype(np.float64), key_span,
+                           out=np.zeros(starts.size), where=key_span > 0)
+        self._starts = starts
+        self._ends = ends
+        self._first_keys = np.ascontiguousarray(first_keys)
+        self._slopes = slopes
+        if self.size == 0:
+            self._errors = np.empty(0, dtype=np.int64)
+            return
+        # O(n) - предсказания для всех ключей и максимум ошибки по сегментам
+        segment_of = np.repeat(np.arange(starts.size), ends - starts)
+        predicted = self._predict(keys, segment_of)
+        errors = np.abs(predicted - np.arange(self.size, dtype=np.int64))
+        self._errors = np.maximum.reduceat(errors, starts)
+
+    def _predict(self, targets, segments):
+        """Векторизованное предсказание позиции, ограниченное границами сегмента."""
+        starts = self._starts[segments]
+        offsets = ((targets - self._first_keys[segments]) * self._slopes[segments]).astype(np.int64)
+        return np.clip(starts + offsets, starts, self._ends[segments] - 1)
+
+    def __len__(self):
+        return self.size
+
+    @property
+    def num_segments(self):
+        return self._starts.size
+
+    @property
+    def max_error(self):
+        """Максимальная ошибка предсказания по всем сегментам."""
+        return int(self._errors.max()) if self._errors.size else 0
+
+    @property
+    def model_bytes(self):
+        """Размер модели в байтах (без самих ключей)."""
+        return (self._starts.nbytes + self._ends.nbytes + self._first_keys.nbytes
+                + self._slopes.nbytes + self._errors.nbytes)
+
+    def search(self, target):
+        """
+        Поиск одного ключа.
+        Возвращает индекс первого вхождения target или -1, если не найден.
+        Сложность: O(log(n / segment_size) + log err).
+        """
+        if self.size == 0:
+            return -1
+        # Последний сегмент, первый ключ которого < target: первое вхождение
+        # лежит в нём или в начале следующего сегмента
+        segment = max(bisect_left(self._first_keys_view, target) - 1, 0)
+        starts, ends, slopes, errors = self._segment_views
+        start = starts[segment]
+        end = ends[segment]
+        error = errors[segment]
+        offset = int((target - self._first_keys_view[segment]) * slopes[segment])
+        predicted = min(max(start + offset, start), end - 1)
+        # O(log err) - бинарный поиск в окне гарантированной ошибки
+        pos = bisect_left(self._view, target, max(predicted - error, start),
+                          min(predicted + error + 1, end))
+        if pos < self.size and self._view[pos] == target:
+            return pos
+        return -1
+
+    def search_many(self, targets):
+        """
+        Пакетный поиск: предсказания и бинарный поиск в окнах ошибок
+        выполняются для всех целей одновременно.
+        Возвращает: np.ndarray int64 индексов, -1 для отсутствующих ключей.
+        Сложность: O(m (log(n / segment_size) + log err)).
+        """
+        targets = np.asarray(targets, dtype=np.int64)
+        result = np.full(targets.shape, -1, dtype=np.int64)
+        if self.size == 0 or targets.size == 0:
+            return result
+        segments = np.maximum(np.searchsorted(self._first_keys, targets, side='left') - 1, 0)
+        predicted = self._predict(targets, segments)
+        errors = self._errors[segments]
+        lo = np.maximum(predicted - errors, self._starts[segments])
+        hi = np.minimum(predicted + errors + 1, self._ends[segments])
+        keys = self.keys
+        # O(log err) векторизованных шагов бинарного поиска внутри окон
+        while True:
+            active = lo < hi
+            if not active.any():
+                break
+            mid = (lo + hi) // 2
+            less = keys[np.minimum(mid, self.size - 1)] < targets
+            lo = np.where(active & less, mid + 1, lo)
+            hi = np.where(active & ~less, mid, hi)
+        hit = (lo < self.size) & (keys[np.minimum(lo, self.size - 1)] == targets)
+        result[hit] = lo[hit]
+        return result
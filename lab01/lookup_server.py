@@ -0,0 +1,180 @@
+import asyncio
+import socket
+import struct
+import sys
+
+import numpy as np
+
+from mmap_search import MmapSortedArray
+
+# Протокол: запрос - ключ int64 little-endian (8 байт), ответ - индекс
+# int64 little-endian (-1, если ключ не найден). Ответы приходят в порядке
+# запросов, поэтому клиент может отправлять несколько ключей подряд.
+MESSAGE = struct.Struct('<q')
+
+
+class LookupServer:
+    """
+    Локальный сервер поиска по Unix-сокету поверх одного отображённого
+    в память файла ключей (MmapSortedArray).
+
+    Одиночные запросы от всех подключений копятся в общем пакете не дольше
+    window секунд (или до max_batch ключей) и выполняются одним
+    векторизованным вызовом search_many. Рабочие процессы не держат свою
+    копию массива: страницы файла лежат в кэше ОС в одном экземпляре.
+    """
+
+    def __init__(self, keys_path, socket_path, window=0.0005, max_batch=4096):
+        self.keys_path = keys_path
+        self.socket_path = socket_path
+        self.window = window
+        self.max_batch = max_batch
+        self.array = None
+        self.batches = 0
+        self.requests = 0
+        self._server = None
+        self._keys = []
+        self._futures = []
+        self._timer = None
+
+    async def start(self):
+        """Открытие файла ключей и запуск прослушивания сокета."""
+        self.array = MmapSortedArray(self.keys_path)
+        self._server = await asyncio.start_unix_server(self._handle, path=self.socket_path)
+
+    async def serve_forever(self):
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        """Остановка сервера; ожидающие запросы выполняются перед закрытием файла."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        self._flush()
+        if self.array is not None:
+            self.array.close()
+            self.array = None
+
+    def _submit(self, key):
+        """Добавление ключа в текущий пакет. Возвращает future с индексом."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._keys.append(key)
+        self._futures.append(future)
+        if len(self._keys) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+        return future
+
+    def _flush(self):
+        """Выполнение накопленного пакета одним вызовом search_many."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._keys:
+            return
+        keys, futures = self._keys, self._futures
+        self._keys, self._futures = [], []
+        indices = self.array.search_many(np.array(keys, dtype=np.int64)).tolist()
+        self.batches += 1
+        self.requests += len(keys)
+        for future, index in zip(futures, indices):
+            if not future.done():
+                future.set_result(index)
+
+    async def _handle(self, reader, writer):
+        """
+        Обслуживание одного подключения: все целые ключи из прочитанного
+        фрагмента ставятся в пакет, ответы отправляются одним блоком.
+        """
+        buffer = b''
+        try:
+            while True:
+                data = await reader.read(65536)
+                if not data:
+                    break
+                buffer += data
+                usable = len(buffer) - len(buffer) % MESSAGE.size
+                futures = [self._submit(key) for (key,) in MESSAGE.iter_unpack(buffer[:usable])]
+                buffer = buffer[usable:]
+                if futures:
+                    indices = await asyncio.gather(*futures)
+                    writer.write(b''.join(MESSAGE.pack(index) for index in indices))
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+class LookupClient:
+    """Синхронный клиент LookupServer для рабочих процессов."""
+
+    def __init__(self, socket_path):
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.connect(socket_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        self._sock.close()
+
+    def _recv_exact(self, size):
+        chunks = []
+        while size:
+            chunk = self._sock.recv(size)
+            if not chunk:
+                raise ConnectionError("lookup server closed the connection")
+            chunks.append(chunk)
+            size -= len(chunk)
+        return b''.join(chunks)
+
+    def lookup(self, key):
+        """Индекс ключа key или -1."""
+        self._sock.sendall(MESSAGE.pack(key))
+        return MESSAGE.unpack(self._recv_exact(MESSAGE.size))[0]
+
+    def lookup_many(self, keys):
+        """Индексы для последовательности ключей (отправляются одним блоком)."""
+        keys = list(keys)
+        self._sock.sendall(b''.join(MESSAGE.pack(key) for key in keys))
+        data = self._recv_exact(MESSAGE.size * len(keys))
+        return [index for (index,) in MESSAGE.iter_unpack(data)]
+
+
+def run_server(keys_path, socket_path, window=0.0005, max_batch=4096, ready=None):
+    """
+    Запуск сервера в текущем процессе до прерывания.
+    ready - необязательное событие multiprocessing, устанавливаемое после
+    начала прослушивания сокета.
+    """
+    async def main():
+        server = LookupServer(keys_path, socket_path, window, max_batch)
+        await server.start()
+        if ready is not None:
+            ready.set()
+        try:
+            await server.serve_forever()
+        finally:
+            await server.close()
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Использование: python lookup_server.py <файл ключей> <путь к сокету>")
+        sys.exit(1)
+    run_server(sys.argv[1], sys.argv[2])
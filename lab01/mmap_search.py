@@ -0,0 +1,209 @@
+import mmap
+import os
+import sys
+from bisect import bisect_left
+
+import numpy as np
+
+# Формат файла: подряд записанные ключи int64 little-endian без заголовка
+KEY_DTYPE = np.dtype('<i8')
+# Ключей на страницу памяти 4 KiB
+PAGE_KEYS = mmap.PAGESIZE // KEY_DTYPE.itemsize
+
+
+def fence_path(path):
+    """Путь файла-спутника с разреженным индексом для файла ключей path."""
+    return path + '.fence.npy'
+
+
+def write_sorted_keys(path, chunks, stride=PAGE_KEYS):
+    """
+    Запись отсортированных ключей в файл формата MmapSortedArray.
+    chunks - массив ключей или итерируемый набор массивов (частей), что
+    позволяет записывать наборы, не помещающиеся в память целиком.
+    Проверяет упорядоченность внутри частей и на их стыках.
+    Рядом сохраняется разреженный индекс (fence_path): stride и первый ключ
+    каждых stride ключей, чтобы открытие файла не читало все его страницы.
+    Оба файла сбрасываются на диск (fsync): "грязные" страницы нельзя
+    вытеснить из кэша, и замер с холодным кэшем был бы невозможен.
+    Возвращает: int - число записанных ключей.
+    Сложность: O(n), память - O(размер одной части + n / stride).
+    """
+    if stride < 1:
+        raise ValueError("stride must be >= 1")
+    if isinstance(chunks, np.ndarray):
+        chunks = [chunks]
+    count = 0
+    last_key = None
+    fence = []
+    with open(path, 'wb') as f:
+        for chunk in chunks:
+            chunk = np.asarray(chunk, dtype=KEY_DTYPE)
+            if chunk.size == 0:
+                continue
+            if np.any(chunk[1:] < chunk[:-1]) or (last_key is not None and chunk[0] < last_key):
+                raise ValueError("keys must be sorted in ascending order")
+            chunk.tofile(f)
+            # Ключи на позициях, кратных stride, в нумерации всего файла
+            fence.append(chunk[-count % stride::stride].astype(np.int64))
+            last_key = chunk[-1]
+            count += chunk.size
+        f.flush()
+        os.fsync(f.fileno())
+    with open(fence_path(path), 'wb') as f:
+        np.save(f, np.concatenate([np.array([stride], dtype=np.int64)] + fence))
+        f.flush()
+        os.fsync(f.fileno())
+    return count
+
+
+def load_fence(path, stride, size):
+    """
+    Разреженный индекс из файла-спутника или None, если его нет, он
+    построен с другим stride, не соответствует размеру или старше файла ключей.
+    """
+    try:
+        if os.path.getmtime(fence_path(path)) < os.path.getmtime(path):
+            return None
+        stored = np.load(fence_path(path))
+    except (OSError, ValueError):
+        return None
+    if stored.size == 0 or stored[0] != stride or stored.size - 1 != -(-size // stride):
+        return None
+    return stored[1:]
+
+
+def drop_page_cache(path):
+    """
+    Просьба к ОС вытеснить страницы файла из кэша (posix_fadvise DONTNEED).
+    Нужна для замера поиска "с холодным кэшем".
+    Возвращает: bool - поддерживается ли операция на этой платформе.
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return False
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+    return True
+
+
+class MmapSortedArray:
+    """
+    Отсортированный массив ключей int64, отображённый в память через mmap.
+
+    Данные не копируются: поиск читает страницы файла напрямую из кэша ОС.
+    В памяти хранится только разреженный индекс - первый ключ каждых
+    stride ключей (по умолчанию одна страница). По нему определяется
+    страница с ответом, поэтому поиск касается O(1) страниц файла вместо
+    log2(n) у binary_search по всему массиву.
+
+    Индекс читается из файла-спутника, записанного write_sorted_keys,
+    поэтому открытие не затрагивает страниц самого файла ключей.
+
+    Сложность: открытие - O(n / stride), поиск - O(log n).
+    Память: O(n / stride).
+    """
+
+    def __init__(self, path, stride=PAGE_KEYS):
+        if stride < 1:
+            raise ValueError("stride must be >= 1")
+        self.path = path
+        self.stride = stride
+        self._file = open(path, 'rb')
+        file_size = os.fstat(self._file.fileno()).st_size
+        if file_size % KEY_DTYPE.itemsize:
+            self._file.close()
+            raise ValueError(f"file size {file_size} is not a multiple of {KEY_DTYPE.itemsize}")
+        self.size = file_size // KEY_DTYPE.itemsize
+        if self.size == 0:
+            # Пустой файл нельзя отобразить в память
+            self._mmap = None
+            self.keys = np.empty(0, dtype=KEY_DTYPE)
+        else:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            if hasattr(mmap, 'MADV_RANDOM'):
+                # Поиск читает отдельные страницы: без этого упреждающее чтение ОС
+                # на каждый промах подгружает соседние мегабайты файла
+                self._mmap.madvise(mmap.MADV_RANDOM)
+            self.keys = np.frombuffer(self._mmap, dtype=KEY_DTYPE)
+        # Последовательность для bisect и binary_search без копирования:
+        # memoryview отдаёт числа Python быстрее индексации ndarray
+        if self._mmap is not None and sys.byteorder == 'little':
+            self.view = memoryview(self._mmap).cast('q')
+        else:
+            self.view = self.keys
+        # Индекс из файла-спутника; без него - первый ключ каждого блока,
+        # O(n / stride) чтений, то есть чтение каждой страницы файла
+        fence = load_fence(path, stride, self.size)
+        if fence is None:
+            fence = np.array(self.keys[::stride], dtype=np.int64)
+        self.fence = fence
+        self._fence_view = memoryview(self.fence)
+
+    def __len__(self):
+        return self.size
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Закрытие отображения и файла. Все представления буфера освобождаются."""
+        if self._mmap is not None:
+            if isinstance(self.view, memoryview):
+                self.view.release()
+            self.view = None
+            self.keys = None
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    def search(self, target):
+        """
+        Поиск одного ключа.
+        Возвращает индекс первого вхождения target или -1, если не найден.
+        Сложность: O(log(n / stride)) в памяти + O(log stride) на одной странице.
+        """
+        if self.size == 0:
+            return -1
+        # O(log(n / stride)) - последний блок, первый ключ которого < target;
+        # первое вхождение лежит в нём или в начале следующего блока
+        block = max(bisect_left(self._fence_view, target) - 1, 0)
+        lo = block * self.stride
+        hi = min(lo + self.stride, self.size)
+        pos = bisect_left(self.view, target, lo, hi)
+        if pos < self.size and self.view[pos] == target:
+            return pos
+        return -1
+
+    def search_many(self, targets):
+        """
+        Пакетный поиск: блок каждой цели находится по разреженному индексу,
+        затем все цели одновременно делят пополам свои блоки.
+        Возвращает: np.ndarray int64 индексов, -1 для отсутствующих ключей.
+        Сложность: O(m log n), где m - число целей.
+        """
+        targets = np.asarray(targets, dtype=np.int64)
+        result = np.full(targets.shape, -1, dtype=np.int64)
+        if self.size == 0 or targets.size == 0:
+            return result
+        blocks = np.maximum(np.searchsorted(self.fence, targets, side='left') - 1, 0)
+        lo = blocks * self.stride
+        hi = np.minimum(lo + self.stride, self.size)
+        keys = self.keys
+        # O(log stride) векторизованных шагов бинарного поиска внутри блоков
+        while True:
+            active = lo < hi
+            if not active.any():
+                break
+            mid = (lo + hi) // 2
+            less = keys[np.minimum(mid, self.size - 1)] < targets
+            lo = np.where(active & less, mid + 1, lo)
+            hi = np.where(active & ~less, mid, hi)
+        hit = (lo < self.size) & (keys[np.minimum(lo, self.size - 1)] == targets)
+        result[hit] = lo[hit]
+        return result
@@ -0,0 +1,127 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, wait
+from multiprocessing import Value, shared_memory
+
+import numpy as np
+
+# Состояние рабочего процесса: массив в общей памяти и общий "лучший" индекс
+_worker_state = {}
+
+
+def _attach(shm_name, shape, dtype, best):
+    """Инициализатор рабочего процесса: подключение к общей памяти без копирования."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    _worker_state['shm'] = shm
+    _worker_state['array'] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    _worker_state['best'] = best
+
+
+def _scan_first(start, end, step, target):
+    """
+    Поиск первого вхождения target в [start, end) порциями по step элементов.
+    Перед каждой порцией проверяется общий лучший индекс: если другой процесс
+    уже нашёл вхождение левее, дальнейший просмотр бессмыслен.
+    """
+    arr = _worker_state['array']
+    best = _worker_state['best']
+    for pos in range(start, end, step):
+        if pos >= best.value:
+            return -1
+        hits = np.flatnonzero(arr[pos:min(pos + step, end)] == target)
+        if hits.size:
+            index = pos + int(hits[0])
+            with best.get_lock():
+                if index < best.value:
+                    best.value = index
+            return index
+    return -1
+
+
+def _scan_all(start, end, target):
+    """Все индексы вхождений target в [start, end)."""
+    return start + np.flatnonzero(_worker_state['array'][start:end] == target)
+
+
+def _scan_count(start, end, target):
+    """Число вхождений target в [start, end)."""
+    return int(np.count_nonzero(_worker_state['array'][start:end] == target))
+
+
+class ParallelScanner:
+    """
+    Параллельный линейный поиск по неотсортированному массиву.
+
+    Массив один раз копируется в multiprocessing.shared_memory, рабочие
+    процессы пула подключаются к нему без копирования и просматривают свои
+    части векторизованным сравнением NumPy. find_first прекращает просмотр,
+    как только найдено вхождение левее ещё не просмотренных порций.
+
+    Запросы к одному сканеру должны выполняться последовательно.
+    Сложность: O(n / p) на запрос при p процессах.
+    """
+
+    def __init__(self, arr, workers=None, chunk_size=1 << 20):
+        arr = np.ascontiguousarray(arr)
+        if arr.ndim != 1:
+            raise ValueError("arr must be one-dimensional")
+        self.size = arr.size
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self._shm = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+        shared = np.ndarray(arr.shape, dtype=arr.dtype, buffer=self._shm.buf)
+        shared[:] = arr
+        del shared
+        self._best = Value('q', self.size)
+        self._pool = ProcessPoolExecutor(
+            self.workers, initializer=_attach,
+            initargs=(self._shm.name, arr.shape, arr.dtype.str, self._best))
+
+    def __len__(self):
+        return self.size
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Остановка пула и освобождение общей памяти."""
+        self._pool.shutdown()
+        self._shm.close()
+        self._shm.unlink()
+
+    def _ranges(self):
+        """Разбиение [0, n) на части, по несколько на процесс для балансировки."""
+        parts = self.workers * 4
+        step = max(-(-self.size // parts), 1)
+        return [(start, min(start + step, self.size)) for start in range(0, self.size, step)]
+
+    def find_first(self, target):
+        """
+        Индекс первого вхождения target или -1 (как linear_search).
+        Части, лежащие правее уже найденного вхождения, не просматриваются.
+        """
+        self._best.value = self.size
+        futures = [self._pool.submit(_scan_first, start, end, self.chunk_size, target)
+                   for start, end in self._ranges()]
+        wait(futures)
+        for future in futures:
+            future.result()
+        best = self._best.value
+        return best if best < self.size else -1
+
+    def find_all(self, target):
+        """Все индексы вхождений target по возрастанию (np.ndarray int64)."""
+        futures = [self._pool.submit(_scan_all, start, end, target)
+                   for start, end in self._ranges()]
+        parts = [future.result() for future in futures]
+        if not parts:
+            return np.empty(0, dtype=np.int64)
+        return np.concatenate(parts).astype(np.int64, copy=False)
+
+    def count(self, target):
+        """Число вхождений target."""
+        futures = [self._pool.submit(_scan_count, start, end, target)
+                   for start, end in self._ranges()]
+        return sum(future.result() for future in futures)
@@ -0,0 +1,166 @@
+import heapq
+from bisect import bisect_left
+
+import numpy as np
+
+# Во сколько раз один список должен быть длиннее другого,
+# чтобы галопирующий поиск выигрывал у линейного слияния
+GALLOP_RATIO = 32
+# Суммарный размер входов, начиная с которого выгоден путь через NumPy
+VECTORIZE_THRESHOLD = 10000
+
+
+def gallop_lower_bound(arr, target, lo=0):
+    """
+    Галопирующий поиск: индекс первого элемента >= target, начиная с lo.
+    Шаг удваивается, пока элементы меньше target, затем выполняется
+    бинарный поиск в последнем интервале.
+    Сложность: O(log d), где d - расстояние от lo до ответа.
+    """
+    n = len(arr)
+    hi = lo
+    step = 1
+    while hi < n and arr[hi] < target:
+        lo = hi + 1
+        hi += step
+        step *= 2
+    return bisect_left(arr, target, lo, min(hi, n))
+
+
+def merge_intersect(a, b):
+    """
+    Пересечение двух отсортированных списков линейным слиянием.
+    Сложность: O(n + m).
+    """
+    result = []
+    i = j = 0
+    n, m = len(a), len(b)
+    while i < n and j < m:
+        x = a[i]
+        y = b[j]
+        if x < y:
+            i += 1
+        elif x > y:
+            j += 1
+        else:
+            result.append(x)
+            i += 1
+            j += 1
+    return result
+
+
+def gallop_intersect(small, large):
+    """
+    Пересечение короткого списка small с длинным large: для каждого
+    элемента small выполняется галопирующий поиск от предыдущей позиции.
+    Сложность: O(m log(n / m)), где m = len(small), n = len(large).
+    """
+    result = []
+    pos = 0
+    n = len(large)
+    for x in small:
+        pos = gallop_lower_bound(large, x, pos)
+        if pos == n:
+            break
+        if large[pos] == x:
+            result.append(x)
+            pos += 1
+    return result
+
+
+def numpy_intersect(small, large):
+    """
+    Векторизованное пересечение: позиции всех элементов small в large
+    находятся одним вызовом np.searchsorted.
+    Сложность: O(m log n) внутри NumPy.
+    """
+    small = np.asarray(small)
+    large = np.asarray(large)
+    idx = np.searchsorted(large, small)
+    found = idx < large.size
+    found[found] = large[idx[found]] == small[found]
+    return small[found]
+
+
+def intersect(arrays, method='auto'):
+    """
+    Пересечение k отсортированных массивов без повторов (списков
+    идентификаторов). Массивы обрабатываются от самого короткого, поэтому
+    промежуточный результат никогда не длиннее наименьшего входа.
+    method:
+    - 'merge' - линейное слияние;
+    - 'gallop' - галопирующий поиск по более длинному массиву;
+    - 'numpy' - векторизованный путь (возвращает np.ndarray);
+    - 'auto' - 'numpy' для массивов NumPy суммарной длины от
+      VECTORIZE_THRESHOLD, иначе 'gallop' или 'merge' для каждой пары
+      в зависимости от отношения длин (GALLOP_RATIO).
+    Возвращает: list (или np.ndarray для пути NumPy).
+    """
+    if not arrays:
+        return []
+    arrays = sorted(arrays, key=len)
+    if method == 'auto':
+        total = sum(len(arr) for arr in arrays)
+        if total >= VECTORIZE_THRESHOLD and all(isinstance(arr, np.ndarray) for arr in arrays):
+            method = 'numpy'
+    if method == 'numpy':
+        result = np.asarray(arrays[0])
+        for arr in arrays[1:]:
+            result = numpy_intersect(result, arr)
+        return result
+
+    result = list(arrays[0])
+    for arr in arrays[1:]:
+        if not result:
+            break
+        if method == 'merge':
+            result = merge_intersect(result, arr)
+        elif method == 'gallop':
+            result = gallop_intersect(result, arr)
+        elif method == 'auto':
+            if len(arr) >= GALLOP_RATIO * len(result):
+                result = gallop_intersect(result, arr)
+            else:
+                result = merge_intersect(result, arr)
+        else:
+            raise ValueError(f"unknown method: {method}")
+    return result
+
+
+def union(arrays, method='auto'):
+    """
+    Объединение k отсортированных массивов без повторов в результате.
+    method:
+    - 'merge' - k-путевое слияние через кучу (heapq.merge);
+    - 'numpy' - конкатенация, устойчивая сортировка (timsort использует
+      уже упорядоченные участки) и удаление повторов (возвращает np.ndarray);
+    - 'auto' - 'numpy' для массивов NumPy суммарной длины от
+      VECTORIZE_THRESHOLD, иначе 'merge'.
+    Возвращает: list (или np.ndarray для пути NumPy).
+    Сложность: O(N log k), где N - суммарная длина входов.
+    """
+    if not arrays:
+        return []
+    if method == 'auto':
+        total = sum(len(arr) for arr in arrays)
+        if total >= VECTORIZE_THRESHOLD and all(isinstance(arr, np.ndarray) for arr in arrays):
+            method = 'numpy'
+        else:
+            method = 'merge'
+    if method == 'numpy':
+        merged = np.concatenate([np.asarray(arr) for arr in arrays])
+        merged.sort(kind='stable')
+        if merged.size == 0:
+            return merged
+        keep = np.empty(merged.size, dtype=bool)
+        keep[0] = True
+        np.not_equal(merged[1:], merged[:-1], out=keep[1:])
+        return merged[keep]
+    if method != 'merge':
+        raise ValueError(f"unknown method: {method}")
+
+    result = []
+    for x in heapq.merge(*arrays):
+        if not result or result[-1] != x:
+            result.append(x)
+    return result
@@ -0,0 +1,166 @@
+import numpy as np
+
+
+def eytzinger_rank(k, n):
+    """
+    Позиция в отсортированном массиве ключа, хранящегося в узле k
+    Eytzinger-раскладки из n узлов (BFS-порядок полного бинарного дерева,
+    узлы нумеруются с 1).
+    Для узла на глубине d со смещением j = k - 2^d ранг в совершенном
+    дереве высоты h равен (2j + 1) * 2^(h-1-d) - 1; из него вычитается
+    число отсутствующих листьев последнего уровня, стоящих левее узла.
+    k может быть целым числом или np.ndarray номеров узлов.
+    Сложность: O(1) на узел.
+    """
+    height = n.bit_length()
+    last_level = n - ((1 << (height - 1)) - 1)
+    if isinstance(k, np.ndarray):
+        k = k.astype(np.int64, copy=False)
+        # floor(log2(k)) через показатель frexp - точно для k < 2^53
+        depth = np.frexp(k.astype(np.float64))[1].astype(np.int64) - 1
+        one = np.int64(1)
+        rank = (2 * (k - (one << depth)) + 1) * (one << (height - 1 - depth)) - 1
+        return rank - np.maximum(0, (rank - 2 * last_level + 1) // 2)
+    depth = k.bit_length() - 1
+    rank = (2 * (k - (1 << depth)) + 1) * (1 << (height - 1 - depth)) - 1
+    return rank - max(0, (rank - 2 * last_level + 1) // 2)
+
+
+def build_eytzinger(sorted_arr):
+    """
+    Построение Eytzinger-раскладки отсортированного массива.
+    Возвращает: np.ndarray длины n + 1, элемент 0 не используется.
+    Сложность: O(n), полностью векторизовано.
+    """
+    sorted_arr = np.asarray(sorted_arr)
+    n = sorted_arr.size
+    layout = np.empty(n + 1, dtype=sorted_arr.dtype)
+    if n:
+        layout[0] = sorted_arr[0]
+        layout[1:] = sorted_arr[eytzinger_rank(np.arange(1, n + 1), n)]
+    return layout
+
+
+class StaticSortedIndex:
+    """
+    Статический индекс для многократного поиска в неизменяемом
+    отсортированном массиве.
+
+    Без block_size ключи хранятся в Eytzinger-раскладке: спуск идёт от
+    узла k к потомкам 2k и 2k + 1, верхние уровни дерева лежат в начале
+    буфера и остаются в кэше, а шаг k = 2k + (key < x) не содержит ветвлений.
+
+    С block_size (например, 16) используется B+-подобная раскладка:
+    отсортированные ключи разбиты на блоки по block_size элементов, а
+    Eytzinger-дерево строится только по первым ключам блоков. Поиск -
+    спуск по дереву в block_size раз меньше и один проход по блоку из
+    соседних кэш-линий.
+
+    Сложность: построение - O(n), поиск - O(log n).
+    """
+
+    def __init__(self, sorted_arr, block_size=None):
+        sorted_arr = np.asarray(sorted_arr)
+        if sorted_arr.ndim != 1:
+            raise ValueError("sorted_arr must be one-dimensional")
+        self.size = sorted_arr.size
+        self.block_size = block_size
+        if block_size is None:
+            self._blocks = None
+            self._layout = build_eytzinger(sorted_arr)
+        else:
+            if block_size < 1:
+                raise ValueError("block_size must be >= 1")
+            num_blocks = -(-self.size // block_size)
+            # O(n) - дополнение до целого числа блоков максимальным значением
+            if np.issubdtype(sorted_arr.dtype, np.integer):
+                sentinel = np.iinfo(sorted_arr.dtype).max
+            else:
+                sentinel = np.inf
+            padded = np.full(num_blocks * block_size, sentinel, dtype=sorted_arr.dtype)
+            padded[:self.size] = sorted_arr
+            self._blocks = padded.reshape(num_blocks, block_size)
+            self._layout = build_eytzinger(self._blocks[:, 0])
+        self._tree_size = self._layout.size - 1
+        self._height = self._tree_size.bit_length()
+        # Представления буферов без копирования: индексация memoryview
+        # возвращает числа Python и дешевле индексации ndarray в цикле
+        self._view = memoryview(self._layout)
+        self._blocks_view = None if self._blocks is None else memoryview(self._blocks.reshape(-1))
+
+    def __len__(self):
+        return self.size
+
+    def _descend(self, target):
+        """
+        Спуск по Eytzinger-дереву.
+        Возвращает номер узла с первым ключом, не меньшим target, или 0.
+        Сложность: O(log n).
+        """
+        layout = self._view
+        n = self._tree_size
+        k = 1
+        while k <= n:
+            k = 2 * k + (layout[k] < target)
+        # O(1) - отбрасывание хвоста из единиц (переходов вправо) и ещё одного бита
+        return k >> (~k & (k + 1)).bit_length()
+
+    def search(self, target):
+        """
+        Поиск одного значения.
+        Возвращает индекс target в исходном отсортированном массиве или -1.
+        Сложность: O(log n).
+        """
+        if self.size == 0:
+            return -1
+        node = self._descend(target)
+        rank = eytzinger_rank(node, self._tree_size) if node else self._tree_size
+        if self._blocks is None:
+            return rank if node and self._view[node] == target else -1
+        # O(B) - первая позиция >= target лежит в блоке перед rank
+        # (или в начале блока rank); проход по соседним кэш-линиям
+        view = self._blocks_view
+        pos = max(rank - 1, 0) * self.block_size
+        end = pos + self.block_size
+        while pos < end and view[pos] < target:
+            pos += 1
+        if pos < self.size and view[pos] == target:
+            return pos
+        return -1
+
+    def search_many(self, targets):
+        """
+        Пакетный поиск: все цели спускаются по дереву одновременно,
+        по одному векторизованному шагу на уровень.
+        Возвращает: np.ndarray int64 индексов, -1 для отсутствующих значений.
+        Сложность: O(m log n), где m - число целей.
+        """
+        targets = np.asarray(targets)
+        result = np.full(targets.size, -1, dtype=np.int64)
+        if self.size == 0 or targets.size == 0:
+            return result.reshape(targets.shape)
+        flat_targets = targets.reshape(-1)
+        n = self._tree_size
+        layout = self._layout
+        k = np.ones(flat_targets.size, dtype=np.int64)
+        # O(m log n) - ровно height векторизованных шагов спуска
+        for _ in range(self._height):
+            step = layout[np.minimum(k, n)] < flat_targets
+            k = np.where(k <= n, 2 * k + step, k)
+        # O(m) - k >> (число единиц в хвосте + 1) == k // (2 * младший нулевой бит)
+        k //= 2 * (~k & (k + 1))
+        ranks = np.where(k > 0, eytzinger_rank(np.maximum(k, 1), n), n)
+
+        if self._blocks is None:
+            exact = (k > 0) & (layout[k] == flat_targets)
+            result[exact] = ranks[exact]
+            return result.reshape(targets.shape)
+
+        # O(m * B) - число ключей блока, меньших target, без ветвлений
+        blocks = np.maximum(ranks - 1, 0)
+        offsets = (self._blocks[blocks] < flat_targets[:, None]).sum(axis=1)
+        positions = blocks * self.block_size + offsets
+        keys = self._blocks.reshape(-1)[np.minimum(positions, self.size - 1)]
+        hit = (positions < self.size) & (keys == flat_targets)
+        result[hit] = positions[hit]
+        return result.reshape(targets.shape)
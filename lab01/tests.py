@@ -0,0 +1,72 @@
+import os
+import tempfile
+import unittest
+import weakref
+
+import numpy as np
+
+from mmap_search import MmapSortedArray, write_sorted_keys, load_fence
+from lab01 import interpolation_search, adaptive_search, search, bind_search, _ordered_thresholds
+
+class InterpolationSearchTests(unittest.TestCase):
+    def test_float_list(self):
+        # Дробные ключи: позиция пробы должна быть целым индексом
+        arr = [0.5 * i for i in range(100)]
+        self.assertEqual(interpolation_search(arr, 3.0), 6)
+        self.assertEqual(interpolation_search(arr, 49.5), 99)
+        self.assertEqual(interpolation_search(arr, 3.25), -1)
+        self.assertEqual(adaptive_search(arr, 3.0), 6)
+
+    def test_large_int64_array(self):
+        # Произведение в формуле интерполяции не должно переполнять int64
+        arr = np.arange(0, 1000, 2, dtype=np.int64) * 10 ** 15
+        with np.errstate(over='raise'):
+            for i in (0, 1, 250, 499):
+                self.assertEqual(interpolation_search(arr, int(arr[i])), i)
+            self.assertEqual(interpolation_search(arr, 10 ** 15), -1)
+
+class DispatcherTests(unittest.TestCase):
+    def test_float_list(self):
+        # Дробные ключи не должны ломать выбор интерполяционного поиска
+        for size in (100, 5000):
+            arr = [0.5 * i for i in range(size)]
+            self.assertEqual(search(arr, 3.0, sorted=True), 6)
+            self.assertEqual(search(arr, 3.25, sorted=True), -1)
+            self.assertEqual(bind_search(arr, sorted=True)(arr[-1]), size - 1)
+
+    def test_cached_decision_follows_array(self):
+        # Тот же размер, другой тип массива и флаг sorted - решение выбирается заново
+        arr = list(range(0, 2000, 2))
+        self.assertEqual(search(arr, 500, sorted=True), 250)
+        self.assertEqual(search(np.array(arr), 500, sorted=True), 250)
+        self.assertEqual(search(arr[::-1], 500), 749)
+        self.assertEqual(search(['a', 'b', 'c'] * 10, 'c'), 2)
+
+    def test_cache_does_not_keep_array(self):
+        # Запомненное решение не должно удерживать массив в памяти
+        arr = np.arange(0, 2000, 2)
+        ref = weakref.ref(arr)
+        self.assertEqual(search(arr, 500, sorted=True), 250)
+        del arr
+        self.assertIsNone(ref())
+
+    def test_threshold_ordering(self):
+        ordered = _ordered_thresholds({'list_binary_min': 16, 'list_interpolation_min': 8,
+                                       'array_searchsorted_min': 256, 'array_scan_min': 32})
+        self.assertEqual(ordered['list_interpolation_min'], 16)
+
+class MmapFenceTests(unittest.TestCase):
+    def test_fence_sidecar(self):
+        # Индекс, записанный по частям разной длины, совпадает с построенным по файлу
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'keys.bin')
+            write_sorted_keys(path, [np.arange(0, 14, 2), np.arange(14, 2000, 2), np.arange(2000, 2006, 2)],
+                              stride=10)
+            self.assertTrue(np.array_equal(load_fence(path, 10, 1003), np.arange(0, 2006, 20)))
+            self.assertIsNone(load_fence(path, 16, 1003))
+            with MmapSortedArray(path, stride=10) as keys:
+                self.assertEqual(keys.search(1000), 500)
+                self.assertEqual(keys.search(1001), -1)
+
+if __name__ == '__main__':
+    unittest.main()
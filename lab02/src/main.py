@@ -1,15 +1,22 @@
+import argparse
+
 from modules.performance_analysis import run_performance_analysis
 from modules.task_solutions import demonstrate_solutions
 from modules.plot_generator import generate_all_plots
 
 def main():
     """Точка входа в приложение"""
+    parser = argparse.ArgumentParser(description="Лабораторная работа 2: Анализ структур данных")
+    parser.add_argument('--large', action='store_true',
+                        help="замеры проверки скобок на многогигабайтных временных файлах (1 и 10 ГБ)")
+    args = parser.parse_args()
+
     print("Лабораторная работа 2: Анализ структур данных")
     print("=" * 50)
     
     # Выполнение анализа производительности
     print("Запуск анализа производительности")
-    insertion_data, queue_data = run_performance_analysis()
+    insertion_data, queue_data = run_performance_analysis(large_files=args.large)
     
     # Построение графиков
     print("\nГенерация графиков")
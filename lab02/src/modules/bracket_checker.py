@@ -0,0 +1,280 @@
+import re
+
+OPENERS = b'([{'
+CLOSERS = b')]}'
+MATCHING = {ord(')'): ord('('), ord(']'): ord('['), ord('}'): ord('{')}
+
+# Все байты, кроме скобок, — для удаления через bytes.translate
+NON_BRACKETS = bytes(b for b in range(256) if b not in b'()[]{}')
+BRACKET_RE = re.compile(rb'[()\[\]{}]')
+
+def reduce_brackets(brackets, max_passes=32):
+    # Удаление соседних пар "()", "[]", "{}" на уровне C (bytes.replace).
+    # Каждый проход снимает один уровень вложенности; для корректной
+    # последовательности остаток имеет вид: закрывающие, затем открывающие.
+    for _ in range(max_passes):
+        reduced = brackets.replace(b'()', b'').replace(b'[]', b'').replace(b'{}', b'')
+        if len(reduced) == len(brackets):
+            break
+        brackets = reduced
+    return brackets
+    # Временная сложность: O(n * d), где d — число проходов (не больше max_passes)
+
+class StreamingBracketChecker:
+    """
+    Потоковая проверка сбалансированности скобок для данных, поступающих
+    частями (bytes) из файла или сокета.
+
+    Между частями хранится только стек открытых скобок (bytearray — один
+    байт на уровень вложенности) и состояние лексера. error_offset —
+    смещение в байтах первой ошибки от начала потока: позиция лишней или
+    несовпавшей закрывающей скобки, либо длина потока, если к его концу
+    остались незакрытые скобки (или незакрытая строка/блочный комментарий).
+
+    Скобки выделяются bytes.translate, а пары сокращаются bytes.replace —
+    до цикла Python доходит только несокращённый остаток. Если заданы
+    quotes/line_comments/block_comments, строки и комментарии сначала
+    вырезаются одним re.split. Смещение ошибки ищется точным просмотром
+    только той части, в которой ошибка обнаружена.
+    """
+
+    def __init__(self, quotes=b'', escape=b'\\', line_comments=(), block_comments=(),
+                 max_passes=32, stack=b'', offset=0):
+        # stack и offset позволяют продолжить проверку с середины потока
+        self.stack = bytearray(stack)
+        self.error_offset = None
+        self.max_passes = max_passes
+        self._base = offset
+        self._pending = b''
+        self._finished = False
+        self._quotes = bytes(quotes)
+        self._line_comments = tuple(line_comments)
+        self._block_comments = dict(block_comments)
+        self._plain = not (self._quotes or self._line_comments or self._block_comments)
+        self._state = 'code'
+        self._quote = None
+        self._block_end = None
+        if not self._plain:
+            self._compile(escape)
+
+    def _compile(self, escape):
+        starters = [re.escape(bytes([quote])) for quote in self._quotes]
+        starters += [re.escape(token) for token in
+                     sorted(self._line_comments + tuple(self._block_comments), key=len, reverse=True)]
+        starter = b'|'.join(starters)
+        # Токены в коде: скобки и начала строк/комментариев
+        self._token_re = re.compile(rb'[()\[\]{}]|' + starter)
+
+        esc = re.escape(escape) if escape else b''
+        self._string_re = {}
+        complete = []
+        for quote in self._quotes:
+            q = re.escape(bytes([quote]))
+            plain = b'[^' + q + esc + b']*'
+            body = plain + b'(?:' + esc + b'.' + plain + b')*' if esc else plain
+            self._string_re[quote] = re.compile(body, re.S)
+            complete.append(q + body + q)
+        complete += [re.escape(token) + rb'[^\n]*\n' for token in self._line_comments]
+        complete += [re.escape(start) + b'.*?' + re.escape(end)
+                     for start, end in self._block_comments.items()]
+        # Законченные строки и комментарии — разделители для re.split;
+        # незаконченная строка или комментарий в конце части попадает в группу
+        self._strip_re = re.compile(
+            b'|'.join(complete) + b'|((?:' + starter + rb').*\Z)', re.S)
+        self._multi_byte_tokens = [token for token in self._line_comments + tuple(self._block_comments)
+                                   if len(token) > 1]
+
+    @property
+    def offset(self):
+        # Число байтов, принятых на проверку
+        return self._base + len(self._pending)
+
+    def feed(self, chunk):
+        if self._finished:
+            raise ValueError("feed() called after finish()")
+        if self.error_offset is not None:
+            return False
+        if self._plain:
+            self._feed_plain(bytes(chunk))
+        else:
+            self._feed_tokens(self._pending + bytes(chunk), final=False)
+        return self.error_offset is None
+
+    def finish(self):
+        if not self._finished:
+            self._finished = True
+            if self.error_offset is None and not self._plain:
+                self._feed_tokens(self._pending, final=True)
+            if self.error_offset is None and (self.stack or self._state in ('string', 'block_comment')):
+                self.error_offset = self.offset
+        return self.error_offset is None
+
+    def _apply_brackets(self, brackets):
+        # Применение последовательности скобок к стеку. Стек меняется только
+        # при успехе; при ошибке возвращается False
+        reduced = reduce_brackets(brackets, self.max_passes)
+        stack = self.stack
+        depth = len(stack)
+        popped = 0
+        local = bytearray()
+        for byte in reduced:
+            if byte in OPENERS:
+                local.append(byte)
+            elif local:
+                if local[-1] != MATCHING[byte]:
+                    return False
+                local.pop()
+            else:
+                if popped == depth or stack[depth - 1 - popped] != MATCHING[byte]:
+                    return False
+                popped += 1
+        del stack[depth - popped:]
+        stack += local
+        return True
+        # Временная сложность: O(n) на уровне C + O(r) в Python для остатка r
+
+    def _feed_plain(self, chunk):
+        if self._apply_brackets(chunk.translate(None, NON_BRACKETS)):
+            self._base += len(chunk)
+        else:
+            self._scan_exact(chunk)
+
+    def _scan_exact(self, chunk):
+        # Точный просмотр части: скобки находит регулярное выражение
+        stack = self.stack
+        for match in BRACKET_RE.finditer(chunk):
+            byte = chunk[match.start()]
+            if byte in OPENERS:
+                stack.append(byte)
+            elif not stack or stack[-1] != MATCHING[byte]:
+                self.error_offset = self._base + match.start()
+                return
+            else:
+                stack.pop()
+        self._base += len(chunk)
+
+    def _feed_tokens(self, data, final):
+        # Дочитывание строки или комментария, начатого в прошлой части
+        pos = self._scan_tokens(data, 0, stop_at_code=True)
+        if self._state == 'code':
+            code_end = self._feed_code(data, pos, final)
+            # При ошибке — точный просмотр той же части с неизменённым стеком
+            pos = self._scan_tokens(data, pos if code_end is None else code_end)
+            if self.error_offset is not None:
+                return
+        keep = 0 if final else self._holdback(data, pos)
+        self._pending = data[len(data) - keep:] if keep else b''
+        self._base += len(data) - keep
+
+    def _feed_code(self, data, pos, final):
+        # Быстрый путь для data[pos:] в состоянии "код". Возвращает позицию,
+        # до которой скобки учтены (начало незаконченной строки/комментария
+        # или отложенного префикса), либо None при ошибке
+        parts = self._strip_re.split(data[pos:])
+        tail = parts[-2] if len(parts) > 1 else None
+        code = b''.join(parts[0::2])
+        if tail is not None:
+            code_end = len(data) - len(tail)
+        else:
+            # Откладываются только байты последнего участка кода (после
+            # последней вырезанной строки/комментария): конец законченного
+            # комментария, например "/" из "*/", не может начать новый токен
+            keep = 0 if final else self._holdback(data, max(pos, len(data) - len(parts[-1])))
+            code_end = len(data) - keep
+            code = code[:len(code) - keep]
+        if not self._apply_brackets(code.translate(None, NON_BRACKETS)):
+            return None
+        return code_end
+
+    def _bracket(self, byte, offset):
+        stack = self.stack
+        if byte in OPENERS:
+            stack.append(byte)
+        elif not stack or stack[-1] != MATCHING[byte]:
+            self.error_offset = offset
+            return False
+        else:
+            stack.pop()
+        return True
+
+    def _scan_tokens(self, data, pos, stop_at_code=False):
+        # Лексер по токенам. Возвращает позицию, начиная с которой в data
+        # нет токенов текущего состояния
+        n = len(data)
+        while pos < n:
+            if self._state == 'code':
+                if stop_at_code:
+                    break
+                match = self._token_re.search(data, pos)
+                if match is None:
+                    break
+                token = match.group()
+                pos = match.end()
+                if len(token) == 1 and token in b'()[]{}':
+                    if not self._bracket(token[0], self._base + match.start()):
+                        break
+                elif len(token) == 1 and token in self._quotes:
+                    self._state = 'string'
+                    self._quote = token[0]
+                elif token in self._line_comments:
+                    self._state = 'line_comment'
+                else:
+                    self._state = 'block_comment'
+                    self._block_end = self._block_comments[token]
+            elif self._state == 'string':
+                end = self._string_re[self._quote].match(data, pos).end()
+                if end < n and data[end] == self._quote:
+                    self._state = 'code'
+                    pos = end + 1
+                else:
+                    pos = end
+                    break
+            elif self._state == 'line_comment':
+                end = data.find(b'\n', pos)
+                if end < 0:
+                    break
+                self._state = 'code'
+                pos = end + 1
+            else:
+                end = data.find(self._block_end, pos)
+                if end < 0:
+                    break
+                self._state = 'code'
+                pos = end + len(self._block_end)
+        return pos
+
+    def _holdback(self, data, pos):
+        # Сколько последних байтов отложить до следующей части: они могут
+        # оказаться началом многобайтового токена, разрезанного границей частей.
+        # В data[pos:] токенов текущего состояния нет
+        n = len(data)
+        if self._state == 'string':
+            return n - pos
+        if self._state == 'block_comment':
+            candidates = [self._block_end]
+        elif self._state == 'code':
+            candidates = self._multi_byte_tokens
+        else:
+            return 0
+        for token in candidates:
+            for k in range(len(token) - 1, 0, -1):
+                if n - k >= pos and data[n - k:] == token[:k]:
+                    return k
+        return 0
+
+def check_stream(stream, chunk_size=1 << 20, **options):
+    # Проверка файлового объекта, открытого в двоичном режиме.
+    # Возвращает (сбалансировано ли, смещение первой ошибки или None)
+    checker = StreamingBracketChecker(**options)
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        if not checker.feed(chunk):
+            break
+    checker.finish()
+    return checker.error_offset is None, checker.error_offset
+
+def check_file(path, chunk_size=1 << 20, **options):
+    with open(path, 'rb') as f:
+        return check_stream(f, chunk_size, **options)
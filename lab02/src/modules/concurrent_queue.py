@@ -0,0 +1,193 @@
+import threading
+import time
+from queue import Empty, Full
+
+from .linked_list import Node
+
+class ConcurrentQueue:
+    """
+    Потокобезопасная очередь FIFO на узлах связного списка (Node из
+    linked_list) с двумя блокировками, как LinkedBlockingQueue в Java.
+
+    Список всегда начинается с фиктивного узла: производители меняют только
+    tail под _put_lock, потребители — только head под _get_lock, поэтому
+    вставка и извлечение не блокируют друг друга. Общего счётчика нет:
+    производители увеличивают _put_total, потребители — _get_total (каждый
+    под своей блокировкой), размер очереди — их разность. Чужая блокировка берётся для
+    пробуждения, только если на другой стороне есть ожидающие потоки;
+    ожидающие на своей стороне будятся по цепочке.
+
+    capacity=None — без ограничения, иначе put блокируется при заполнении.
+    При истечении timeout выбрасываются queue.Empty и queue.Full, как
+    у queue.Queue.
+    """
+
+    def __init__(self, capacity=None):
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self.capacity = capacity
+        self._head = self._tail = Node(None)
+        self._put_total = 0
+        self._get_total = 0
+        self._put_waiters = 0
+        self._get_waiters = 0
+        self._put_lock = threading.Lock()
+        self._get_lock = threading.Lock()
+        self._not_full = threading.Condition(self._put_lock)
+        self._not_empty = threading.Condition(self._get_lock)
+
+    @property
+    def _count(self):
+        return self._put_total - self._get_total
+
+    def __len__(self):
+        return self._count
+
+    def qsize(self):
+        return self._count
+
+    def empty(self):
+        return self._count == 0
+
+    @staticmethod
+    def _wait(condition, deadline):
+        # Ожидание с общим сроком; False — срок истёк (условие вызывающий проверяет сам)
+        if deadline is None:
+            condition.wait()
+            return True
+        remaining = deadline - time.monotonic()
+        return remaining > 0 and condition.wait(remaining)
+
+    @staticmethod
+    def _deadline(block, timeout):
+        if not block:
+            return 0.0
+        if timeout is None:
+            return None
+        if timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+        return time.monotonic() + timeout
+
+    def _wait_for_space(self, deadline):
+        # Вызывается под _put_lock. Счётчик ожидающих увеличивается до
+        # проверки условия, поэтому потребитель, увеличивший _get_total,
+        # увидит ожидающего производителя и разбудит его
+        self._put_waiters += 1
+        try:
+            while self._count >= self.capacity:
+                # По истечении срока условие проверяется ещё раз: место могло
+                # освободиться в момент пробуждения
+                if not self._wait(self._not_full, deadline) and self._count >= self.capacity:
+                    raise Full
+        finally:
+            self._put_waiters -= 1
+
+    def _wait_for_items(self, deadline):
+        # Вызывается под _get_lock, симметрично _wait_for_space
+        self._get_waiters += 1
+        try:
+            while self._count == 0:
+                if not self._wait(self._not_empty, deadline) and self._count == 0:
+                    raise Empty
+        finally:
+            self._get_waiters -= 1
+
+    def _signal_not_empty(self, count):
+        # Блокировка потребителей берётся, только если кто-то из них ждёт
+        if self._get_waiters:
+            with self._not_empty:
+                self._not_empty.notify(count)
+
+    def _signal_not_full(self, count):
+        if self._put_waiters:
+            with self._not_full:
+                self._not_full.notify(count)
+
+    def put(self, item, block=True, timeout=None):
+        node = Node(item)
+        with self._put_lock:
+            if self.capacity is not None and self._count >= self.capacity:
+                self._wait_for_space(self._deadline(block, timeout))
+            self._tail.next = node
+            self._tail = node
+            before = self._put_total - self._get_total
+            self._put_total += 1
+            if self._put_waiters and before + 1 < self.capacity:
+                self._not_full.notify()
+        self._signal_not_empty(1)
+        # Временная сложность: O(1)
+
+    def put_many(self, items, block=True, timeout=None):
+        """
+        Добавление элементов по порядку. Узлы связываются в цепочку и
+        присоединяются к хвосту за одну операцию (при ограниченной ёмкости —
+        частями по мере освобождения места). При истечении timeout уже
+        добавленные элементы остаются в очереди.
+        """
+        items = list(items)
+        deadline = self._deadline(block, timeout)
+        pos = 0
+        while pos < len(items):
+            with self._put_lock:
+                if self.capacity is None:
+                    free = len(items) - pos
+                else:
+                    if self._count >= self.capacity:
+                        self._wait_for_space(deadline)
+                    free = self.capacity - self._count
+                count = min(free, len(items) - pos)
+                first = last = Node(items[pos])
+                for data in items[pos + 1:pos + count]:
+                    last.next = Node(data)
+                    last = last.next
+                self._tail.next = first
+                self._tail = last
+                before = self._put_total - self._get_total
+                self._put_total += count
+                pos += count
+                if self._put_waiters and before + count < self.capacity:
+                    self._not_full.notify()
+            self._signal_not_empty(count)
+        # Временная сложность: O(k), блокировки берутся O(1) раз на порцию
+
+    def get(self, block=True, timeout=None):
+        with self._get_lock:
+            if self._count == 0:
+                self._wait_for_items(self._deadline(block, timeout))
+            node = self._head.next
+            item = node.data
+            node.data = None  # узел становится фиктивным
+            self._head = node
+            before = self._put_total - self._get_total
+            self._get_total += 1
+            if self._get_waiters and before > 1:
+                self._not_empty.notify()
+        self._signal_not_full(1)
+        return item
+        # Временная сложность: O(1)
+
+    def get_many(self, max_items, block=True, timeout=None):
+        """
+        Извлечение до max_items элементов: ждёт хотя бы одного, затем
+        забирает все доступные (но не больше max_items) под одной блокировкой.
+        """
+        if max_items < 1:
+            raise ValueError("max_items must be >= 1")
+        with self._get_lock:
+            if self._count == 0:
+                self._wait_for_items(self._deadline(block, timeout))
+            count = min(max_items, self._count)
+            items = []
+            head = self._head
+            for _ in range(count):
+                head = head.next
+                items.append(head.data)
+                head.data = None
+            self._head = head
+            before = self._put_total - self._get_total
+            self._get_total += count
+            if self._get_waiters and before > count:
+                self._not_empty.notify()
+        self._signal_not_full(count)
+        return items
+        # Временная сложность: O(k)
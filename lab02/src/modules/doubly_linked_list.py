@@ -0,0 +1,102 @@
+class DNode:
+    __slots__ = ('data', 'prev', 'next')
+
+    def __init__(self, data):
+        self.data = data
+        self.prev = None
+        self.next = None
+    # Узел служит дескриптором (handle): он не меняется, пока элемент в списке,
+    # поэтому по нему элемент можно удалить или переместить за O(1)
+
+
+class DoublyLinkedList:
+    """
+    Двусвязный список с фиктивным узлом _root: список замкнут в кольцо
+    (_root.next — первый узел, _root.prev — последний), поэтому вставка
+    и удаление не проверяют крайние случаи. Методы вставки возвращают
+    узел-дескриптор для последующих remove и move_to_front.
+    """
+
+    def __init__(self):
+        self._root = DNode(None)
+        self._root.prev = self._root.next = self._root
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+        # Временная сложность: O(1)
+
+    def __iter__(self):
+        node = self._root.next
+        while node is not self._root:
+            yield node.data
+            node = node.next
+        # Временная сложность: O(n)
+
+    def _link_after(self, node, prev):
+        node.prev = prev
+        node.next = prev.next
+        prev.next.prev = node
+        prev.next = node
+        self.size += 1
+        return node
+
+    def _unlink(self, node):
+        node.prev.next = node.next
+        node.next.prev = node.prev
+        node.prev = node.next = None
+        self.size -= 1
+
+    def insert_at_start(self, data):
+        return self._link_after(DNode(data), self._root)
+        # Временная сложность: O(1)
+
+    def insert_at_end(self, data):
+        return self._link_after(DNode(data), self._root.prev)
+        # Временная сложность: O(1)
+
+    def remove(self, handle):
+        # handle — узел, возвращённый insert_at_start/insert_at_end
+        if handle.next is None:
+            raise ValueError("node is not in the list")
+        self._unlink(handle)
+        return handle.data
+        # Временная сложность: O(1)
+
+    def move_to_front(self, handle):
+        if handle.next is None:
+            raise ValueError("node is not in the list")
+        if handle.prev is not self._root:
+            # Перестановка без изменения size
+            handle.prev.next = handle.next
+            handle.next.prev = handle.prev
+            root = self._root
+            handle.prev = root
+            handle.next = root.next
+            root.next.prev = handle
+            root.next = handle
+        # Временная сложность: O(1)
+
+    def delete_from_start(self):
+        if self.size == 0:
+            return None
+        return self.remove(self._root.next)
+        # Временная сложность: O(1)
+
+    def pop_back(self):
+        if self.size == 0:
+            return None
+        return self.remove(self._root.prev)
+        # Временная сложность: O(1)
+
+    def peek_back(self):
+        # Дескриптор последнего узла или None
+        return self._root.prev if self.size else None
+
+    def traversal(self):
+        return list(self)
+        # Временная сложность: O(n)
+
+    def is_empty(self):
+        return self.size == 0
+        # Временная сложность: O(1)
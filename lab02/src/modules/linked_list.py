@@ -1,54 +1,111 @@
 class Node:
+    __slots__ = ('data', 'next')
 
     def __init__(self, data):
         self.data = data
         self.next = None
+    # __slots__ убирает у каждого узла словарь атрибутов: узел занимает
+    # примерно втрое меньше памяти и создаётся быстрее
+
+
+class NodePool:
+    """
+    Пул свободных узлов (free list). Узлы, освобождённые delete_from_start,
+    не отдаются сборщику мусора, а используются повторно при вставке.
+    Свободные узлы связаны между собой через поле next, поэтому пул не
+    требует дополнительной памяти. Один пул можно разделять между списками.
+    """
+
+    def __init__(self, max_size=None):
+        self.max_size = max_size
+        self.size = 0
+        self._free = None
+
+    def acquire(self, data):
+        node = self._free
+        if node is None:
+            return Node(data)
+        self._free = node.next
+        self.size -= 1
+        node.data = data
+        node.next = None
+        return node
+        # Временная сложность: O(1)
+
+    def release(self, node):
+        if self.max_size is not None and self.size >= self.max_size:
+            return
+        node.data = None  # не удерживаем ссылку на удалённые данные
+        node.next = self._free
+        self._free = node
+        self.size += 1
+        # Временная сложность: O(1)
+
 
 class LinkedList:
-    
-    def __init__(self):
+
+    def __init__(self, pool=None):
         self.head = None
         self.tail = None
-    
+        self.size = 0
+        self.pool = pool
+
+    def _new_node(self, data):
+        if self.pool is not None:
+            return self.pool.acquire(data)
+        return Node(data)
+
+    def __len__(self):
+        return self.size
+        # Временная сложность: O(1) — размер поддерживается при вставке и удалении
+
+    def __iter__(self):
+        current = self.head
+        while current:
+            yield current.data
+            current = current.next
+        # Временная сложность: O(n) на весь обход, O(1) дополнительной памяти
+
     def insert_at_start(self, data):
-        new_node = Node(data)
+        new_node = self._new_node(data)
         if self.head is None:
             self.head = new_node
             self.tail = new_node
         else:
             new_node.next = self.head
             self.head = new_node
+        self.size += 1
         # Временная сложность: O(1) — операция выполняется за постоянное время
-    
+
     def insert_at_end(self, data):
-        new_node = Node(data)
+        new_node = self._new_node(data)
         if self.head is None:
             self.head = new_node
             self.tail = new_node
         else:
             self.tail.next = new_node
             self.tail = new_node
+        self.size += 1
         # Временная сложность: O(1) — добавление в конец происходит за фиксированное время благодаря указателю tail
-    
+
     def delete_from_start(self):
         if self.head is None:
             return None
-        data = self.head.data
-        self.head = self.head.next
+        node = self.head
+        data = node.data
+        self.head = node.next
         if self.head is None:
             self.tail = None
+        self.size -= 1
+        if self.pool is not None:
+            self.pool.release(node)
         return data
         # Временная сложность: O(1) — удаление первого элемента не зависит от размера списка
-    
+
     def traversal(self):
-        current = self.head
-        elements = []
-        while current:
-            elements.append(current.data)
-            current = current.next
-        return elements
+        return list(self)
         # Временная сложность: O(n) — требуется пройти по всем n узлам списка
-    
+
     def is_empty(self):
         return self.head is None
-        # Временная сложность: O(1) — проверка наличия головного узла выполняется мгновенно
\ No newline at end of file
+        # Временная сложность: O(1) — проверка наличия головного узла выполняется мгновенно
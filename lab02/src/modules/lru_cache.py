@@ -0,0 +1,86 @@
+from .doubly_linked_list import DoublyLinkedList
+
+_MISSING = object()
+
+class LRUCache:
+    """
+    Кэш с вытеснением давно не использованных элементов (LRU).
+
+    Словарь отображает ключ в узел двусвязного списка, в узле хранится
+    пара (ключ, значение). Недавно использованные элементы — в начале
+    списка, поэтому обращение переносит узел в начало (move_to_front),
+    а вытесняется последний (pop_back) — всё за O(1).
+    on_evict(key, value) вызывается для каждого вытесненного элемента.
+    """
+
+    def __init__(self, capacity, on_evict=None):
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self.capacity = capacity
+        self.on_evict = on_evict
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._nodes = {}
+        self._order = DoublyLinkedList()
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __contains__(self, key):
+        # Проверка без учёта в статистике и без изменения порядка
+        return key in self._nodes
+
+    def get(self, key, default=None):
+        node = self._nodes.get(key)
+        if node is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._order.move_to_front(node)
+        return node.data[1]
+        # Временная сложность: O(1)
+
+    def put(self, key, value):
+        node = self._nodes.get(key)
+        if node is not None:
+            node.data = (key, value)
+            self._order.move_to_front(node)
+            return
+        self._nodes[key] = self._order.insert_at_start((key, value))
+        if len(self._nodes) > self.capacity:
+            old_key, old_value = self._order.pop_back()
+            del self._nodes[old_key]
+            self.evictions += 1
+            if self.on_evict is not None:
+                self.on_evict(old_key, old_value)
+        # Временная сложность: O(1)
+
+    def get_or_compute(self, key, compute):
+        # Значение из кэша или compute(key) с сохранением результата
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute(key)
+            self.put(key, value)
+        return value
+
+    def pop(self, key, default=None):
+        node = self._nodes.pop(key, None)
+        if node is None:
+            return default
+        return self._order.remove(node)[1]
+        # Временная сложность: O(1)
+
+    def keys(self):
+        # Ключи от недавно использованных к давно использованным
+        return [key for key, _ in self._order]
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._nodes),
+            'hit_rate': self.hits / total if total else 0.0,
+        }
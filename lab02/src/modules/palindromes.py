@@ -0,0 +1,106 @@
+import numpy as np
+
+BYTES_TYPES = (bytes, bytearray, memoryview)
+
+def is_palindrome(sequence, block=4096):
+    """
+    Проверка палиндрома без копирования всей последовательности.
+
+    bytes/bytearray/memoryview рассматриваются как массив NumPy без
+    копирования (np.frombuffer), str сравнивается срезами по block символов;
+    концы сравниваются попарно блоками, начиная с краёв, поэтому при
+    несовпадении проверка заканчивается рано, а дополнительная память —
+    O(block). Прочие последовательности проверяются двумя указателями.
+    """
+    if isinstance(sequence, BYTES_TYPES):
+        if isinstance(sequence, memoryview):
+            arr = np.asarray(sequence).reshape(-1)  # тип элементов — по формату memoryview
+        else:
+            arr = np.frombuffer(sequence, dtype=np.uint8)
+        n = arr.size
+        reverse = arr[::-1]
+        for start in range(0, n // 2, block):
+            stop = min(start + block, n // 2)
+            if not np.array_equal(arr[start:stop], reverse[start:stop]):
+                return False
+        return True
+    if isinstance(sequence, str):
+        n = len(sequence)
+        for start in range(0, n // 2, block):
+            stop = min(start + block, n // 2)
+            # Правый блок sequence[n - stop:n - start], прочитанный справа налево
+            if sequence[start:stop] != sequence[n - start - 1:n - stop - 1:-1]:
+                return False
+        return True
+    left, right = 0, len(sequence) - 1
+    while left < right:
+        if sequence[left] != sequence[right]:
+            return False
+        left += 1
+        right -= 1
+    return True
+    # Временная сложность: O(n), дополнительная память O(block)
+
+def batch_is_palindrome(items):
+    """
+    Проверка большого числа коротких строк или bytes.
+    Возвращает np.ndarray[bool] в порядке items.
+
+    Для строк из единиц–десятков символов время уходит на обращение
+    к каждому элементу из Python, а не на само сравнение: склейка в матрицы
+    NumPy по длинам (len, сортировка, join) оказывается медленнее, чем
+    одно сравнение item == item[::-1] на C-уровне для каждого элемента.
+    """
+    return np.array([item == item[::-1] for item in items], dtype=bool)
+    # Временная сложность: O(суммарной длины)
+
+def manacher(sequence):
+    """
+    Алгоритм Манакера. d1[i] — число палиндромов нечётной длины с центром
+    в i (радиус, считая центр), d2[i] — число палиндромов чётной длины
+    с центром между i - 1 и i. Уже найденный самый правый палиндром [l, r]
+    даёт нижнюю оценку радиуса по зеркальной позиции, поэтому каждый
+    символ расширяет r не более одного раза.
+    """
+    n = len(sequence)
+    d1 = [0] * n
+    left, right = 0, -1
+    for i in range(n):
+        k = 1 if i > right else min(d1[left + right - i], right - i + 1)
+        while i - k >= 0 and i + k < n and sequence[i - k] == sequence[i + k]:
+            k += 1
+        d1[i] = k
+        if i + k - 1 > right:
+            left, right = i - k + 1, i + k - 1
+
+    d2 = [0] * n
+    left, right = 0, -1
+    for i in range(n):
+        k = 0 if i > right else min(d2[left + right - i + 1], right - i + 1)
+        while i - k - 1 >= 0 and i + k < n and sequence[i - k - 1] == sequence[i + k]:
+            k += 1
+        d2[i] = k
+        if i + k - 1 > right:
+            left, right = i - k, i + k - 1
+    return d1, d2
+    # Временная сложность: O(n)
+
+def longest_palindrome(sequence):
+    # Самая длинная палиндромная подстрока (первая из самых длинных)
+    if not len(sequence):
+        return sequence[:0]
+    d1, d2 = manacher(sequence)
+    start, length = 0, 1
+    for i in range(len(sequence)):
+        if 2 * d1[i] - 1 > length:
+            start, length = i - d1[i] + 1, 2 * d1[i] - 1
+        if 2 * d2[i] > length:
+            start, length = i - d2[i], 2 * d2[i]
+    return sequence[start:start + length]
+    # Временная сложность: O(n)
+
+def count_palindromes(sequence):
+    # Число палиндромных подстрок (с учётом позиций)
+    d1, d2 = manacher(sequence)
+    return sum(d1) + sum(d2)
+    # Временная сложность: O(n)
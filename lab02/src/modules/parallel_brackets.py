@@ -0,0 +1,151 @@
+import collections
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+from .bracket_checker import (MATCHING, NON_BRACKETS, OPENERS, StreamingBracketChecker,
+                              reduce_brackets)
+
+# Сводка части: bad — внутри части есть несовпадение вида "(]";
+# closers — незакрытые слева закрывающие, openers — незакрытые открывающие
+BracketSummary = collections.namedtuple('BracketSummary', ['bad', 'closers', 'openers'])
+
+EMPTY_SUMMARY = BracketSummary(False, b'', b'')
+BAD_SUMMARY = BracketSummary(True, b'', b'')
+
+OPEN_TO_CLOSE = bytes.maketrans(b'([{', b')]}')
+
+# Объём сводок, начиная с которого уровни дерева объединяются в пуле процессов
+PARALLEL_MERGE_BYTES = 1 << 20
+
+def summarize(data, max_passes=32):
+    # Сведение части к паре (закрывающие, открывающие)
+    reduced = reduce_brackets(bytes(data).translate(None, NON_BRACKETS), max_passes)
+    closers = bytearray()
+    stack = bytearray()
+    for byte in reduced:
+        if byte in OPENERS:
+            stack.append(byte)
+        elif stack:
+            if stack[-1] != MATCHING[byte]:
+                return BAD_SUMMARY
+            stack.pop()
+        else:
+            closers.append(byte)
+    return BracketSummary(False, bytes(closers), bytes(stack))
+    # Временная сложность: O(n) на уровне C + O(r) в Python для остатка r
+
+def combine(left, right):
+    """
+    Ассоциативное объединение сводок соседних частей: открывающие левой
+    части закрываются закрывающими правой, сравнение — одной операцией
+    над bytes. EMPTY_SUMMARY — нейтральный элемент.
+    """
+    if left.bad or right.bad:
+        return BAD_SUMMARY
+    openers, closers = left.openers, right.closers
+    k = min(len(openers), len(closers))
+    if openers[len(openers) - k:][::-1].translate(OPEN_TO_CLOSE) != closers[:k]:
+        return BAD_SUMMARY
+    return BracketSummary(False, left.closers + closers[k:], openers[:len(openers) - k] + right.openers)
+    # Временная сложность: O(|left| + |right|)
+
+def exclusive_scan(items, operation, identity, map_func=map):
+    """
+    Исключающий префиксный скан (up-sweep / down-sweep): result[i] —
+    объединение items[0..i-1]. На каждом уровне дерева объединения
+    независимы и выполняются через map_func (например, Executor.map).
+    Глубина O(log m), всего O(m) объединений.
+    """
+    if not items:
+        return []
+    if len(items) == 1:
+        return [identity]
+    pair_sums = list(map_func(operation, items[0::2], items[1::2]))
+    if len(items) % 2:
+        pair_sums.append(items[-1])
+    prefixes = exclusive_scan(pair_sums, operation, identity, map_func)
+    # Префикс для items[2i] известен, для items[2i + 1] — объединение с items[2i]
+    odd = list(map_func(operation, prefixes[:len(items) // 2], items[0::2]))
+    result = []
+    for i, prefix in enumerate(prefixes):
+        result.append(prefix)
+        if i < len(odd):
+            result.append(odd[i])
+    return result
+
+def _reduce_chunk(path, start, end, max_passes):
+    """Задача рабочего процесса: сводка части [start, end) файла через mmap."""
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return summarize(mm[start:end], max_passes)
+
+class ParallelBracketValidator:
+    """
+    Параллельная проверка скобок в файле.
+
+    Файл делится на части, каждую часть рабочий процесс читает через mmap
+    и сводит к BracketSummary. Исключающий префиксный скан сводок даёт
+    состояние стека перед каждой частью; первая часть, после которой
+    состояние становится ошибочным, просматривается заново точно
+    (StreamingBracketChecker с восстановленным стеком) — так получается
+    точное смещение первой ошибки, как у последовательной проверки.
+
+    Сложность: O(n / p) на чтение и сведение при p процессах,
+    O(m) объединений глубиной O(log m) для m частей.
+    """
+
+    def __init__(self, workers=None, chunk_size=1 << 26, max_passes=32):
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.max_passes = max_passes
+        self._pool = ProcessPoolExecutor(self.workers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        self._pool.shutdown()
+
+    def _ranges(self, size):
+        # Частей не меньше, чем процессов
+        step = max(min(self.chunk_size, -(-size // self.workers)), 1)
+        return [(start, min(start + step, size)) for start in range(0, size, step)]
+
+    def validate(self, path):
+        """
+        Возвращает (сбалансировано ли, смещение первой ошибки или None) —
+        тот же результат, что и check_file.
+        """
+        size = os.path.getsize(path)
+        ranges = self._ranges(size)
+        if not ranges:
+            return True, None
+        starts = [start for start, _ in ranges]
+        ends = [end for _, end in ranges]
+        summaries = list(self._pool.map(_reduce_chunk, repeat(path), starts, ends,
+                                        repeat(self.max_passes)))
+        total_bytes = sum(len(s.closers) + len(s.openers) for s in summaries)
+        map_func = self._pool.map if total_bytes >= PARALLEL_MERGE_BYTES else map
+        prefixes = exclusive_scan(summaries, combine, EMPTY_SUMMARY, map_func)
+
+        for (start, end), prefix, summary in zip(ranges, prefixes, summaries):
+            state = combine(prefix, summary)
+            if state.bad or state.closers:
+                return False, self._locate_error(path, start, end, prefix.openers)
+        if combine(prefixes[-1], summaries[-1]).openers:
+            return False, size
+        return True, None
+
+    def _locate_error(self, path, start, end, stack):
+        # Точный просмотр первой ошибочной части со стеком перед ней
+        with open(path, 'rb') as f:
+            f.seek(start)
+            chunk = f.read(end - start)
+        checker = StreamingBracketChecker(max_passes=self.max_passes, stack=stack, offset=start)
+        checker.feed(chunk)
+        return checker.error_offset
@@ -1,6 +1,91 @@
 import timeit
+import tracemalloc
 import collections
-from .linked_list import LinkedList
+import functools
+import queue
+import statistics
+import threading
+from .linked_list import LinkedList, NodePool
+from .unrolled_linked_list import UnrolledLinkedList
+from .ring_queue import RingQueue
+from .bracket_checker import check_file
+from .parallel_brackets import ParallelBracketValidator
+from .task_solutions import is_balanced_brackets, is_palindrome_deque
+from .concurrent_queue import ConcurrentQueue
+from .lru_cache import LRUCache
+from .sliding_window import sliding_min, sliding_min_array, sliding_median
+from .palindromes import is_palindrome, batch_is_palindrome, longest_palindrome, count_palindromes
+from .print_simulation import PrintQueueSimulator, exponential, simulate_replications
+import numpy as np
+import os
+import tempfile
+
+class DictNode:
+    # Узел без __slots__ (как до оптимизации) — для сравнения
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+
+class DictNodeLinkedList(LinkedList):
+
+    def _new_node(self, data):
+        return DictNode(data)
+
+def measure_call_time(func):
+    # Время одного вызова func() в секундах
+    start = timeit.default_timer()
+    func()
+    return timeit.default_timer() - start
+
+def measure_memory_per_element(make_list, size):
+    # Средний прирост памяти на элемент по данным tracemalloc
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    container = make_list(size)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del container
+    return (after - before) / size
+
+def fill_linked_list(list_class, size, **kwargs):
+    ll = list_class(**kwargs)
+    for i in range(size):
+        ll.insert_at_end(i)
+    return ll
+
+def measure_queue_ops_per_second(make_list, operations=200000, backlog=1000):
+    # Очередь с постоянной нагрузкой: вставка в конец + удаление из начала
+    ll = make_list()
+    for i in range(backlog):
+        ll.insert_at_end(i)
+
+    def churn():
+        for i in range(operations):
+            ll.insert_at_end(i)
+            ll.delete_from_start()
+
+    elapsed = min(timeit.repeat(churn, number=1, repeat=3))
+    return 2 * operations / elapsed
+
+def compare_node_layouts(size=100000):
+
+    print("\nПамять и скорость узлов LinkedList:")
+    print("Вариант\t\t\tБайт на элемент\tОпераций очереди/с")
+
+    variants = [
+        ("dict-узлы (до)", lambda: DictNodeLinkedList()),
+        ("__slots__ (после)", lambda: LinkedList()),
+        ("__slots__ + пул", lambda: LinkedList(pool=NodePool())),
+    ]
+    results = {}
+    for name, make_list in variants:
+        memory = measure_memory_per_element(
+            lambda n: fill_linked_list(make_list, n), size)
+        ops = measure_queue_ops_per_second(make_list)
+        results[name] = (memory, ops)
+        print(f"{name:<20}\t{memory:.1f}\t\t{ops:,.0f}")
+
+    return results
 
 def compare_insertion_performance():
 
@@ -31,7 +116,9 @@ def compare_insertion_performance():
         list_times.append(list_time)
         linked_list_times.append(linked_list_time)
         print(f"{size}\t\t\t{list_time:.6f}\t\t{linked_list_time:.6f}")
-    
+
+    compare_node_layouts()
+
     return sizes, list_times, linked_list_times
 
 def compare_queue_performance():
@@ -68,9 +155,449 @@ def compare_queue_performance():
     
     return sizes, list_times, deque_times
 
-def run_performance_analysis():
+def compare_sequential_structures(sizes=(10**4, 10**5, 10**6, 10**7), pop_front_limit=10**5):
+
+    print("\nПоследовательная обработка: заполнение / обход / удаление из начала (секунды):")
+    print("Кол-во элементов\tСтруктура\t\tЗаполнение\tОбход\t\tУдаление")
+
+    def fill_by_one(make):
+        def fill(size):
+            container = make()
+            append = container.append if hasattr(container, 'append') else container.insert_at_end
+            for i in range(size):
+                append(i)
+            return container
+        return fill
+
+    structures = {
+        'list': (fill_by_one(list), lambda c: c.pop(0)),
+        'deque': (fill_by_one(collections.deque), lambda c: c.popleft()),
+        'LinkedList': (fill_by_one(LinkedList), lambda c: c.delete_from_start()),
+        'UnrolledLinkedList': (fill_by_one(UnrolledLinkedList), lambda c: c.delete_from_start()),
+        'Unrolled.extend': (lambda size: UnrolledLinkedList(iterable=range(size)),
+                            lambda c: c.delete_from_start()),
+    }
+    results = {}
+    for size in sizes:
+        for name, (fill, pop_front) in structures.items():
+            start = timeit.default_timer()
+            container = fill(size)
+            fill_time = timeit.default_timer() - start
+
+            start = timeit.default_timer()
+            for _ in container:
+                pass
+            traversal_time = timeit.default_timer() - start
+
+            # list.pop(0) — O(n) на операцию, на больших размерах не замеряется
+            if name == 'list' and size > pop_front_limit:
+                drain_time = None
+            else:
+                start = timeit.default_timer()
+                for _ in range(size):
+                    pop_front(container)
+                drain_time = timeit.default_timer() - start
+
+            del container
+            results[(name, size)] = (fill_time, traversal_time, drain_time)
+            drain_text = f"{drain_time:.6f}" if drain_time is not None else "-"
+            print(f"{size}\t\t\t{name:<20}\t{fill_time:.6f}\t{traversal_time:.6f}\t{drain_text}")
+
+    print("\nПамять на элемент (байт, 10^5 элементов):")
+    for name, make_list in (('list', list), ('deque', collections.deque),
+                            ('LinkedList', LinkedList), ('UnrolledLinkedList', UnrolledLinkedList)):
+        fill = fill_by_one(make_list)
+        print(f"{name:<20}\t{measure_memory_per_element(fill, 10**5):.1f}")
+
+    return results
+
+def compare_ring_queue_performance(sizes=(10**4, 10**5, 10**6, 10**7, 10**8), batch=4096,
+                                   single_limit=10**6, deque_limit=10**7):
+
+    print("\nОчередь номеров задач: deque против RingQueue (секунды на n добавлений и n извлечений):")
+    print("Кол-во элементов\tdeque по одному\tRingQueue по одному\tdeque пакетами\tRingQueue пакетами")
+
+    results = {}
+    for size in sizes:
+        job_ids = np.arange(size, dtype=np.int64)
+        timings = {}
+
+        # Поэлементные операции — цикл Python, поэтому только до single_limit
+        if size <= single_limit:
+            def deque_single():
+                deq = collections.deque()
+                for job in range(size):
+                    deq.append(job)
+                for _ in range(size):
+                    deq.popleft()
+
+            def ring_single():
+                queue = RingQueue()
+                for job in range(size):
+                    queue.push(job)
+                for _ in range(size):
+                    queue.pop()
+
+            timings['deque_single'] = measure_call_time(deque_single)
+            timings['ring_single'] = measure_call_time(ring_single)
+
+        # deque хранит объекты int (~36 байт на элемент), поэтому до deque_limit
+        if size <= deque_limit:
+            def deque_bulk():
+                deq = collections.deque()
+                for start in range(0, size, batch):
+                    deq.extend(range(start, min(start + batch, size)))
+                while deq:
+                    [deq.popleft() for _ in range(min(batch, len(deq)))]
+
+            timings['deque_bulk'] = measure_call_time(deque_bulk)
+
+        def ring_bulk():
+            queue = RingQueue()
+            for start in range(0, size, batch):
+                queue.push_many(job_ids[start:start + batch])
+            while queue.size:
+                queue.pop_many(batch)
+
+        timings['ring_bulk'] = measure_call_time(ring_bulk)
+        results[size] = timings
+
+        row = "\t\t".join(f"{timings[key]:.6f}" if key in timings else "-\t"
+                           for key in ('deque_single', 'ring_single', 'deque_bulk', 'ring_bulk'))
+        print(f"{size}\t\t\t{row}")
+        del job_ids
+
+    return results
+
+# Фрагмент JSON с комментарием: скобки сбалансированы и в коде, и внутри строк,
+# поэтому обе проверки проходят файл целиком
+BRACKET_SAMPLE = b'{"id": [1, 2, {"k": "(x)"}], "v": (3)} // note []\n'
+BRACKET_OPTIONS = dict(quotes=b'"', line_comments=(b'//',), block_comments={b'/*': b'*/'})
+
+def write_bracket_file(path, size, block_size=1 << 24):
+    # Файл размером около size байт из повторов BRACKET_SAMPLE
+    block = BRACKET_SAMPLE * (block_size // len(BRACKET_SAMPLE))
+    written = 0
+    with open(path, 'wb') as f:
+        while written < size:
+            f.write(block)
+            written += len(block)
+    return written
+
+# Размеры файлов (ГБ) для проверки скобок: по умолчанию — небольшие, многогигабайтные
+# временные файлы записываются только по явному запросу (run_performance_analysis(large_files=True))
+BRACKET_SIZES_GB = (1 / 16, 1 / 4)
+LARGE_BRACKET_SIZES_GB = (1, 10)
+
+def compare_bracket_checker_throughput(sizes_gb=BRACKET_SIZES_GB, chunk_size=1 << 20, directory=None,
+                                       baseline_bytes=1 << 26):
+
+    print("\nПотоковая проверка скобок (МБ/с):")
+    print("Размер файла\tis_balanced_brackets\tтолько скобки\tсо строками и комментариями")
+
+    def throughput(func, size):
+        start = timeit.default_timer()
+        func()
+        return size / (1 << 20) / (timeit.default_timer() - start)
+
+    results = {}
+    for size_gb in sizes_gb:
+        fd, path = tempfile.mkstemp(suffix='.json', dir=directory)
+        os.close(fd)
+        try:
+            size = write_bracket_file(path, int(size_gb * (1 << 30)))
+            # Посимвольная проверка строки — только на первых baseline_bytes байтах
+            with open(path, 'rb') as f:
+                sample = f.read(baseline_bytes).decode('ascii')
+            timings = {
+                'baseline': throughput(lambda: is_balanced_brackets(sample), len(sample)),
+                'plain': throughput(lambda: check_file(path, chunk_size), size),
+                'skipping': throughput(lambda: check_file(path, chunk_size, **BRACKET_OPTIONS), size),
+            }
+            del sample
+        finally:
+            os.remove(path)
+        results[size_gb] = timings
+        label = f"{size_gb:g} ГБ"
+        print(f"{label:<16}{timings['baseline']:.1f}\t\t\t{timings['plain']:.1f}\t\t"
+              f"{timings['skipping']:.1f}")
+
+    return results
+
+def compare_parallel_bracket_validation(size_gb=1 / 4, workers=None, directory=None):
+
+    workers = workers or sorted({1, 2, 4, os.cpu_count() or 1})
+    print("\nПараллельная проверка скобок: ускорение относительно последовательной (check_file)")
+    print("Процессов\tСекунды\t\tМБ/с\t\tУскорение")
+
+    fd, path = tempfile.mkstemp(suffix='.json', dir=directory)
+    os.close(fd)
+    results = {}
+    try:
+        size = write_bracket_file(path, int(size_gb * (1 << 30)))
+        start = timeit.default_timer()
+        expected = check_file(path)
+        sequential = timeit.default_timer() - start
+        print(f"посл.\t\t{sequential:.3f}\t\t{size / (1 << 20) / sequential:.1f}\t\t1.00")
+
+        for count in workers:
+            with ParallelBracketValidator(workers=count) as validator:
+                validator.validate(path)  # запуск процессов пула не входит в замер
+                start = timeit.default_timer()
+                result = validator.validate(path)
+                elapsed = timeit.default_timer() - start
+            assert result == expected
+            results[count] = elapsed
+            print(f"{count}\t\t{elapsed:.3f}\t\t{size / (1 << 20) / elapsed:.1f}\t\t"
+                  f"{sequential / elapsed:.2f}")
+    finally:
+        os.remove(path)
+
+    return sequential, results
+
+def compare_print_queue_simulation(job_counts=(10**4, 10**5, 10**6, 10**7), printers=(1, 4),
+                                   load=0.8, seed=1):
+
+    print("\nДискретно-событийная модель печати (интервалы и время печати — экспоненциальные):")
+    print("Принтеров\tЗадач\t\tСекунды\t\tЗадач/с\t\tЗагрузка\tОжидание (ср.)\tp50\tp99")
+
+    results = {}
+    for k in printers:
+        simulator = PrintQueueSimulator(printers=k, interarrival=exponential(1.0),
+                                        service=exponential(load * k), seed=seed)
+        for jobs in job_counts:
+            start = timeit.default_timer()
+            stats = simulator.run(jobs)
+            elapsed = timeit.default_timer() - start
+            wait = stats['wait']
+            results[(k, jobs)] = elapsed
+            print(f"{k}\t\t{jobs}\t\t{elapsed:.3f}\t\t{jobs / elapsed:,.0f}\t"
+                  f"{stats['utilization']:.3f}\t\t{wait.mean:.3f}\t\t"
+                  f"{wait.percentile(50):.3f}\t{wait.percentile(99):.3f}")
+
+    # Для одного принтера (M/M/1) среднее ожидание известно точно: rho / (mu - lambda)
+    if 1 in printers:
+        print(f"Теоретическое среднее ожидание M/M/1: {load / (1 / load - 1):.3f}")
+
+    return results
+
+def compare_replication_batch(replication_counts=(10, 100, 1000), num_jobs=10**4, printers=(1, 4),
+                              load=0.8, warmup=1000, seed=1):
+
+    print("\nМонте-Карло: R репликаций одним вызовом против R запусков PrintQueueSimulator (секунды):")
+    print("Принтеров\tРепликаций\tЦикл\t\tПакетно\t\tУскорение\tСреднее ожидание [95% ДИ]\tp99 [95% ДИ]")
+
+    results = {}
+    for k in printers:
+        for replications in replication_counts:
+            start = timeit.default_timer()
+            for r in range(replications):
+                PrintQueueSimulator(printers=k, service=exponential(load * k), seed=seed + r).run(num_jobs)
+            loop_time = timeit.default_timer() - start
+
+            start = timeit.default_timer()
+            batch = simulate_replications(replications, num_jobs, printers=k,
+                                          service=exponential(load * k), seed=seed, warmup=warmup)
+            batch_time = timeit.default_timer() - start
+
+            results[(k, replications)] = (loop_time, batch_time)
+            mean, low, high = batch['mean_wait']
+            tail, tail_low, tail_high = batch['tail_wait']
+            print(f"{k}\t\t{replications}\t\t{loop_time:.3f}\t\t{batch_time:.3f}\t\t"
+                  f"{loop_time / batch_time:.1f}\t\t{mean:.3f} [{low:.3f}, {high:.3f}]\t"
+                  f"{tail:.3f} [{tail_low:.3f}, {tail_high:.3f}]")
+
+    return results
+
+def compare_palindrome_performance(sizes=(10**4, 10**5, 10**6, 10**7), batch_size=10**6,
+                                   manacher_sizes=(100, 200, 400), seed=1):
+
+    rng = np.random.default_rng(seed)
+
+    print("\nПроверка палиндрома (секунды; строка — палиндром, то есть проверяется целиком):")
+    print("Длина\t\tТип\tis_palindrome_deque\tis_palindrome")
+    single = {}
+    for size in sizes:
+        half = rng.integers(97, 123, size // 2, dtype=np.uint8).tobytes()
+        data = half + half[::-1]
+        for kind, sequence in (('bytes', data), ('str', data.decode('ascii'))):
+            deque_time = measure_call_time(lambda: is_palindrome_deque(sequence))
+            fast_time = measure_call_time(lambda: is_palindrome(sequence))
+            single[(size, kind)] = (deque_time, fast_time)
+            print(f"{size}\t\t{kind}\t{deque_time:.6f}\t\t{fast_time:.6f}")
+
+    # Короткие строки длиной 1..12, примерно половина — палиндромы
+    words = []
+    for length in rng.integers(1, 13, batch_size):
+        word = ''.join(chr(c) for c in rng.integers(97, 100, (length + 1) // 2))
+        words.append(word + word[::-1][length % 2:] if rng.random() < 0.5 else word * 2)
+    deque_time = measure_call_time(lambda: [is_palindrome_deque(word) for word in words])
+    batch_time = measure_call_time(lambda: batch_is_palindrome(words))
+    print(f"\nПакет из {batch_size} коротких строк: is_palindrome_deque {deque_time:.3f} с, "
+          f"batch_is_palindrome {batch_time:.3f} с")
+
+    print("\nСамый длинный палиндром и число палиндромных подстрок (секунды):")
+    print("Длина\tПеребор подстрок с is_palindrome_deque\tАлгоритм Манакера")
+    manacher_results = {}
+    for size in manacher_sizes:
+        text = ''.join(chr(c) for c in rng.integers(97, 99, size))
+
+        def brute_force():
+            longest, count = '', 0
+            for i in range(size):
+                for j in range(i + 1, size + 1):
+                    if is_palindrome_deque(text[i:j]):
+                        count += 1
+                        if j - i > len(longest):
+                            longest = text[i:j]
+            return longest, count
+
+        brute_time = measure_call_time(brute_force)
+        manacher_time = measure_call_time(lambda: (longest_palindrome(text), count_palindromes(text)))
+        manacher_results[size] = (brute_time, manacher_time)
+        print(f"{size}\t{brute_time:.6f}\t\t\t\t{manacher_time:.6f}")
+
+    return single, (deque_time, batch_time), manacher_results
+
+def compare_sliding_window_performance(size=10**6, windows=(10, 100, 1000, 10**4, 10**5),
+                                       naive_windows=200, seed=1):
+
+    values = np.random.default_rng(seed).random(size)
+    items = values.tolist()
+
+    print(f"\nСкользящее окно по {size} значениям (секунды на все окна; "
+          f"наивный пересчёт — оценка по первым {naive_windows} окнам):")
+    print("Окно\tmin наивно\tsliding_min\tsliding_min_array\tмедиана наивно\tsliding_median")
+    results = {}
+    for window in windows:
+        total = size - window + 1
+        sample = min(naive_windows, total)
+        scale = total / sample
+        naive_min = measure_call_time(lambda: [min(items[i:i + window]) for i in range(sample)]) * scale
+        naive_median = measure_call_time(lambda: [statistics.median(items[i:i + window]) for i in range(sample)]) * scale
+        deque_min = measure_call_time(lambda: collections.deque(sliding_min(items, window), maxlen=0))
+        array_min = measure_call_time(lambda: sliding_min_array(values, window))
+        heap_median = measure_call_time(lambda: collections.deque(sliding_median(items, window), maxlen=0))
+        results[window] = (naive_min, deque_min, array_min, naive_median, heap_median)
+        print(f"{window}\t{naive_min:.3f}\t\t{deque_min:.3f}\t\t{array_min:.4f}\t\t\t"
+              f"{naive_median:.3f}\t\t{heap_median:.3f}")
+
+    return results
+
+def measure_queue_throughput(make_queue, producers, consumers, items_per_producer, batch=None):
+    # Элементов в секунду при заданном числе потоков-производителей и потребителей.
+    # Каждый потребитель забирает фиксированную долю элементов, поэтому маркеры
+    # завершения не нужны
+    q = make_queue()
+    total = producers * items_per_producer
+    quotas = [total // consumers] * consumers
+    quotas[0] += total - sum(quotas)
+
+    def produce():
+        if batch:
+            for start in range(0, items_per_producer, batch):
+                q.put_many(range(start, min(start + batch, items_per_producer)))
+        else:
+            for item in range(items_per_producer):
+                q.put(item)
+
+    def consume(quota):
+        if batch:
+            while quota:
+                quota -= len(q.get_many(min(batch, quota)))
+        else:
+            for _ in range(quota):
+                q.get()
+
+    threads = [threading.Thread(target=produce) for _ in range(producers)]
+    threads += [threading.Thread(target=consume, args=(quota,)) for quota in quotas]
+    start = timeit.default_timer()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return total / (timeit.default_timer() - start)
+
+def compare_concurrent_queue_performance(thread_counts=((1, 1), (1, 4), (4, 1), (4, 4), (8, 8)),
+                                         items_per_producer=50000, capacity=1024, batch=64):
+
+    print(f"\nПотокобезопасные очереди (элементов/с, ёмкость {capacity}):")
+    print("Произв.\tПотреб.\tqueue.Queue\tConcurrentQueue\tConcurrentQueue пакетами")
+    variants = (
+        ('queue.Queue', lambda: queue.Queue(capacity), None),
+        ('ConcurrentQueue', lambda: ConcurrentQueue(capacity), None),
+        ('ConcurrentQueue пакетами', lambda: ConcurrentQueue(capacity), batch),
+    )
+    results = {}
+    for producers, consumers in thread_counts:
+        row = {name: measure_queue_throughput(make, producers, consumers, items_per_producer, size)
+               for name, make, size in variants}
+        results[(producers, consumers)] = row
+        print(f"{producers}\t{consumers}\t" + "\t".join(f"{row[name]:,.0f}\t" for name, _, _ in variants))
+
+    return results
+
+def compare_lru_cache_performance(accesses=10**6, capacities=(100, 1000, 10000), zipf_a=1.2, seed=1):
+
+    keys = np.random.default_rng(seed).zipf(zipf_a, accesses).tolist()
+
+    def compute(key):
+        return key * 2
+
+    def run_lru_cache(capacity):
+        cache = LRUCache(capacity)
+        for key in keys:
+            cache.get_or_compute(key, compute)
+        return cache.hits
+
+    def run_ordered_dict(capacity):
+        cache = collections.OrderedDict()
+        hits = 0
+        for key in keys:
+            if key in cache:
+                cache.move_to_end(key)
+                hits += 1
+            else:
+                cache[key] = compute(key)
+                if len(cache) > capacity:
+                    cache.popitem(last=False)
+        return hits
+
+    def run_functools(capacity):
+        cached = functools.lru_cache(maxsize=capacity)(compute)
+        for key in keys:
+            cached(key)
+        return cached.cache_info().hits
+
+    print(f"\nLRU-кэш, {accesses} обращений с распределением Ципфа (a={zipf_a}), обращений/с:")
+    print("Ёмкость\tДоля попаданий\tLRUCache\tOrderedDict\tfunctools.lru_cache")
+    results = {}
+    for capacity in capacities:
+        row = {}
+        for name, run in (('LRUCache', run_lru_cache), ('OrderedDict', run_ordered_dict),
+                          ('functools', run_functools)):
+            start = timeit.default_timer()
+            hits = run(capacity)
+            row[name] = accesses / (timeit.default_timer() - start)
+        results[capacity] = row
+        print(f"{capacity}\t{hits / accesses:.3f}\t\t{row['LRUCache']:,.0f}\t{row['OrderedDict']:,.0f}\t"
+              f"{row['functools']:,.0f}")
+
+    return results
+
+def run_performance_analysis(large_files=False):
     
     insertion_results = compare_insertion_performance()
     queue_results = compare_queue_performance()
+    compare_sequential_structures()
+    compare_ring_queue_performance()
+    compare_bracket_checker_throughput(LARGE_BRACKET_SIZES_GB if large_files else BRACKET_SIZES_GB)
+    compare_parallel_bracket_validation(size_gb=1 if large_files else 1 / 4)
+    compare_print_queue_simulation()
+    compare_replication_batch()
+    compare_palindrome_performance()
+    compare_sliding_window_performance()
+    compare_concurrent_queue_performance()
+    compare_lru_cache_performance()
     
     return insertion_results, queue_results
\ No newline at end of file
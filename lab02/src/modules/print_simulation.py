@@ -0,0 +1,233 @@
+import heapq
+import math
+from statistics import NormalDist
+
+import numpy as np
+
+# Распределения задаются функциями sampler(rng, size) -> np.ndarray
+
+def exponential(mean):
+    return lambda rng, size: rng.exponential(mean, size)
+
+def constant(value):
+    return lambda rng, size: np.full(size, float(value))
+
+def uniform(low, high):
+    return lambda rng, size: rng.uniform(low, high, size)
+
+def lognormal(mean, sigma):
+    # Параметры подобраны так, чтобы среднее значение равнялось mean
+    mu = math.log(mean) - sigma ** 2 / 2
+    return lambda rng, size: rng.lognormal(mu, sigma, size)
+
+class StreamingStats:
+    """
+    Потоковая статистика по пакетам значений без хранения самих значений.
+
+    Среднее и дисперсия объединяются по пакетам (формула Чана), процентили
+    считаются по логарифмической гистограмме: корзина i содержит значения
+    из [min_value * g^i, min_value * g^(i+1)), g = (1 + e) / (1 - e), поэтому
+    относительная погрешность процентиля не больше relative_error.
+    Значения меньше min_value (в том числе нули) учитываются отдельно.
+    """
+
+    def __init__(self, relative_error=0.01, min_value=1e-9, max_value=1e12):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.zeros = 0
+        self.min_value = min_value
+        self._gamma = (1 + relative_error) / (1 - relative_error)
+        self._log_gamma = math.log(self._gamma)
+        self._bins = np.zeros(int(math.log(max_value / min_value) / self._log_gamma) + 1, dtype=np.int64)
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        size = values.size
+        if size == 0:
+            return
+        batch_mean = values.mean()
+        batch_m2 = float(np.square(values - batch_mean).sum())
+        total = self.count + size
+        delta = batch_mean - self.mean
+        self.mean += delta * size / total
+        self._m2 += batch_m2 + delta ** 2 * self.count * size / total
+        self.count = total
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+
+        small = values < self.min_value
+        self.zeros += int(np.count_nonzero(small))
+        index = (np.log(values[~small] / self.min_value) / self._log_gamma).astype(np.int64)
+        np.clip(index, 0, self._bins.size - 1, out=index)
+        self._bins += np.bincount(index, minlength=self._bins.size)
+        # Временная сложность: O(k) для пакета из k значений, память O(число корзин)
+
+    @property
+    def variance(self):
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self):
+        return math.sqrt(self.variance)
+
+    def percentile(self, q):
+        # Приближённый q-й процентиль (0 <= q <= 100)
+        if self.count == 0:
+            return math.nan
+        rank = q / 100 * (self.count - 1)
+        if rank < self.zeros:
+            return 0.0
+        cumulative = np.cumsum(self._bins)
+        i = int(np.searchsorted(cumulative, rank - self.zeros, side='right'))
+        i = min(i, self._bins.size - 1)
+        # Середина корзины с относительной погрешностью не больше relative_error
+        value = self.min_value * self._gamma ** i * 2 / (1 + 1 / self._gamma)
+        return min(max(value, self.min), self.max)
+
+class PrintQueueSimulator:
+    """
+    Дискретно-событийная модель очереди печати: k принтеров, общая
+    очередь FIFO, случайные интервалы между поступлениями и времена печати.
+
+    Календарь событий — куча времён завершения печати (по одному событию
+    на принтер). Поступления образуют уже упорядоченный поток (накопленная
+    сумма интервалов), поэтому в кучу не кладутся: очередное событие —
+    минимум из следующего поступления и вершины кучи. Задача начинает
+    печататься в max(время поступления, ближайшее освобождение принтера).
+
+    Случайные величины генерируются пакетами по batch_size из
+    np.random.Generator с заданным seed, статистика ожидания и времени
+    пребывания копится потоково (StreamingStats) — память O(k + batch_size)
+    при любом числе задач.
+    """
+
+    def __init__(self, printers=1, interarrival=None, service=None, seed=None, batch_size=1 << 16):
+        if printers < 1:
+            raise ValueError("printers must be >= 1")
+        self.printers = printers
+        self.interarrival = interarrival or exponential(1.0)
+        self.service = service or exponential(0.8 * printers)
+        self.seed = seed
+        self.batch_size = batch_size
+
+    def run(self, num_jobs):
+        rng = np.random.default_rng(self.seed)
+        calendar = [0.0] * self.printers
+        clock = 0.0
+        busy_time = 0.0
+        waits = StreamingStats()
+        sojourns = StreamingStats()
+
+        for offset in range(0, num_jobs, self.batch_size):
+            count = min(self.batch_size, num_jobs - offset)
+            arrivals = clock + np.cumsum(self.interarrival(rng, count))
+            clock = float(arrivals[-1])
+            services = self.service(rng, count)
+            busy_time += float(services.sum())
+
+            starts = []
+            append = starts.append
+            replace = heapq.heapreplace
+            for arrival, service in zip(arrivals.tolist(), services.tolist()):
+                free = calendar[0]
+                start = arrival if arrival > free else free
+                replace(calendar, start + service)
+                append(start)
+
+            wait = np.array(starts) - arrivals
+            waits.update(wait)
+            sojourns.update(wait + services)
+
+        makespan = max(calendar) if num_jobs else 0.0
+        return {
+            'jobs': num_jobs,
+            'makespan': makespan,
+            'utilization': busy_time / (self.printers * makespan) if makespan else 0.0,
+            'wait': waits,
+            'sojourn': sojourns,
+        }
+        # Временная сложность: O(n log k) для n задач и k принтеров
+
+def _lindley_waits(interarrivals, services):
+    # Один принтер: W_i = max(0, W_(i-1) + S_(i-1) - A_i) для всех репликаций сразу.
+    # Решение рекуррентности: W_i = X_i - min(X_0..X_i), X — накопленная сумма S_(i-1) - A_i
+    steps = services[:, :-1] - interarrivals[:, 1:]
+    x = np.zeros(services.shape)
+    np.cumsum(steps, axis=1, out=x[:, 1:])
+    return x - np.minimum.accumulate(x, axis=1)
+    # Временная сложность: O(R * n) векторных операций
+
+def _kiefer_wolfowitz_waits(interarrivals, services, printers):
+    # k принтеров: вектор остаточной работы принтеров V (по возрастанию);
+    # задача ждёт V[0], затем её работа добавляется к наименее загруженному принтеру
+    replications, jobs = services.shape
+    workload = np.zeros((replications, printers))
+    waits = np.empty(services.shape)
+    for i in range(jobs):
+        if i:
+            workload -= interarrivals[:, i:i + 1]
+            np.maximum(workload, 0, out=workload)
+        waits[:, i] = workload[:, 0]
+        workload[:, 0] += services[:, i]
+        workload.sort(axis=1)
+    return waits
+    # Временная сложность: O(n * R * k log k), цикл Python — по задачам, не по репликациям
+
+def _confidence_interval(values, z):
+    mean = float(values.mean())
+    half = z * float(values.std(ddof=1)) / math.sqrt(values.size) if values.size > 1 else math.nan
+    return mean, mean - half, mean + half
+
+def simulate_replications(replications, num_jobs, printers=1, interarrival=None, service=None,
+                          seed=None, warmup=0, tail=99, confidence=0.95, block_elements=1 << 22):
+    """
+    R независимых репликаций очереди печати за один вызов.
+
+    Случайные величины генерируются матрицами (репликация × задача),
+    ожидания считаются по рекуррентности Линдли (для одного принтера —
+    без цикла Python) или Кифера — Вольфовица (для k принтеров — цикл по
+    задачам над массивами всех репликаций). Репликации обрабатываются
+    блоками примерно по block_elements значений.
+
+    Возвращает для среднего ожидания и tail-процентиля ожидания оценку и
+    доверительный интервал (оценка, нижняя граница, верхняя граница) по
+    разбросу между репликациями; первые warmup задач каждой репликации
+    отбрасываются.
+    """
+    if not 0 <= warmup < num_jobs:
+        raise ValueError("warmup must be in [0, num_jobs)")
+    interarrival = interarrival or exponential(1.0)
+    service = service or exponential(0.8 * printers)
+    rng = np.random.default_rng(seed)
+    block = max(block_elements // num_jobs, 1)
+
+    means = np.empty(replications)
+    tails = np.empty(replications)
+    loads = np.empty(replications)
+    for start in range(0, replications, block):
+        stop = min(start + block, replications)
+        shape = (stop - start, num_jobs)
+        interarrivals = interarrival(rng, shape)
+        services = service(rng, shape)
+        if printers == 1:
+            waits = _lindley_waits(interarrivals, services)
+        else:
+            waits = _kiefer_wolfowitz_waits(interarrivals, services, printers)
+        waits = waits[:, warmup:]
+        means[start:stop] = waits.mean(axis=1)
+        tails[start:stop] = np.percentile(waits, tail, axis=1)
+        loads[start:stop] = services.sum(axis=1) / (printers * interarrivals.sum(axis=1))
+
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    return {
+        'replications': replications,
+        'jobs': num_jobs,
+        'mean_wait': _confidence_interval(means, z),
+        'tail_wait': _confidence_interval(tails, z),
+        'load': float(loads.mean()),
+        'replication_means': means,
+        'replication_tails': tails,
+    }
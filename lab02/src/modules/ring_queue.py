@@ -0,0 +1,83 @@
+import numpy as np
+
+class RingQueue:
+    """
+    Очередь FIFO для чисел на кольцевом буфере NumPy.
+    Ёмкость — степень двойки, поэтому позиция в буфере вычисляется маской
+    (index & mask) вместо взятия остатка. push_many/pop_many переносят
+    данные целыми срезами (не более двух копирований памяти), без цикла
+    Python по элементам. При заполнении буфер удваивается.
+    """
+
+    def __init__(self, capacity=16, dtype=np.int64):
+        capacity = 1 << max(capacity - 1, 0).bit_length()
+        self._buffer = np.empty(capacity, dtype=dtype)
+        self._mask = capacity - 1
+        self._head = 0
+        self.size = 0
+
+    @property
+    def capacity(self):
+        return self._buffer.size
+
+    def __len__(self):
+        return self.size
+
+    def is_empty(self):
+        return self.size == 0
+
+    def _grow(self, min_capacity):
+        capacity = self._buffer.size
+        while capacity < min_capacity:
+            capacity *= 2
+        buffer = np.empty(capacity, dtype=self._buffer.dtype)
+        # Элементы переносятся в начало нового буфера в порядке очереди
+        self._copy_out(self._head, self.size, buffer)
+        self._buffer = buffer
+        self._mask = capacity - 1
+        self._head = 0
+        # Временная сложность: O(n), амортизированно O(1) на элемент
+
+    def _copy_out(self, start, count, out):
+        # Копирование count элементов, начиная с позиции start, в начало out
+        first = min(count, self._buffer.size - start)
+        out[:first] = self._buffer[start:start + first]
+        out[first:count] = self._buffer[:count - first]
+
+    def push(self, value):
+        if self.size == self._buffer.size:
+            self._grow(self.size + 1)
+        self._buffer[(self._head + self.size) & self._mask] = value
+        self.size += 1
+        # Временная сложность: O(1) амортизированно
+
+    def pop(self):
+        if self.size == 0:
+            return None
+        value = self._buffer[self._head].item()
+        self._head = (self._head + 1) & self._mask
+        self.size -= 1
+        return value
+        # Временная сложность: O(1)
+
+    def push_many(self, values):
+        values = np.asarray(values, dtype=self._buffer.dtype).reshape(-1)
+        count = values.size
+        if self.size + count > self._buffer.size:
+            self._grow(self.size + count)
+        tail = (self._head + self.size) & self._mask
+        first = min(count, self._buffer.size - tail)
+        self._buffer[tail:tail + first] = values[:first]
+        self._buffer[:count - first] = values[first:]
+        self.size += count
+        # Временная сложность: O(k) — два копирования срезов
+
+    def pop_many(self, count):
+        # Возвращает до count элементов (меньше, если очередь короче) в новом массиве
+        count = min(count, self.size)
+        values = np.empty(count, dtype=self._buffer.dtype)
+        self._copy_out(self._head, count, values)
+        self._head = (self._head + count) & self._mask
+        self.size -= count
+        return values
+        # Временная сложность: O(k) — два копирования срезов
@@ -0,0 +1,143 @@
+import collections
+import heapq
+import operator
+
+import numpy as np
+
+def _sliding_extreme(iterable, window, better):
+    # Монотонная дека индексов: значения от начала к концу "ухудшаются",
+    # поэтому экстремум окна всегда в начале. Каждый элемент добавляется
+    # и удаляется из деки не более одного раза.
+    if window < 1:
+        raise ValueError("window must be >= 1")
+    indices = collections.deque()
+    values = collections.deque()
+    for i, value in enumerate(iterable):
+        while values and not better(values[-1], value):
+            values.pop()
+            indices.pop()
+        values.append(value)
+        indices.append(i)
+        if indices[0] <= i - window:
+            indices.popleft()
+            values.popleft()
+        if i >= window - 1:
+            yield values[0]
+    # Временная сложность: O(n) на весь поток, память O(window)
+
+def sliding_min(iterable, window):
+    # Генератор минимумов окон длины window (первое значение — после window элементов)
+    return _sliding_extreme(iterable, window, operator.lt)
+
+def sliding_max(iterable, window):
+    # Генератор максимумов окон длины window
+    return _sliding_extreme(iterable, window, operator.gt)
+
+def _sliding_extreme_array(arr, window, ufunc):
+    """
+    Алгоритм ван Херка — Гиля — Вермана: массив делится на блоки длины
+    window, внутри блоков считаются префиксные и суффиксные экстремумы
+    (ufunc.accumulate), и окно [i, i + window) равно
+    ufunc(суффикс в позиции i, префикс в позиции i + window - 1).
+    """
+    arr = np.asarray(arr)
+    if window < 1:
+        raise ValueError("window must be >= 1")
+    n = arr.size
+    if n < window:
+        return arr[:0].copy()
+    blocks = -(-n // window)
+    padded = np.empty(blocks * window, dtype=arr.dtype)
+    padded[:n] = arr
+    padded[n:] = arr[-1]  # дополнение не меняет экстремум окон, которые его не касаются
+    padded = padded.reshape(blocks, window)
+    prefix = ufunc.accumulate(padded, axis=1).reshape(-1)
+    suffix = ufunc.accumulate(padded[:, ::-1], axis=1)[:, ::-1].reshape(-1)
+    return ufunc(suffix[:n - window + 1], prefix[window - 1:n])
+    # Временная сложность: O(n), три прохода NumPy независимо от window
+
+def sliding_min_array(arr, window):
+    # Минимумы всех окон длины window (np.ndarray длины n - window + 1)
+    return _sliding_extreme_array(arr, window, np.minimum)
+
+def sliding_max_array(arr, window):
+    # Максимумы всех окон длины window
+    return _sliding_extreme_array(arr, window, np.maximum)
+
+class SlidingMedian:
+    """
+    Медиана скользящего окна на двух кучах: low — максимальная куча
+    (значения хранятся со знаком минус) для меньшей половины, high —
+    минимальная куча для большей. Удаляемые из окна значения не ищутся
+    в кучах, а запоминаются в delayed и выбрасываются, когда оказываются
+    на вершине (ленивое удаление). low_size/high_size — число "живых"
+    элементов в кучах.
+    """
+
+    def __init__(self):
+        self.low = []
+        self.high = []
+        self.delayed = collections.Counter()
+        self.low_size = 0
+        self.high_size = 0
+
+    def _prune(self, heap, sign):
+        while heap and self.delayed[sign * heap[0]]:
+            self.delayed[sign * heap[0]] -= 1
+            heapq.heappop(heap)
+
+    def _balance(self):
+        if self.low_size > self.high_size + 1:
+            heapq.heappush(self.high, -heapq.heappop(self.low))
+            self.low_size -= 1
+            self.high_size += 1
+            self._prune(self.low, -1)
+        elif self.low_size < self.high_size:
+            heapq.heappush(self.low, -heapq.heappop(self.high))
+            self.low_size += 1
+            self.high_size -= 1
+            self._prune(self.high, 1)
+
+    def add(self, value):
+        if not self.low or value <= -self.low[0]:
+            heapq.heappush(self.low, -value)
+            self.low_size += 1
+        else:
+            heapq.heappush(self.high, value)
+            self.high_size += 1
+        self._balance()
+        # Временная сложность: O(log w) амортизированно
+
+    def remove(self, value):
+        # value должно присутствовать в окне
+        self.delayed[value] += 1
+        if value <= -self.low[0]:
+            self.low_size -= 1
+            if value == -self.low[0]:
+                self._prune(self.low, -1)
+        else:
+            self.high_size -= 1
+            if value == self.high[0]:
+                self._prune(self.high, 1)
+        self._balance()
+        # Временная сложность: O(log w) амортизированно
+
+    def median(self):
+        if (self.low_size + self.high_size) % 2:
+            return -self.low[0]
+        return (-self.low[0] + self.high[0]) / 2
+
+def sliding_median(iterable, window):
+    # Генератор медиан окон длины window; в памяти только последние window значений
+    if window < 1:
+        raise ValueError("window must be >= 1")
+    heaps = SlidingMedian()
+    recent = collections.deque()
+    for value in iterable:
+        heaps.add(value)
+        recent.append(value)
+        if len(recent) > window:
+            heaps.remove(recent.popleft())
+        if len(recent) == window:
+            yield heaps.median()
+    # Временная сложность: O(n log w), память O(w)
@@ -1,4 +1,7 @@
 import collections
+import random
+
+from .print_simulation import PrintQueueSimulator, lognormal
 
 def is_balanced_brackets(expression):
 
@@ -27,7 +30,6 @@ def simulate_print_queue(num_tasks, processing_time=1):
         completion_times.append((task, current_time))
         
         # С вероятностью 20% поступает новая задача
-        import random
         if random.random() < 0.2 and num_tasks < 100:  # Ограничиваем максимальное число задач
             new_task = num_tasks + len(completion_times) + 1
             queue.append(new_task)
@@ -63,6 +65,14 @@ def demonstrate_solutions():
     for task, time in completion_times[:10]:  # Выводим не более первых 10 задач
         print(f"Задача {task} завершена в время {time}")
     
+    print("\n=== Дискретно-событийная модель очереди печати ===")
+    simulator = PrintQueueSimulator(printers=3, service=lognormal(2.5, 0.5), seed=42)
+    stats = simulator.run(100000)
+    wait = stats['wait']
+    print(f"Принтеров: 3, задач: {stats['jobs']}, загрузка: {stats['utilization']:.1%}")
+    print(f"Ожидание: среднее {wait.mean:.3f}, медиана {wait.percentile(50):.3f}, "
+          f"p99 {wait.percentile(99):.3f}, максимум {wait.max:.3f}")
+    
     print("\n=== Проверка палиндромов ===")
     palindromes = [
         "racecar",
@@ -0,0 +1,584 @@
+import array
+import collections
+import io
+import operator
+import os
+import random
+import statistics
+import tempfile
+import threading
+import unittest
+from queue import Empty, Full
+
+import numpy as np
+
+from modules.linked_list import LinkedList, NodePool
+from modules.unrolled_linked_list import UnrolledLinkedList
+from modules.ring_queue import RingQueue
+from modules.sliding_window import (sliding_max, sliding_max_array, sliding_median, sliding_min,
+                                    sliding_min_array)
+from modules.concurrent_queue import ConcurrentQueue
+from modules.doubly_linked_list import DoublyLinkedList
+from modules.lru_cache import LRUCache
+from modules.palindromes import batch_is_palindrome, count_palindromes, is_palindrome, longest_palindrome
+from modules.print_simulation import (PrintQueueSimulator, StreamingStats, _kiefer_wolfowitz_waits,
+                                      _lindley_waits, constant, exponential, simulate_replications,
+                                      uniform)
+from modules.bracket_checker import StreamingBracketChecker, check_file, check_stream
+from modules.parallel_brackets import (EMPTY_SUMMARY, ParallelBracketValidator, combine,
+                                      exclusive_scan, summarize)
+from modules.task_solutions import is_balanced_brackets
+
+COMMENTS = dict(line_comments=(b'//',), block_comments={b'/*': b'*/'})
+BRACKET_CONFIGS = [{}, dict(quotes=b'"'), COMMENTS, dict(quotes=b'"', **COMMENTS)]
+
+class BracketCheckerTests(unittest.TestCase):
+    def assert_chunking_invariant(self, data, options):
+        # Результат не должен зависеть от того, где поток разрезан на части
+        expected = check_stream(io.BytesIO(data), max(len(data), 1), **options)
+        for chunk_size in range(1, len(data) + 1):
+            self.assertEqual(check_stream(io.BytesIO(data), chunk_size, **options), expected,
+                             (data, chunk_size, options))
+        return expected
+
+    def test_plain_matches_reference(self):
+        rng = random.Random(1)
+        for _ in range(200):
+            text = ''.join(rng.choice('()[]{}x') for _ in range(rng.randrange(12)))
+            ok, _ = self.assert_chunking_invariant(text.encode(), {})
+            self.assertEqual(ok, is_balanced_brackets(text), text)
+
+    def test_edge_cases(self):
+        self.assertEqual(check_stream(io.BytesIO(b'')), (True, None))
+        self.assertEqual(check_stream(io.BytesIO(b'(')), (False, 1))
+        self.assertEqual(check_stream(io.BytesIO(b'(]')), (False, 1))
+        self.assertEqual(check_stream(io.BytesIO(b'"('), quotes=b'"'), (False, 2))
+        self.assertEqual(check_stream(io.BytesIO(b'/* ('), **COMMENTS), (False, 4))
+
+    def test_comment_end_at_chunk_boundary(self):
+        # "/" из законченного "*/" в конце части не начинает новый комментарий
+        self.assertEqual(self.assert_chunking_invariant(b'[/*x*/\n]', COMMENTS), (True, None))
+        self.assertEqual(self.assert_chunking_invariant(b'{"k": [1, 2]/* note */\n}\n',
+                                                        dict(quotes=b'"', **COMMENTS)), (True, None))
+        checker = StreamingBracketChecker(**COMMENTS)
+        checker.feed(b'/*x*/')
+        checker.feed(b'/)')
+        self.assertFalse(checker.finish())
+        self.assertEqual(checker.error_offset, 6)
+
+    def test_random_chunking(self):
+        rng = random.Random(2)
+        pieces = [b'(', b')', b'[', b']', b'{', b'}', b'/', b'*', b'"', b'\\', b'\n', b'x', b'//', b'/*', b'*/']
+        for _ in range(300):
+            data = b''.join(rng.choice(pieces) for _ in range(rng.randrange(16)))
+            for options in BRACKET_CONFIGS:
+                self.assert_chunking_invariant(data, options)
+
+def random_deque_ops(rng, structure, steps=2000):
+    # Случайные вставки в начало/конец и удаления из начала в сравнении с deque
+    reference = collections.deque()
+    for _ in range(steps):
+        op = rng.random()
+        if op < 0.3:
+            value = rng.randrange(1000)
+            structure.insert_at_start(value)
+            reference.appendleft(value)
+        elif op < 0.65:
+            value = rng.randrange(1000)
+            structure.insert_at_end(value)
+            reference.append(value)
+        else:
+            yield structure.delete_from_start(), reference.popleft() if reference else None
+        yield len(structure), len(reference)
+    yield structure.traversal(), list(reference)
+
+class LinkedListTests(unittest.TestCase):
+    def test_empty(self):
+        lst = LinkedList()
+        self.assertEqual((len(lst), lst.traversal(), lst.is_empty()), (0, [], True))
+        self.assertIsNone(lst.delete_from_start())
+        self.assertIsNone(lst.tail)
+
+    def test_matches_deque(self):
+        for pool in (None, NodePool(), NodePool(max_size=3)):
+            for actual, expected in random_deque_ops(random.Random(3), LinkedList(pool)):
+                self.assertEqual(actual, expected)
+
+    def test_lazy_iteration(self):
+        # Итератор читает узлы по мере обхода: видит вставку в конец после начала обхода
+        lst = LinkedList()
+        lst.insert_at_end(1)
+        it = iter(lst)
+        self.assertEqual(next(it), 1)
+        lst.insert_at_end(2)
+        self.assertEqual(list(it), [2])
+
+    def test_pool_reuses_nodes(self):
+        pool = NodePool(max_size=1)
+        first, second = LinkedList(pool), LinkedList(pool)
+        first.insert_at_end('a')
+        first.insert_at_end('b')
+        node = first.head
+        self.assertEqual(first.delete_from_start(), 'a')
+        self.assertEqual(first.delete_from_start(), 'b')
+        # Второй узел не помещается в пул из одного элемента
+        self.assertEqual(pool.size, 1)
+        self.assertIsNone(pool._free.data)
+        # Узел из пула достаётся другому списку, разделяющему тот же пул
+        second.insert_at_start('c')
+        self.assertEqual((pool.size, second.traversal()), (0, ['c']))
+        self.assertIs(second.head, node)
+
+class UnrolledLinkedListTests(unittest.TestCase):
+    def test_empty_and_capacity(self):
+        lst = UnrolledLinkedList(capacity=4)
+        self.assertEqual((len(lst), lst.traversal(), lst.is_empty()), (0, [], True))
+        self.assertIsNone(lst.delete_from_start())
+        with self.assertRaises(IndexError):
+            lst[0]
+        with self.assertRaises(ValueError):
+            UnrolledLinkedList(capacity=0)
+
+    def test_matches_deque(self):
+        # capacity=1 — каждый элемент в отдельном узле; 3 — частые границы узлов
+        for capacity in (1, 3, 64):
+            for actual, expected in random_deque_ops(random.Random(4), UnrolledLinkedList(capacity)):
+                self.assertEqual(actual, expected)
+
+    def test_extend_and_indexing(self):
+        rng = random.Random(5)
+        for capacity in (1, 3, 8):
+            lst = UnrolledLinkedList(capacity, iterable=range(5))
+            reference = list(range(5))
+            for _ in range(50):
+                items = [rng.randrange(100) for _ in range(rng.randrange(10))]
+                lst.extend(items)
+                reference.extend(items)
+                lst.insert_at_start(-1)
+                reference.insert(0, -1)
+                lst.delete_from_start()
+                del reference[0]
+            self.assertEqual(lst.traversal(), reference)
+            self.assertEqual([lst[i] for i in range(-len(reference), len(reference))], reference * 2)
+            with self.assertRaises(IndexError):
+                lst[len(reference)]
+
+class RingQueueTests(unittest.TestCase):
+    def test_empty_and_capacity(self):
+        queue = RingQueue(capacity=5)
+        self.assertEqual((queue.capacity, len(queue), queue.is_empty()), (8, 0, True))
+        self.assertIsNone(queue.pop())
+        self.assertEqual(queue.pop_many(3).size, 0)
+        self.assertEqual(RingQueue(capacity=1).capacity, 1)
+
+    def test_wraparound_and_growth(self):
+        # Малая начальная ёмкость: голова обходит конец буфера, буфер удваивается
+        # при заполнении посреди кольца
+        rng = random.Random(6)
+        queue = RingQueue(capacity=2)
+        reference = collections.deque()
+        counter = 0
+        for _ in range(3000):
+            op = rng.random()
+            if op < 0.3:
+                queue.push(counter)
+                reference.append(counter)
+                counter += 1
+            elif op < 0.5:
+                values = list(range(counter, counter + rng.randrange(20)))
+                queue.push_many(values)
+                reference.extend(values)
+                counter += len(values)
+            elif op < 0.8:
+                self.assertEqual(queue.pop(), reference.popleft() if reference else None)
+            else:
+                count = rng.randrange(20)
+                expected = [reference.popleft() for _ in range(min(count, len(reference)))]
+                self.assertEqual(queue.pop_many(count).tolist(), expected)
+            self.assertEqual(len(queue), len(reference))
+        self.assertEqual(queue.pop_many(len(queue)).tolist(), list(reference))
+
+    def test_push_many_across_boundary(self):
+        queue = RingQueue(capacity=8, dtype=np.float64)
+        queue.push_many(np.arange(6.0))
+        self.assertEqual(queue.pop_many(5).tolist(), [0.0, 1.0, 2.0, 3.0, 4.0])
+        # Пять элементов с позиции 6 занимают конец и начало буфера
+        queue.push_many(np.arange(10.0, 15.0))
+        self.assertEqual(queue.capacity, 8)
+        self.assertEqual(queue.pop_many(10).tolist(), [5.0, 10.0, 11.0, 12.0, 13.0, 14.0])
+
+def random_brackets(rng, length):
+    # Почти сбалансированная последовательность: ошибки редки и стоят в разных местах
+    text = ''.join(rng.choice(['()', '[]', '{}', '(x)', '[{}]']) for _ in range(length // 2))
+    if rng.random() < 0.5:
+        pos = rng.randrange(len(text) + 1)
+        text = text[:pos] + rng.choice('()[]{}') + text[pos:]
+    return text.encode()
+
+class ParallelBracketTests(unittest.TestCase):
+    def test_combine_matches_concatenation(self):
+        rng = random.Random(7)
+        for _ in range(500):
+            left = ''.join(rng.choice('()[]{}') for _ in range(rng.randrange(8))).encode()
+            right = ''.join(rng.choice('()[]{}') for _ in range(rng.randrange(8))).encode()
+            self.assertEqual(combine(summarize(left), summarize(right)), summarize(left + right),
+                             (left, right))
+        self.assertEqual(combine(EMPTY_SUMMARY, summarize(b')(')), summarize(b')('))
+
+    def test_exclusive_scan(self):
+        for length in range(10):
+            items = list(range(1, length + 1))
+            expected = [sum(items[:i]) for i in range(length)]
+            self.assertEqual(exclusive_scan(items, operator.add, 0), expected)
+
+    def test_validate_matches_sequential(self):
+        # Маленькие части — ошибка и незакрытые скобки на границах частей
+        rng = random.Random(8)
+        with tempfile.TemporaryDirectory() as tmp_dir, \
+                ParallelBracketValidator(workers=2, chunk_size=7) as validator:
+            path = os.path.join(tmp_dir, 'brackets.txt')
+            for length in [0, 1, 2] + [rng.randrange(3, 120) for _ in range(30)]:
+                data = random_brackets(rng, length)
+                with open(path, 'wb') as f:
+                    f.write(data)
+                self.assertEqual(validator.validate(path), check_file(path), data)
+
+def naive_fifo_waits(arrivals, services, printers):
+    # Эталон: задача занимает принтер, который освободится раньше всех
+    free = [0.0] * printers
+    waits = []
+    for arrival, service in zip(arrivals, services):
+        i = free.index(min(free))
+        start = max(arrival, free[i])
+        free[i] = start + service
+        waits.append(start - arrival)
+    return waits
+
+class PrintQueueSimulatorTests(unittest.TestCase):
+    def test_streaming_stats(self):
+        rng = np.random.default_rng(9)
+        values = np.concatenate([np.zeros(50), rng.exponential(2.0, 5000)])
+        rng.shuffle(values)
+        stats = StreamingStats(relative_error=0.01)
+        for batch in np.array_split(values, 7):
+            stats.update(batch)
+        stats.update([])
+        self.assertEqual((stats.count, stats.zeros), (values.size, 50))
+        self.assertAlmostEqual(stats.mean, values.mean())
+        self.assertAlmostEqual(stats.variance, values.var(ddof=1))
+        self.assertEqual((stats.min, stats.max), (values.min(), values.max()))
+        for q in (0, 0.5, 25, 50, 90, 99, 100):
+            # Ответ — в пределах погрешности от соседних по рангу значений
+            low = np.percentile(values, q, method='lower')
+            high = np.percentile(values, q, method='higher')
+            self.assertTrue(low * 0.99 <= stats.percentile(q) <= high * 1.01, q)
+        self.assertTrue(np.isnan(StreamingStats().percentile(50)))
+
+    def test_deterministic_queue(self):
+        # Поступления каждую единицу времени, печать по 2: с одним принтером
+        # задача i ждёт i, с двумя — не ждёт
+        for batch_size in (2, 1 << 16):
+            result = PrintQueueSimulator(1, constant(1), constant(2), batch_size=batch_size).run(5)
+            self.assertEqual((result['makespan'], result['wait'].mean, result['wait'].max), (11.0, 2.0, 4.0))
+            self.assertAlmostEqual(result['utilization'], 10 / 11)
+            self.assertAlmostEqual(result['sojourn'].mean, 4.0)
+        result = PrintQueueSimulator(2, constant(1), constant(2)).run(5)
+        self.assertEqual((result['makespan'], result['wait'].max), (7.0, 0.0))
+
+    def test_single_job_and_empty(self):
+        result = PrintQueueSimulator(3, constant(1), constant(2)).run(1)
+        self.assertEqual((result['jobs'], result['makespan'], result['wait'].mean), (1, 3.0, 0.0))
+        result = PrintQueueSimulator().run(0)
+        self.assertEqual((result['jobs'], result['makespan'], result['utilization']), (0, 0.0, 0.0))
+        with self.assertRaises(ValueError):
+            PrintQueueSimulator(printers=0)
+
+    def test_matches_naive_simulation(self):
+        for printers in (1, 2, 4):
+            interarrival, service = exponential(1.0), uniform(0, 1.6 * printers)
+            result = PrintQueueSimulator(printers, interarrival, service, seed=10).run(2000)
+            # Те же случайные величины, что у симулятора с одним пакетом
+            rng = np.random.default_rng(10)
+            arrivals = np.cumsum(interarrival(rng, 2000)).tolist()
+            waits = naive_fifo_waits(arrivals, service(rng, 2000).tolist(), printers)
+            self.assertAlmostEqual(result['wait'].mean, np.mean(waits))
+            self.assertAlmostEqual(result['wait'].max, max(waits))
+
+class ReplicationTests(unittest.TestCase):
+    def test_waits_match_naive(self):
+        # Строка матрицы — репликация; первый интервал не влияет на ожидания
+        rng = np.random.default_rng(11)
+        interarrivals = rng.exponential(1.0, (5, 300))
+        for printers in (1, 2, 3):
+            services = rng.uniform(0, 1.8 * printers, (5, 300))
+            waits = _kiefer_wolfowitz_waits(interarrivals, services, printers)
+            if printers == 1:
+                np.testing.assert_allclose(_lindley_waits(interarrivals, services), waits, atol=1e-9)
+            for row in range(5):
+                arrivals = np.cumsum(interarrivals[row]).tolist()
+                np.testing.assert_allclose(waits[row], naive_fifo_waits(arrivals, services[row], printers),
+                                           atol=1e-9)
+
+    def test_deterministic(self):
+        # Печать быстрее поступлений — ожиданий нет; доверительный интервал вырожден
+        result = simulate_replications(3, 10, interarrival=constant(1), service=constant(0.5))
+        self.assertEqual((result['mean_wait'], result['tail_wait'], result['load']),
+                         ((0.0, 0.0, 0.0), (0.0, 0.0, 0.0), 0.5))
+        single = simulate_replications(1, 10, interarrival=constant(1), service=constant(0.5))
+        self.assertTrue(np.isnan(single['mean_wait'][1]))
+
+    def test_blocks_seed_and_warmup(self):
+        first = simulate_replications(20, 50, printers=2, seed=12)
+        second = simulate_replications(20, 50, printers=2, seed=12)
+        np.testing.assert_array_equal(first['replication_means'], second['replication_means'])
+        # Печать 1.5 при поступлении раз в 1: задача i ждёт 0.5 * i; блоки по одной репликации
+        for block_elements in (10, 1 << 22):
+            result = simulate_replications(4, 10, interarrival=constant(1), service=constant(1.5),
+                                           warmup=5, block_elements=block_elements)
+            np.testing.assert_allclose(result['replication_means'], 3.5)
+        with self.assertRaises(ValueError):
+            simulate_replications(2, 10, warmup=10)
+
+class PalindromeTests(unittest.TestCase):
+    def test_is_palindrome_matches_reversal(self):
+        # Малые блоки — сравнение идёт через границы блоков; длины 0 и 1 — крайние случаи
+        rng = random.Random(13)
+        for _ in range(300):
+            text = ''.join(rng.choice('ab') for _ in range(rng.randrange(10)))
+            if rng.random() < 0.5:
+                text += text[::-1][rng.randrange(2):]
+            expected = text == text[::-1]
+            data = text.encode()
+            for block in (1, 2, 3, 4096):
+                for sequence in (text, data, bytearray(data), memoryview(data), list(text)):
+                    self.assertEqual(is_palindrome(sequence, block), expected, (sequence, block))
+        self.assertTrue(is_palindrome(memoryview(array.array('i', [1, 258, 1]))))
+        self.assertFalse(is_palindrome(memoryview(array.array('i', [1, 258, 2]))))
+
+    def test_batch(self):
+        words = ['', 'a', 'ab', 'aba', 'abba', 'abca', b'xyx', b'xy']
+        self.assertEqual(batch_is_palindrome(words).tolist(), [word == word[::-1] for word in words])
+
+    def test_manacher_matches_brute_force(self):
+        rng = random.Random(14)
+        for _ in range(200):
+            text = ''.join(rng.choice('aab') for _ in range(rng.randrange(12)))
+            found = [text[i:j] for i in range(len(text)) for j in range(i + 1, len(text) + 1)
+                     if text[i:j] == text[i:j][::-1]]
+            self.assertEqual(count_palindromes(text), len(found), text)
+            # Первая из самых длинных: found упорядочен по началу подстроки
+            longest = max(found, key=len, default='')
+            self.assertEqual(longest_palindrome(text), longest, text)
+        self.assertEqual(longest_palindrome(b''), b'')
+
+class SlidingWindowTests(unittest.TestCase):
+    def test_matches_naive(self):
+        # Малый диапазон значений — много повторов для ленивого удаления из куч
+        rng = random.Random(15)
+        for _ in range(100):
+            items = [rng.randrange(5) for _ in range(rng.randrange(15))]
+            for window in range(1, len(items) + 2):
+                windows = [items[i:i + window] for i in range(len(items) - window + 1)]
+                self.assertEqual(list(sliding_min(items, window)), [min(w) for w in windows])
+                self.assertEqual(list(sliding_max(iter(items), window)), [max(w) for w in windows])
+                self.assertEqual(sliding_min_array(items, window).tolist(), [min(w) for w in windows])
+                self.assertEqual(sliding_max_array(np.array(items, dtype=float), window).tolist(),
+                                 [max(w) for w in windows])
+                self.assertEqual(list(sliding_median(items, window)),
+                                 [statistics.median(w) for w in windows])
+
+    def test_window_validation(self):
+        for func in (sliding_min, sliding_max, sliding_median, sliding_min_array, sliding_max_array):
+            with self.assertRaises(ValueError):
+                list(func([1, 2, 3], 0))
+        self.assertEqual(list(sliding_median([], 1)), [])
+        self.assertEqual(sliding_min_array([], 1).size, 0)
+
+class ConcurrentQueueTests(unittest.TestCase):
+    def test_fifo_single_thread(self):
+        rng = random.Random(16)
+        for capacity in (None, 1000):
+            queue = ConcurrentQueue(capacity)
+            reference = collections.deque()
+            for step in range(500):
+                op = rng.random()
+                if op < 0.3:
+                    queue.put(step)
+                    reference.append(step)
+                elif op < 0.5:
+                    items = list(range(step * 10, step * 10 + rng.randrange(5)))
+                    queue.put_many(items)
+                    reference.extend(items)
+                elif reference and op < 0.8:
+                    self.assertEqual(queue.get(), reference.popleft())
+                elif reference:
+                    count = rng.randrange(1, 6)
+                    expected = [reference.popleft() for _ in range(min(count, len(reference)))]
+                    self.assertEqual(queue.get_many(count), expected)
+                self.assertEqual((len(queue), queue.qsize(), queue.empty()),
+                                 (len(reference), len(reference), not reference))
+
+    def test_empty_full_and_timeouts(self):
+        queue = ConcurrentQueue(capacity=2)
+        for get in (queue.get, lambda **kwargs: queue.get_many(3, **kwargs)):
+            with self.assertRaises(Empty):
+                get(block=False)
+            with self.assertRaises(Empty):
+                get(timeout=0.01)
+        queue.put_many([1, 2])
+        with self.assertRaises(Full):
+            queue.put(3, block=False)
+        with self.assertRaises(Full):
+            queue.put(3, timeout=0.01)
+        self.assertEqual(queue.get(), 1)
+        # Не поместившиеся элементы не добавляются, поместившиеся остаются
+        with self.assertRaises(Full):
+            queue.put_many([3, 4], timeout=0.01)
+        self.assertEqual(queue.get_many(5), [2, 3])
+        with self.assertRaises(ValueError):
+            ConcurrentQueue(capacity=0)
+        with self.assertRaises(ValueError):
+            queue.get_many(0)
+        with self.assertRaises(ValueError):
+            queue.get(timeout=-1)
+
+    def test_producers_and_consumers(self):
+        # Ограниченная ёмкость — обе стороны ждут; каждый потребитель видит
+        # элементы одного производителя в порядке добавления
+        queue = ConcurrentQueue(capacity=8)
+        producers, consumers, per_producer = 4, 4, 2000
+        received = [[] for _ in range(consumers)]
+
+        def produce(p):
+            for start in range(0, per_producer, 50):
+                if start % 100:
+                    queue.put_many((p, i) for i in range(start, start + 50))
+                else:
+                    for i in range(start, start + 50):
+                        queue.put((p, i))
+
+        done = threading.Event()
+
+        def consume(c):
+            # Без маркеров конца: после остановки производителей очередь дочитывается
+            while not (done.is_set() and queue.empty()):
+                try:
+                    if c % 2:
+                        received[c].extend(queue.get_many(7, timeout=0.05))
+                    else:
+                        received[c].append(queue.get(timeout=0.05))
+                except Empty:
+                    pass
+
+        threads = [threading.Thread(target=consume, args=(c,)) for c in range(consumers)]
+        producer_threads = [threading.Thread(target=produce, args=(p,)) for p in range(producers)]
+        for thread in threads + producer_threads:
+            thread.start()
+        for thread in producer_threads:
+            thread.join()
+        done.set()
+        for thread in threads:
+            thread.join(timeout=10)
+            self.assertFalse(thread.is_alive())
+        items = [item for part in received for item in part]
+        self.assertEqual(sorted(items), [(p, i) for p in range(producers) for i in range(per_producer)])
+        for part in received:
+            for p in range(producers):
+                indices = [i for q, i in part if q == p]
+                self.assertEqual(indices, sorted(indices))
+
+class DoublyLinkedListTests(unittest.TestCase):
+    def test_empty_and_single(self):
+        lst = DoublyLinkedList()
+        self.assertEqual((len(lst), lst.traversal(), lst.is_empty()), (0, [], True))
+        self.assertIsNone(lst.delete_from_start())
+        self.assertIsNone(lst.pop_back())
+        self.assertIsNone(lst.peek_back())
+        handle = lst.insert_at_end('a')
+        lst.move_to_front(handle)
+        self.assertIs(lst.peek_back(), handle)
+        self.assertEqual((lst.remove(handle), lst.traversal(), len(lst)), ('a', [], 0))
+
+    def test_handles_match_reference(self):
+        # Эталон — список дескрипторов в порядке элементов
+        rng = random.Random(17)
+        lst = DoublyLinkedList()
+        order = []
+        removed = []
+        for step in range(2000):
+            op = rng.random()
+            if op < 0.25:
+                order.insert(0, lst.insert_at_start(step))
+            elif op < 0.5:
+                order.append(lst.insert_at_end(step))
+            elif order and op < 0.65:
+                handle = order.pop(rng.randrange(len(order)))
+                self.assertEqual(lst.remove(handle), handle.data)
+                removed.append(handle)
+            elif order and op < 0.8:
+                handle = order.pop(rng.randrange(len(order)))
+                lst.move_to_front(handle)
+                order.insert(0, handle)
+            elif order and op < 0.9:
+                removed.append(order[0])
+                self.assertEqual(lst.delete_from_start(), order.pop(0).data)
+            elif order:
+                removed.append(order[-1])
+                self.assertEqual(lst.pop_back(), order.pop().data)
+            if removed and rng.random() < 0.2:
+                # Удалённый дескриптор отклоняется, список не меняется
+                handle = rng.choice(removed)
+                with self.assertRaises(ValueError):
+                    lst.move_to_front(handle)
+                with self.assertRaises(ValueError):
+                    lst.remove(handle)
+            self.assertEqual(len(lst), len(order))
+        self.assertEqual(lst.traversal(), [handle.data for handle in order])
+
+class LRUCacheTests(unittest.TestCase):
+    def test_matches_ordered_dict(self):
+        # Эталон — OrderedDict, в конце — недавно использованные ключи
+        rng = random.Random(18)
+        for capacity in (1, 2, 5):
+            evicted = []
+            cache = LRUCache(capacity, on_evict=lambda key, value: evicted.append((key, value)))
+            reference = collections.OrderedDict()
+            expected_evicted = []
+            for step in range(1000):
+                key = rng.randrange(8)
+                op = rng.random()
+                if op < 0.4:
+                    cache.put(key, step)
+                    reference[key] = step
+                    reference.move_to_end(key)
+                    if len(reference) > capacity:
+                        expected_evicted.append(reference.popitem(last=False))
+                elif op < 0.85:
+                    self.assertEqual(cache.get(key), reference.get(key))
+                    if key in reference:
+                        reference.move_to_end(key)
+                else:
+                    self.assertEqual(cache.pop(key, -1), reference.pop(key, -1))
+                self.assertEqual(cache.keys(), list(reversed(reference)))
+            self.assertEqual(evicted, expected_evicted)
+            stats = cache.stats()
+            self.assertEqual((stats['evictions'], stats['size']), (len(expected_evicted), len(reference)))
+
+    def test_get_or_compute_and_stats(self):
+        calls = []
+        cache = LRUCache(2)
+
+        def compute(key):
+            calls.append(key)
+            return key * key
+
+        self.assertEqual([cache.get_or_compute(k, compute) for k in (3, 3, 4, 5, 3)], [9, 9, 16, 25, 9])
+        self.assertEqual(calls, [3, 4, 5, 3])
+        self.assertEqual(cache.stats(), {'hits': 1, 'misses': 4, 'evictions': 2, 'size': 2, 'hit_rate': 0.2})
+        self.assertTrue(3 in cache and 4 not in cache)
+        self.assertEqual(LRUCache(1).stats()['hit_rate'], 0.0)
+        with self.assertRaises(ValueError):
+            LRUCache(0)
+
+if __name__ == '__main__':
+    unittest.main()
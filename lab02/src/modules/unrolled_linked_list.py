@@ -0,0 +1,126 @@
+class Chunk:
+    __slots__ = ('items', 'start', 'end', 'next')
+
+    def __init__(self, capacity):
+        self.items = [None] * capacity
+        self.start = 0
+        self.end = 0
+        self.next = None
+    # Занятые ячейки — items[start:end]; свободное место есть с обеих сторон,
+    # поэтому вставка в начало и в конец не сдвигает элементы
+
+class UnrolledLinkedList:
+    """
+    Развёрнутый связный список: каждый узел хранит массив до capacity
+    элементов. Накладные расходы на узел делятся на capacity элементов,
+    а обход идёт по соседним ячейкам массива вместо перехода по указателю
+    на каждом шаге.
+    """
+
+    def __init__(self, capacity=64, iterable=None):
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self.capacity = capacity
+        self.head = None
+        self.tail = None
+        self.size = 0
+        if iterable is not None:
+            self.extend(iterable)
+
+    def __len__(self):
+        return self.size
+        # Временная сложность: O(1)
+
+    def __iter__(self):
+        chunk = self.head
+        while chunk:
+            yield from chunk.items[chunk.start:chunk.end]
+            chunk = chunk.next
+        # Временная сложность: O(n) — по одному переходу на capacity элементов
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("UnrolledLinkedList index out of range")
+        chunk = self.head
+        while True:
+            count = chunk.end - chunk.start
+            if index < count:
+                return chunk.items[chunk.start + index]
+            index -= count
+            chunk = chunk.next
+        # Временная сложность: O(n / B) — пропускаются целые узлы
+
+    def insert_at_start(self, data):
+        head = self.head
+        if head is None or head.start == 0:
+            # Новый узел заполняется с конца, чтобы следующие вставки
+            # в начало тоже попадали в него
+            head = Chunk(self.capacity)
+            head.start = head.end = self.capacity
+            head.next = self.head
+            self.head = head
+            if self.tail is None:
+                self.tail = head
+        head.start -= 1
+        head.items[head.start] = data
+        self.size += 1
+        # Временная сложность: O(1)
+
+    def insert_at_end(self, data):
+        tail = self.tail
+        if tail is None or tail.end == self.capacity:
+            tail = self._append_chunk()
+        tail.items[tail.end] = data
+        tail.end += 1
+        self.size += 1
+        # Временная сложность: O(1)
+
+    def _append_chunk(self):
+        chunk = Chunk(self.capacity)
+        if self.tail is None:
+            self.head = chunk
+        else:
+            self.tail.next = chunk
+        self.tail = chunk
+        return chunk
+
+    def extend(self, iterable):
+        # Элементы копируются в узлы срезами, без вставки по одному
+        items = list(iterable)
+        pos = 0
+        total = len(items)
+        while pos < total:
+            tail = self.tail
+            if tail is None or tail.end == self.capacity:
+                tail = self._append_chunk()
+            count = min(self.capacity - tail.end, total - pos)
+            tail.items[tail.end:tail.end + count] = items[pos:pos + count]
+            tail.end += count
+            pos += count
+        self.size += total
+        # Временная сложность: O(k) для k новых элементов, O(k / B) операций Python
+
+    def delete_from_start(self):
+        head = self.head
+        if head is None:
+            return None
+        data = head.items[head.start]
+        head.items[head.start] = None
+        head.start += 1
+        self.size -= 1
+        if head.start == head.end:
+            self.head = head.next
+            if self.head is None:
+                self.tail = None
+        return data
+        # Временная сложность: O(1)
+
+    def traversal(self):
+        return list(self)
+        # Временная сложность: O(n)
+
+    def is_empty(self):
+        return self.head is None
+        # Временная сложность: O(1)
@@ -1,12 +1,13 @@
 import os
 import csv
+import argparse
 import matplotlib
 matplotlib.use('Agg')
 
 import matplotlib.pyplot as plt
 from timeit import default_timer as timer
 
-from modules import recursion, memoization, recursion_tasks
+from modules import recursion, memoization, recursion_tasks, persistent_memo
 
 REPORT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "report")
 REPORT_DIR = os.path.normpath(REPORT_DIR)
@@ -30,12 +31,57 @@ def experiment_fibonacci(n_values):
         times_memo.append((val_mem, t1 - t0))
     return times_naive, times_memo
 
-def run_full_experiments():
+def run_full_experiments(large=False):
     print("Сравнение для n=35 (наивная и мемоизированная)")
     cmp35 = memoization.compare_naive_and_memo(35)
     print("n =", cmp35['n'])
     print("Наивная: value={}, time={:.3f}s, calls={}".format(cmp35['naive']['value'], cmp35['naive']['time'], cmp35['naive']['calls']))
     print("Мемоизация: value={}, time={:.6f}s, calls={}".format(cmp35['memo']['value'], cmp35['memo']['time'], cmp35['memo']['calls']))
+    stats = cmp35['memo']['stats']
+    print("Кэш: hits={}, misses={}, evictions={}, bytes={}, hit latency={:.2e}s".format(
+        stats['hits'], stats['misses'], stats['evictions'], stats['bytes'], stats['mean_hit_latency']))
+
+    print("\nПолитики вытеснения @memoize (обращения с распределением Ципфа)")
+    for name, info in memoization.benchmark_memo_policies().items():
+        latency = info.get('mean_hit_latency')
+        print("{}: hit rate={:.3f}, size={}, bytes={}, evictions={}, hit latency={}, time={:.3f}s".format(
+            name, info['hit_rate'], info['size'], info.get('bytes', '-'), info.get('evictions', '-'),
+            f"{latency:.2e}s" if latency is not None else '-', info['time']))
+
+    print("\nБыстрое удвоение F(n) против наивной и мемоизированной рекурсии")
+    fib_bench = recursion.benchmark_fibonacci_methods()
+    for row in fib_bench['rows']:
+        print("n={}: ".format(row['n']) + ", ".join(
+            f"{method}={row[method]:.2e}s" for method in ('naive', 'memo', 'fast_doubling') if method in row))
+    print("Быстрое удвоение быстрее начиная с n={} (наивная) и n={} (мемоизация)".format(
+        fib_bench['crossover']['naive'], fib_bench['crossover']['memo']))
+    batch = fib_bench['mod_batch']
+    print("F(n) mod m для {} значений n < 10^18: NumPy {:.3f}s, цикл {:.3f}s".format(
+        batch['size'], batch['batch_time'], batch['loop_time']))
+    fast_path = os.path.join(REPORT_DIR, "fib_fast_doubling.png")
+    plt.figure(figsize=(10,6))
+    for method, label in (('naive', 'naive'), ('memo', 'memoized (cold)'), ('fast_doubling', 'fast doubling')):
+        points = [(row['n'], row[method]) for row in fib_bench['rows'] if method in row]
+        plt.plot([n for n, _ in points], [t for _, t in points], marker='o', label=label)
+    plt.xscale('log')
+    plt.yscale('log')
+    plt.xlabel('n (log scale)')
+    plt.ylabel('time per call (s, log scale)')
+    plt.title('Fibonacci: fast doubling crossover')
+    plt.legend()
+    plt.grid(True)
+    plt.tight_layout()
+    plt.savefig(fast_path)
+    plt.close()
+    print("График сохранён в", fast_path)
+
+    print("\nПостоянный кэш @memoize (sqlite, WAL)")
+    persistent = persistent_memo.benchmark_persistent_memo()
+    print("Холодный запуск: {} вычислений, time={:.3f}s".format(persistent['cold']['computed'], persistent['cold']['time']))
+    print("Повторный запуск: {} из базы, time={:.3f}s".format(persistent['warm']['backend_hits'], persistent['warm']['time']))
+    shared = persistent['processes']
+    print("{} процессов: {} чтений из базы, time={:.3f}s, {:.0f} чтений/с".format(
+        shared['workers'], shared['backend_hits'], shared['time'], shared['reads_per_second']))
 
     ns = list(range(0, 36))
     times_naive = []
@@ -82,12 +128,22 @@ def run_full_experiments():
     # Пример рекурсивного обхода файловой системы
     start_path = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
     print("Рекурсивный обход (корневая директория):", start_path)
-    lines, max_depth = recursion_tasks.walk_dir_recursive(start_path)
     tree_path = os.path.join(REPORT_DIR, "tree.txt")
     with open(tree_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+        # Строки записываются по мере обхода, без списка в памяти
+        max_depth = recursion_tasks.stream_dir_tree(start_path, lambda line: f.write(line + "\n"))
     print(f"Дерево каталогов сохранено в {tree_path}. Максимальная глубина: {max_depth}")
 
+    walk_files = 10 ** 6 if large else 10 ** 4
+    print(f"\nОбход синтетического дерева из {walk_files} файлов")
+    walk_bench = recursion_tasks.benchmark_dir_walkers(walk_files)
+    print("Создание дерева: {:.1f}s".format(walk_bench.pop('create_time')))
+    walk_bench.pop('files')
+    for name, info in walk_bench.items():
+        print("{}: time={:.3f}s, lines={}, depth={}{}".format(
+            name, info['time'], info['lines'], info['depth'],
+            "" if info.get('same_output', True) else " (вывод отличается!)"))
+
     # Пример решения задачи Ханойских башен для n=4
     n_hanoi = 4
     moves = recursion_tasks.hanoi_moves(n_hanoi, 'A', 'C', 'B')
@@ -98,4 +154,7 @@ def run_full_experiments():
     print(f"Ханой ({n_hanoi}): {len(moves)} ходов. Последовательность сохранена в {moves_path}")
 
 if __name__ == "__main__":
-    run_full_experiments()
\ No newline at end of file
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--large', action='store_true',
+                        help="обход синтетического дерева из 10^6 файлов вместо 10^4")
+    run_full_experiments(large=parser.parse_args().large)
\ No newline at end of file
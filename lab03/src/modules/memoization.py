@@ -1,4 +1,9 @@
-from functools import lru_cache
+from collections import OrderedDict, defaultdict
+from functools import lru_cache, wraps
+from time import perf_counter
+import random
+import sys
+import threading
 import timeit
 
 _naive_call_count = 0
@@ -19,30 +24,223 @@ def reset_naive_counter():
 def get_naive_count() -> int:
     return _naive_call_count
 
-def make_memoized_fib():
-    calls = {'count': 0}
-    cache = {}
+_KWARGS_MARK = object()
 
+def default_key(*args, **kwargs):
+    # Ключ по аргументам вызова (аргументы должны быть хешируемыми)
+    if not kwargs:
+        return args
+    return args + (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+
+def freeze(value):
+    # Хешируемая копия списков, словарей и множеств (рекурсивно)
+    if isinstance(value, dict):
+        return ('dict', tuple(sorted((k, freeze(v)) for k, v in value.items())))
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, tuple(freeze(v) for v in value))
+    if isinstance(value, (set, frozenset)):
+        return ('set', frozenset(freeze(v) for v in value))
+    return value
+
+def frozen_key(*args, **kwargs):
+    # Функция ключа для изменяемых (нехешируемых) аргументов
+    return default_key(*(freeze(a) for a in args), **{k: freeze(v) for k, v in kwargs.items()})
+
+class _LRUStore:
+    # Порядок OrderedDict — от давно использованных к недавно использованным
+    def __init__(self):
+        self.entries = OrderedDict()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+        return entry
+
+    def put(self, key, value, size):
+        self.entries[key] = (value, size)
+
+    def pop_victim(self):
+        key, (_, size) = self.entries.popitem(last=False)
+        return key, size
+
+    def clear(self):
+        self.entries.clear()
+
+class _LFUStore:
+    # Корзины по частоте обращений; внутри корзины — порядок LRU.
+    # Все операции O(1), кроме поиска новой минимальной частоты при вытеснении
+    def __init__(self):
+        self.entries = {}
+        self.buckets = defaultdict(OrderedDict)
+        self.min_freq = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        freq = entry[2]
+        bucket = self.buckets[freq]
+        del bucket[key]
+        if not bucket:
+            del self.buckets[freq]
+            if self.min_freq == freq:
+                self.min_freq = freq + 1
+        entry[2] = freq + 1
+        self.buckets[freq + 1][key] = None
+        return entry
+
+    def put(self, key, value, size):
+        self.entries[key] = [value, size, 1]
+        self.buckets[1][key] = None
+        self.min_freq = 1
+
+    def pop_victim(self):
+        bucket = self.buckets[self.min_freq]
+        key, _ = bucket.popitem(last=False)
+        if not bucket:
+            del self.buckets[self.min_freq]
+            self.min_freq = min(self.buckets, default=0)
+        return key, self.entries.pop(key)[1]
+
+    def clear(self):
+        self.entries.clear()
+        self.buckets.clear()
+        self.min_freq = 0
+
+_MISSING = object()
+
+def memoize(maxsize=None, policy='lru', max_bytes=None, key=default_key, backend=None, namespace=None):
+    """
+    Декоратор мемоизации с ограничением размера и статистикой.
+
+    policy: 'lru' — вытесняется давно не использованный элемент,
+    'lfu' — реже всего использованный (при равенстве — давно не
+    использованный), 'size' — кэш ограничен объёмом max_bytes,
+    вытеснение в порядке LRU. maxsize ограничивает число элементов
+    (maxsize=0 — значения не сохраняются, как у functools.lru_cache),
+    max_bytes — суммарный размер ключей и значений (sys.getsizeof, без
+    вложенных объектов); оба ограничения можно задавать для любой политики.
+    key(*args, **kwargs) строит ключ кэша, например frozen_key для
+    списков и словарей в аргументах.
+
+    Кэш защищён блокировкой; сама функция вычисляется вне блокировки,
+    поэтому рекурсивные и параллельные вызовы не ждут друг друга (при
+    гонке значение может быть вычислено дважды). У обёртки есть методы
+    cache_info() и cache_clear().
+
+    backend — второй, постоянный уровень кэша с методами
+    get(namespace, key, default) и put(namespace, key, value), например
+    SqliteMemoStore из persistent_memo. При промахе в памяти значение
+    ищется в backend, вычисленные значения записываются в него. namespace
+    по умолчанию — модуль и полное имя функции. cache_clear() не удаляет
+    записи backend.
+    """
+    if policy not in ('lru', 'lfu', 'size'):
+        raise ValueError("policy must be 'lru', 'lfu' or 'size'")
+    if policy == 'size' and max_bytes is None:
+        raise ValueError("policy 'size' requires max_bytes")
+
+    def decorator(func):
+        store = _LFUStore() if policy == 'lfu' else _LRUStore()
+        store_enabled = maxsize is None or maxsize > 0
+        lock = threading.Lock()
+        stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'bytes': 0, 'hit_time': 0.0, 'backend_hits': 0}
+        backend_namespace = namespace or f'{func.__module__}.{func.__qualname__}'
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            cache_key = key(*args, **kwargs)
+            with lock:
+                entry = store.get(cache_key)
+                if entry is not None:
+                    stats['hits'] += 1
+                    stats['hit_time'] += perf_counter() - start
+                    return entry[0]
+                stats['misses'] += 1
+
+            value = _MISSING
+            if backend is not None:
+                value = backend.get(backend_namespace, cache_key, _MISSING)
+            if value is _MISSING:
+                value = func(*args, **kwargs)
+                if backend is not None:
+                    backend.put(backend_namespace, cache_key, value)
+            else:
+                with lock:
+                    stats['backend_hits'] += 1
+            size = sys.getsizeof(cache_key) + sys.getsizeof(value)
+            with lock:
+                # Элемент больше max_bytes не кэшируется (при maxsize=0 — ни один);
+                # иначе место освобождается до вставки, чтобы не вытеснить новый элемент
+                if store_enabled and cache_key not in store and (max_bytes is None or size <= max_bytes):
+                    while len(store) and (
+                            (maxsize is not None and len(store) >= maxsize)
+                            or (max_bytes is not None and stats['bytes'] + size > max_bytes)):
+                        _, evicted_size = store.pop_victim()
+                        stats['bytes'] -= evicted_size
+                        stats['evictions'] += 1
+                    store.put(cache_key, value, size)
+                    stats['bytes'] += size
+            return value
+
+        def cache_info():
+            with lock:
+                hits = stats['hits']
+                return {
+                    'policy': policy,
+                    'hits': hits,
+                    'misses': stats['misses'],
+                    'backend_hits': stats['backend_hits'],
+                    'evictions': stats['evictions'],
+                    'size': len(store),
+                    'bytes': stats['bytes'],
+                    'hit_rate': hits / (hits + stats['misses']) if hits + stats['misses'] else 0.0,
+                    'mean_hit_latency': stats['hit_time'] / hits if hits else 0.0,
+                }
+
+        def cache_clear():
+            with lock:
+                store.clear()
+                for name in stats:
+                    stats[name] = 0
+
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
+
+def make_memoized_fib(maxsize=None, policy='lru'):
+
+    @memoize(maxsize=maxsize, policy=policy)
     def fib(n: int) -> int:
-        calls['count'] += 1
-        if n in cache:
-            return cache[n]
         if n == 0:
-            cache[0] = 0
             return 0
         if n == 1:
-            cache[1] = 1
             return 1
-        val = fib(n - 1) + fib(n - 2)
-        cache[n] = val
-        return val
+        return fib(n - 1) + fib(n - 2)
 
     def get_count():
-        return calls['count']
+        # Все вызовы fib, включая ответы из кэша
+        info = fib.cache_info()
+        return info['hits'] + info['misses']
 
     def reset():
-        calls['count'] = 0
-        cache.clear()
+        fib.cache_clear()
 
     return fib, get_count, reset
 
@@ -67,5 +265,42 @@ def compare_naive_and_memo(n: int, repeat: int = 3):
     return {
         'n': n,
         'naive': {'value': res_naive, 'time': time_naive, 'calls': calls_naive},
-        'memo': {'value': res_mem, 'time': time_memo, 'calls': calls_memo},
-    }
\ No newline at end of file
+        'memo': {'value': res_mem, 'time': time_memo, 'calls': calls_memo,
+                 'stats': fib_mem.cache_info()},
+    }
+# Сравнение политик вытеснения: доля попаданий, занятая память и задержка попадания
+def benchmark_memo_policies(accesses: int = 200000, maxsize: int = 1000, max_bytes: int = 1 << 20,
+                            zipf_a: float = 1.2, seed: int = 1):
+    # Ключи с тяжёлым хвостом: распределение Ципфа с показателем a
+    # приближается дискретизацией распределения Парето с alpha = a - 1
+    rng = random.Random(seed)
+    keys = [int(rng.paretovariate(zipf_a - 1)) for _ in range(accesses)]
+
+    def payload(n: int) -> list:
+        # "Дорогая" функция со значениями разного размера
+        return list(range(n % 500))
+
+    variants = [
+        ('без ограничения', memoize()(payload)),
+        (f'lru, {maxsize} элементов', memoize(maxsize=maxsize, policy='lru')(payload)),
+        (f'lfu, {maxsize} элементов', memoize(maxsize=maxsize, policy='lfu')(payload)),
+        (f'size, {max_bytes} байт', memoize(policy='size', max_bytes=max_bytes)(payload)),
+    ]
+    results = {}
+    for name, cached in variants:
+        t0 = timeit.default_timer()
+        for key in keys:
+            cached(key)
+        elapsed = timeit.default_timer() - t0
+        results[name] = dict(cached.cache_info(), time=elapsed)
+
+    reference = lru_cache(maxsize=maxsize)(payload)
+    t0 = timeit.default_timer()
+    for key in keys:
+        reference(key)
+    info = reference.cache_info()
+    results[f'functools.lru_cache, {maxsize}'] = {
+        'hits': info.hits, 'misses': info.misses, 'size': info.currsize,
+        'hit_rate': info.hits / accesses, 'time': timeit.default_timer() - t0,
+    }
+    return results
@@ -0,0 +1,191 @@
+from concurrent.futures import ProcessPoolExecutor
+import atexit
+import os
+import pickle
+import sqlite3
+import tempfile
+import threading
+import timeit
+
+from .memoization import memoize
+
+_MISSING = object()
+
+class SqliteMemoStore:
+    """
+    Постоянное хранилище результатов мемоизации в файле sqlite.
+
+    Ключ и значение сериализуются pickle (двоичный протокол) и хранятся
+    как BLOB в таблице (namespace, key) -> value; namespace отделяет
+    функции друг от друга. База открывается в режиме WAL: читатели из
+    разных процессов не блокируются писателем и друг другом.
+
+    Новые значения копятся в буфере отложенной записи и сбрасываются одной
+    транзакцией, когда в буфере buffer_size элементов, а также при flush(),
+    close() и завершении процесса. Соединение создаётся заново после fork,
+    поэтому один объект можно передать рабочим процессам.
+
+    Ключ должен сериализоваться однозначно: равные ключи — одинаковые байты
+    (кортежи чисел и строк, frozen_key из memoization).
+    """
+
+    def __init__(self, path, buffer_size=1000, timeout=30.0):
+        self.path = path
+        self.buffer_size = buffer_size
+        self.timeout = timeout
+        self._buffer = {}
+        self._lock = threading.Lock()
+        self._connection = None
+        self._pid = None
+        with self._lock:
+            self._connect()
+        atexit.register(self.close)
+
+    def _connect(self):
+        # Вызывается под _lock
+        if self._connection is not None and self._pid == os.getpid():
+            return self._connection
+        if self._pid != os.getpid():
+            # Соединение родительского процесса после fork не используется
+            self._buffer = {}
+        self._connection = sqlite3.connect(self.path, timeout=self.timeout, check_same_thread=False,
+                                           isolation_level=None)
+        self._pid = os.getpid()
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS memo ("
+            "namespace TEXT NOT NULL, key BLOB NOT NULL, value BLOB NOT NULL, "
+            "PRIMARY KEY (namespace, key)) WITHOUT ROWID")
+        return self._connection
+
+    def __getstate__(self):
+        # При передаче в другой процесс передаются только параметры
+        return {'path': self.path, 'buffer_size': self.buffer_size, 'timeout': self.timeout}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @staticmethod
+    def _dump(obj):
+        return pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def get(self, namespace, key, default=_MISSING):
+        # Значение или default (по умолчанию — KeyError)
+        blob_key = self._dump(key)
+        with self._lock:
+            value = self._buffer.get((namespace, blob_key), _MISSING)
+            if value is not _MISSING:
+                return pickle.loads(value)
+            row = self._connect().execute(
+                "SELECT value FROM memo WHERE namespace = ? AND key = ?", (namespace, blob_key)).fetchone()
+        if row is not None:
+            return pickle.loads(row[0])
+        if default is _MISSING:
+            raise KeyError(key)
+        return default
+        # Временная сложность: O(log n) — поиск по первичному ключу
+
+    def put(self, namespace, key, value):
+        with self._lock:
+            self._buffer[(namespace, self._dump(key))] = self._dump(value)
+            if len(self._buffer) >= self.buffer_size:
+                self._flush()
+        # Временная сложность: O(1), сброс буфера — одна транзакция на buffer_size записей
+
+    def _flush(self):
+        # Вызывается под _lock
+        if not self._buffer:
+            return
+        connection = self._connect()
+        rows = [(namespace, key, value) for (namespace, key), value in self._buffer.items()]
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.executemany("INSERT OR REPLACE INTO memo (namespace, key, value) VALUES (?, ?, ?)", rows)
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        self._buffer.clear()
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def clear(self, namespace=None):
+        with self._lock:
+            connection = self._connect()
+            if namespace is None:
+                self._buffer.clear()
+                connection.execute("DELETE FROM memo")
+            else:
+                self._buffer = {k: v for k, v in self._buffer.items() if k[0] != namespace}
+                connection.execute("DELETE FROM memo WHERE namespace = ?", (namespace,))
+
+    def __len__(self):
+        self.flush()
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM memo").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            if self._connection is None or self._pid != os.getpid():
+                return
+            self._flush()
+            self._connection.close()
+            self._connection = None
+        atexit.unregister(self.close)
+
+def _heavy_work(n: int) -> int:
+    # "Дорогая" функция: около миллисекунды на вызов
+    return sum(i * i % 7 for i in range(20000 + n))
+
+def _run_workload(store, keys):
+    # Новый экземпляр @memoize — как при повторном запуске программы
+    cached = memoize(backend=store)(_heavy_work)
+    t0 = timeit.default_timer()
+    for n in keys:
+        cached(n)
+    store.flush()
+    return timeit.default_timer() - t0, cached.cache_info()
+
+def _warm_worker(path, keys):
+    with SqliteMemoStore(path) as store:
+        elapsed, info = _run_workload(store, keys)
+    return elapsed, info['backend_hits']
+
+# Постоянный кэш: холодный запуск, повторный запуск и чтение из нескольких процессов
+def benchmark_persistent_memo(keys: int = 2000, workers: int = 4, buffer_size: int = 500, path=None):
+    keys = list(range(keys))
+    with tempfile.TemporaryDirectory() as tmp:
+        path = path or os.path.join(tmp, 'memo.sqlite')
+        with SqliteMemoStore(path, buffer_size=buffer_size) as store:
+            store.clear(f'{_heavy_work.__module__}.{_heavy_work.__qualname__}')
+            cold_time, cold_info = _run_workload(store, keys)
+        with SqliteMemoStore(path, buffer_size=buffer_size) as store:
+            warm_time, warm_info = _run_workload(store, keys)
+            entries = len(store)
+
+        t0 = timeit.default_timer()
+        with ProcessPoolExecutor(workers) as pool:
+            shared = list(pool.map(_warm_worker, [path] * workers, [keys] * workers))
+        shared_time = timeit.default_timer() - t0
+
+    return {
+        'keys': len(keys),
+        'entries': entries,
+        'cold': {'time': cold_time, 'computed': cold_info['misses'] - cold_info['backend_hits']},
+        'warm': {'time': warm_time, 'backend_hits': warm_info['backend_hits']},
+        'processes': {
+            'workers': workers,
+            'time': shared_time,
+            'backend_hits': sum(hits for _, hits in shared),
+            'reads_per_second': workers * len(keys) / shared_time,
+        },
+    }
@@ -1,3 +1,9 @@
+import timeit
+
+import numpy as np
+
+from .memoization import make_memoized_fib
+
 def factorial(n: int) -> int:
     if n < 0:
         raise ValueError("n must be >= 0")
@@ -36,3 +42,120 @@ def pow_fast(a: float, n: int) -> float:
 
 # Временная сложность: O(log n) — количество умножений логарифмическое.
 # Глубина рекурсии: O(log n) — на каждом шаге показатель степени делится пополам.
+
+def _fib_pair(n: int) -> tuple:
+    # (F(n), F(n + 1)) по формулам удвоения:
+    # F(2k) = F(k) * (2F(k + 1) - F(k)), F(2k + 1) = F(k)² + F(k + 1)²
+    if n == 0:
+        return 0, 1
+    a, b = _fib_pair(n // 2)
+    c = a * (2 * b - a)
+    d = a * a + b * b
+    if n % 2 == 0:
+        return c, d
+    return d, c + d
+
+def fibonacci_fast_doubling(n: int) -> int:
+    if n < 0:
+        raise ValueError("n must be >= 0")
+    # На верхнем уровне F(n + 1) не нужен — экономится самое дорогое умножение
+    a, b = _fib_pair(n // 2)
+    if n % 2 == 0:
+        return a * (2 * b - a)
+    return a * a + b * b
+
+# Временная сложность: O(log n) умножений; с учётом длинной арифметики —
+# O(M(n)), где M(n) — время умножения n-битных чисел (последние шаги дороже всех остальных вместе).
+# Глубина рекурсии: O(log n) — на каждом шаге n делится пополам.
+
+def _fib_pair_mod(n: int, m: int) -> tuple:
+    if n == 0:
+        return 0, 1 % m
+    a, b = _fib_pair_mod(n // 2, m)
+    c = a * (2 * b - a) % m
+    d = (a * a + b * b) % m
+    if n % 2 == 0:
+        return c, d
+    return d, (c + d) % m
+
+def fibonacci_mod(n: int, m: int) -> int:
+    if n < 0:
+        raise ValueError("n must be >= 0")
+    if m < 1:
+        raise ValueError("m must be >= 1")
+    return _fib_pair_mod(n, m)[0]
+
+# Временная сложность: O(log n) операций над числами меньше m².
+# Глубина рекурсии: O(log n) — для n до 10^18 не больше 60 уровней.
+
+def fibonacci_mod_batch(ns, m: int):
+    """
+    F(n) mod m для каждого элемента массива ns (np.ndarray неотрицательных
+    целых, n < 2^63). Удвоение идёт по битам n от старшего к младшему
+    сразу для всех элементов: на шаге состояние (F(k), F(k + 1)) переходит
+    в (F(2k), F(2k + 1)) или (F(2k + 1), F(2k + 2)) в зависимости от бита.
+    При m <= 2^32 произведения помещаются в uint64; для больших m
+    используется массив Python int (dtype=object).
+    """
+    if m < 1:
+        raise ValueError("m must be >= 1")
+    ns = np.asarray(ns, dtype=np.int64)
+    if ns.size and ns.min() < 0:
+        raise ValueError("n must be >= 0")
+    dtype = np.uint64 if m <= 1 << 32 else object
+    mod = dtype(m) if dtype is np.uint64 else m
+    a = np.zeros(ns.shape, dtype=dtype)
+    b = np.full(ns.shape, 1 % m, dtype=dtype)
+    top = int(ns.max()).bit_length() if ns.size else 0
+    for bit in range(top - 1, -1, -1):
+        c = a * ((2 * b + mod - a) % mod) % mod
+        d = (a * a % mod + b * b % mod) % mod
+        odd = ((ns >> bit) & 1).astype(bool)
+        a = np.where(odd, d, c)
+        b = np.where(odd, (c + d) % mod, d)
+    return a.astype(np.int64) if dtype is np.uint64 else a
+
+# Временная сложность: O(k log max(n)) векторных операций для k значений n.
+
+def _time_per_call(func) -> float:
+    # Среднее время одного вызова (число повторов подбирает timeit)
+    number, total = timeit.Timer(func).autorange()
+    return total / number
+
+# Быстрое удвоение против наивной и мемоизированной рекурсии: время и точка пересечения
+def benchmark_fibonacci_methods(ns=(1, 2, 3, 5, 8, 12, 16, 20, 25, 30, 50, 100, 200, 400, 10 ** 3,
+                                    10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7),
+                                naive_limit: int = 30, memo_limit: int = 400,
+                                batch_size: int = 10 ** 5, seed: int = 1):
+    # Мемоизированная версия ограничена глубиной рекурсии (два кадра стека на уровень),
+    # наивная — экспоненциальным временем
+    rows = []
+    for n in ns:
+        row = {'n': n, 'fast_doubling': _time_per_call(lambda: fibonacci_fast_doubling(n))}
+        if n <= naive_limit:
+            row['naive'] = _time_per_call(lambda: fibonacci_naive(n))
+        if n <= memo_limit:
+            row['memo'] = _time_per_call(lambda: make_memoized_fib()[0](n))
+        rows.append(row)
+
+    crossover = {}
+    for method in ('naive', 'memo'):
+        # Наименьшее n, начиная с которого быстрое удвоение не медленнее
+        measured = [row for row in rows if method in row]
+        faster = [row['fast_doubling'] <= row[method] for row in measured]
+        crossover[method] = next((row['n'] for i, row in enumerate(measured) if all(faster[i:])), None)
+
+    m = 10 ** 9 + 7
+    batch = np.random.default_rng(seed).integers(0, 10 ** 18, batch_size)
+    t0 = timeit.default_timer()
+    fibonacci_mod_batch(batch, m)
+    batch_time = timeit.default_timer() - t0
+    t0 = timeit.default_timer()
+    for n in batch.tolist():
+        fibonacci_mod(n, m)
+    loop_time = timeit.default_timer() - t0
+    return {
+        'rows': rows,
+        'crossover': crossover,
+        'mod_batch': {'size': batch_size, 'batch_time': batch_time, 'loop_time': loop_time},
+    }
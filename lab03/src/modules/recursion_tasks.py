@@ -1,5 +1,8 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List, Tuple
 import os
-from typing import List, Tuple
+import tempfile
+import timeit
 
 def binary_search_recursive(arr: List[int], target: int, lo: int = 0, hi: int = None) -> int:
     if hi is None:
@@ -16,7 +19,8 @@ def binary_search_recursive(arr: List[int], target: int, lo: int = 0, hi: int =
 
 # Временная сложность: O(log n). Глубина рекурсии: O(log n).
 
-def walk_dir_recursive(path: str, prefix: str = "") -> Tuple[List[str], int]:
+def walk_dir_listdir(path: str, prefix: str = "") -> Tuple[List[str], int]:
+    # Прежняя рекурсивная версия (os.listdir + os.path.isdir для каждого элемента) — для сравнения
     lines = []
     max_depth = 0
 
@@ -35,11 +39,181 @@ def walk_dir_recursive(path: str, prefix: str = "") -> Tuple[List[str], int]:
         lines.append(f"{prefix}{connector}{name}")
         if os.path.isdir(full):
             ext_prefix = prefix + ("    " if i == len(entries) - 1 else "│   ")
-            sub_lines, sub_depth = walk_dir_recursive(full, ext_prefix)
+            sub_lines, sub_depth = walk_dir_listdir(full, ext_prefix)
             lines.extend(sub_lines)
             max_depth = max(max_depth, 1 + sub_depth)
     return lines, max_depth
 
+# Временная сложность: O(N log k) для N элементов (k — размер каталога), плюс stat на каждый элемент.
+# Глубина рекурсии: глубина дерева каталогов.
+
+def _is_dir(entry: os.DirEntry) -> bool:
+    # Тип берётся из d_type без stat. Символические ссылки не разыменовываются:
+    # ссылка на каталог выводится как лист, поэтому циклы ссылок не дают
+    # бесконечного обхода
+    try:
+        return entry.is_dir(follow_symlinks=False)
+    except OSError:
+        return False
+
+def _scan_dir(path: str):
+    # Отсортированный список (имя, каталог ли) или (None, текст ошибки).
+    # Прочие ошибки ОС (ELOOP, ENAMETOOLONG и т. п.) — по имени типа исключения
+    try:
+        with os.scandir(path) as it:
+            entries = [(entry.name, _is_dir(entry)) for entry in it]
+    except PermissionError:
+        return None, "PermissionError"
+    except FileNotFoundError:
+        return None, "NotFound"
+    except OSError as exc:
+        return None, type(exc).__name__
+    entries.sort(key=lambda item: item[0])
+    return entries, None
+
+def iter_dir_tree(path: str, prefix: str = "", workers: int = 8, prefetch: int = None) -> Iterator[str]:
+    """
+    Строки дерева каталогов в том же формате, что у walk_dir_listdir, по одной.
+    Максимальная глубина — значение return генератора (StopIteration.value).
+
+    Обход в глубину без рекурсии: стек кадров (каталог, элементы, позиция,
+    префикс, заранее читаемые подкаталоги). Каталоги читаются os.scandir,
+    тип элемента берётся из DirEntry без отдельного stat; символические
+    ссылки на каталоги не раскрываются. Следующие prefetch
+    (по умолчанию 2 * workers) подкаталогов каждого открытого каталога
+    читаются заранее в пуле из workers потоков (scandir и stat отпускают
+    GIL), поэтому к моменту вывода подкаталога его содержимое обычно уже
+    прочитано; строки при этом выводятся строго по порядку. workers=0 —
+    чтение в текущем потоке без упреждения.
+
+    Память: списки каталогов вдоль текущего пути и не больше prefetch
+    прочитанных заранее списков на каждый из них, то есть
+    O(глубина * (prefetch + 1) * размер каталога), а не всё дерево.
+    """
+    pool = ThreadPoolExecutor(workers) if workers else None
+    if prefetch is None:
+        prefetch = 2 * workers
+
+    def make_frame(directory, entries, frame_prefix):
+        subdirs = [name for name, is_dir in entries if is_dir] if pool is not None else []
+        frame = [directory, entries, 0, frame_prefix, {}, subdirs, 0]
+        schedule(frame)
+        return frame
+
+    def schedule(frame):
+        # Чтение следующих подкаталогов заранее, пока в окне меньше prefetch: имя -> Future
+        directory, pending, subdirs, next_sub = frame[0], frame[4], frame[5], frame[6]
+        while next_sub < len(subdirs) and len(pending) < prefetch:
+            name = subdirs[next_sub]
+            pending[name] = pool.submit(_scan_dir, os.path.join(directory, name))
+            next_sub += 1
+        frame[6] = next_sub
+
+    try:
+        entries, error = _scan_dir(path)
+        if error:
+            yield f"{prefix}[{error}]: {path}"
+            return 0
+        max_depth = 0
+        stack = [make_frame(path, entries, prefix)]
+        while stack:
+            frame = stack[-1]
+            directory, entries, index, frame_prefix, pending = frame[:5]
+            if index == len(entries):
+                stack.pop()
+                continue
+            frame[2] = index + 1
+            name, is_dir = entries[index]
+            last = index == len(entries) - 1
+            yield f"{frame_prefix}{'└── ' if last else '├── '}{name}"
+            if not is_dir:
+                continue
+            max_depth = max(max_depth, len(stack))
+            full = os.path.join(directory, name)
+            child_prefix = frame_prefix + ("    " if last else "│   ")
+            future = pending.pop(name, None)
+            if future is not None:
+                schedule(frame)
+                sub_entries, error = future.result()
+            else:
+                sub_entries, error = _scan_dir(full)
+            if error:
+                yield f"{child_prefix}[{error}]: {full}"
+                continue
+            stack.append(make_frame(full, sub_entries, child_prefix))
+        return max_depth
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+# Временная сложность: O(N log k) для N элементов без stat на элемент.
+# Глубина рекурсии: O(1) — стек обхода хранится явно.
+
+def stream_dir_tree(path: str, write: Callable[[str], object], prefix: str = "", workers: int = 8,
+                    prefetch: int = None) -> int:
+    # Передаёт строки iter_dir_tree в write по мере обхода и возвращает максимальную глубину
+    walker = iter_dir_tree(path, prefix, workers, prefetch)
+    while True:
+        try:
+            write(next(walker))
+        except StopIteration as stop:
+            return stop.value
+
+def walk_dir_recursive(path: str, prefix: str = "", workers: int = 8) -> Tuple[List[str], int]:
+    # Прежний интерфейс: все строки списком и максимальная глубина
+    lines = []
+    max_depth = stream_dir_tree(path, lines.append, prefix, workers)
+    return lines, max_depth
+
+def make_synthetic_tree(root: str, files: int = 10 ** 6, files_per_dir: int = 1000, fanout: int = 10) -> int:
+    # Дерево с files пустыми файлами: по files_per_dir файлов в листовых каталогах,
+    # у промежуточных каталогов по fanout подкаталогов. Возвращает число каталогов
+    leaves = -(-files // files_per_dir)
+    levels = 1
+    while fanout ** levels < leaves:
+        levels += 1
+    created = 0
+    for leaf in range(leaves):
+        digits = []
+        for _ in range(levels):
+            leaf, digit = divmod(leaf, fanout)
+            digits.append(f"d{digit}")
+        directory = os.path.join(root, *reversed(digits))
+        os.makedirs(directory, exist_ok=True)
+        count = min(files_per_dir, files - created)
+        for i in range(count):
+            os.close(os.open(os.path.join(directory, f"f{i}.txt"), os.O_CREAT | os.O_WRONLY, 0o644))
+        created += count
+    return leaves
+
+# Обход синтетического дерева: прежняя рекурсивная версия и iter_dir_tree с разным числом потоков
+def benchmark_dir_walkers(files: int = 10 ** 6, worker_counts=(0, 4, 16), root: str = None):
+    with tempfile.TemporaryDirectory(dir=root) as tmp:
+        t0 = timeit.default_timer()
+        make_synthetic_tree(tmp, files)
+        results = {'files': files, 'create_time': timeit.default_timer() - t0}
+
+        t0 = timeit.default_timer()
+        reference, reference_depth = walk_dir_listdir(tmp)
+        results['listdir'] = {'time': timeit.default_timer() - t0, 'lines': len(reference), 'depth': reference_depth}
+        for workers in worker_counts:
+            t0 = timeit.default_timer()
+            count = 0
+            mismatches = 0
+
+            def check(line):
+                nonlocal count, mismatches
+                if count >= len(reference) or line != reference[count]:
+                    mismatches += 1
+                count += 1
+
+            depth = stream_dir_tree(tmp, check, workers=workers)
+            results[f'scandir, {workers} потоков'] = {
+                'time': timeit.default_timer() - t0, 'lines': count, 'depth': depth,
+                'same_output': not mismatches and count == len(reference) and depth == reference_depth,
+            }
+    return results
+
 def hanoi_moves(n: int, src: str, dst: str, aux: str, moves: List[Tuple[str,str]] = None) -> List[Tuple[str,str]]:
     if moves is None:
         moves = []
@@ -0,0 +1,48 @@
+import os
+import tempfile
+import unittest
+from modules.memoization import memoize
+from modules.recursion_tasks import walk_dir_recursive
+
+class MemoizeTests(unittest.TestCase):
+    def test_maxsize_zero_stores_nothing(self):
+        # maxsize=0: каждый вызов — промах, кэш остаётся пустым
+        calls = []
+
+        @memoize(maxsize=0)
+        def square(x):
+            calls.append(x)
+            return x * x
+
+        self.assertEqual([square(3), square(3), square(4)], [9, 9, 16])
+        self.assertEqual(calls, [3, 3, 4])
+        info = square.cache_info()
+        self.assertEqual((info['hits'], info['misses'], info['size'], info['evictions']), (0, 3, 0, 0))
+
+    def test_lru_eviction(self):
+        # Проверка вытеснения давно не использованного элемента
+        @memoize(maxsize=2)
+        def double(x):
+            return 2 * x
+
+        for x in (1, 2, 1, 3, 1):
+            double(x)
+        info = double.cache_info()
+        self.assertEqual((info['hits'], info['misses'], info['size'], info['evictions']), (2, 3, 2, 1))
+
+class DirTreeTests(unittest.TestCase):
+    def test_symlink_cycle(self):
+        # Ссылка на родительский каталог выводится листом, а не обходится по кругу;
+        # ошибка ELOOP выводится строкой ошибки в том же формате
+        with tempfile.TemporaryDirectory() as root:
+            os.mkdir(os.path.join(root, 'a'))
+            os.symlink(root, os.path.join(root, 'a', 'up'))
+            os.symlink('loop', os.path.join(root, 'loop'))
+            for workers in (0, 4):
+                self.assertEqual(walk_dir_recursive(root, workers=workers),
+                                 (['├── a', '│   └── up', '└── loop'], 1))
+            loop = os.path.join(root, 'loop')
+            self.assertEqual(walk_dir_recursive(loop), ([f'[OSError]: {loop}'], 0))
+
+if __name__ == '__main__':
+    unittest.main()